@@ -14,5 +14,7 @@ sys.path.insert(0, str(project_root / "src"))
 
 if __name__ == "__main__":
     from src.cli.multichain_cli import main
+    from src.core.event_loop import install_uvloop
     import asyncio
+    install_uvloop()
     sys.exit(asyncio.run(main()))
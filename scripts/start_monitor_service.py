@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from processors.monitoring_service import main
+from core.event_loop import install_uvloop
 
 if __name__ == "__main__":
     print("🚀 Starting GLQ Chain Monitoring Service...")
@@ -23,6 +24,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     try:
+        install_uvloop()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 Service stopped by user")
@@ -14,6 +14,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.blockchain_client import full_transactions
 from analytics.token_analytics import TokenAnalytics, TokenTransfer
 from analytics.dex_analytics import DEXAnalytics, SwapEvent, LiquidityEvent
 from analytics.defi_analytics import DeFiAnalytics, LendingEvent, StakingEvent, YieldEvent
@@ -157,8 +158,16 @@ class AdvancedAnalytics:
         self.stats['transactions_analyzed'] += 1
         return analysis_results
         
-    async def analyze_block(self, block_data: Dict[str, Any], block_timestamp: datetime) -> Dict[str, Any]:
-        """Analyze all transactions in a block."""
+    async def analyze_block(self, block_data: Dict[str, Any], block_timestamp: datetime,
+                            receipts: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Analyze all transactions in a block.
+        
+        receipts maps transaction hash to receipt when the caller already fetched
+        them; transactions without one (with logs) fetch their receipt here.
+        """
+        if receipts is None:
+            receipts = {}
+            
         block_results = {
             'block_number': int(block_data.get('number', '0x0'), 16),
             'transactions_processed': 0,
@@ -171,30 +180,31 @@ class AdvancedAnalytics:
             'yield_events': 0,
         }
         
-        if 'transactions' not in block_data:
-            return block_results
-            
-        for tx in block_data['transactions']:
-            if isinstance(tx, dict):
-                try:
-                    # Get transaction receipt for logs
-                    receipt = await self.blockchain_client.get_transaction_receipt(tx['hash'])
-                    if receipt:
-                        tx_results = await self.analyze_transaction(tx, receipt, block_timestamp)
-                        
-                        # Aggregate results
-                        block_results['token_transfers'] += len(tx_results['token_transfers'])
-                        block_results['dex_swaps'] += len(tx_results['dex_swaps'])
-                        block_results['liquidity_events'] += len(tx_results['liquidity_events'])
-                        block_results['lending_events'] += len(tx_results['lending_events'])
-                        block_results['staking_events'] += len(tx_results['staking_events'])
-                        block_results['yield_events'] += len(tx_results['yield_events'])
-                        block_results['total_events_found'] += tx_results['total_events']
-                        
-                    block_results['transactions_processed'] += 1
+        # Hash-only blocks have nothing to analyze; the format is checked once per block
+        analyze_transaction = self.analyze_transaction
+        get_transaction_receipt = self.blockchain_client.get_transaction_receipt
+        for tx in full_transactions(block_data):
+            try:
+                # Get transaction receipt for logs (unless prefetched)
+                receipt = receipts.get(tx['hash'])
+                if receipt is None or 'logs' not in receipt:
+                    receipt = await get_transaction_receipt(tx['hash'])
+                if receipt:
+                    tx_results = await analyze_transaction(tx, receipt, block_timestamp)
+                    
+                    # Aggregate results
+                    block_results['token_transfers'] += len(tx_results['token_transfers'])
+                    block_results['dex_swaps'] += len(tx_results['dex_swaps'])
+                    block_results['liquidity_events'] += len(tx_results['liquidity_events'])
+                    block_results['lending_events'] += len(tx_results['lending_events'])
+                    block_results['staking_events'] += len(tx_results['staking_events'])
+                    block_results['yield_events'] += len(tx_results['yield_events'])
+                    block_results['total_events_found'] += tx_results['total_events']
                     
-                except Exception as e:
-                    logger.error(f"Error analyzing transaction {tx.get('hash', 'unknown')}: {e}")
+                block_results['transactions_processed'] += 1
+                
+            except Exception as e:
+                logger.error(f"Error analyzing transaction {tx.get('hash', 'unknown')}: {e}")
                     
         self.stats['blocks_processed'] += 1
         
@@ -298,9 +308,9 @@ def add_analytics_to_processor(processor_class):
             config
         )
         
-    async def new_process_single_block(self, block_data, block_number):
+    async def new_process_single_block(self, block_data, block_number, *args, **kwargs):
         # Call original processing
-        result = await original_process_single_block(self, block_data, block_number)
+        result = await original_process_single_block(self, block_data, block_number, *args, **kwargs)
         
         # Add advanced analytics
         if hasattr(self, 'advanced_analytics'):
@@ -57,6 +57,13 @@ class TokenAnalytics:
     ERC1155_TRANSFER_SINGLE_SIGNATURE = "0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62"
     ERC1155_TRANSFER_BATCH_SIGNATURE = "0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb"
     
+    # All transfer signatures, so unrelated logs are skipped with one hash lookup
+    TRANSFER_SIGNATURES = frozenset({
+        ERC20_TRANSFER_SIGNATURE,
+        ERC1155_TRANSFER_SINGLE_SIGNATURE,
+        ERC1155_TRANSFER_BATCH_SIGNATURE,
+    })
+    
     def __init__(self, blockchain_client, db_client, config):
         self.blockchain_client = blockchain_client
         self.db_client = db_client
@@ -71,6 +78,7 @@ class TokenAnalytics:
         if not receipt or 'logs' not in receipt:
             return transfers
             
+        transfer_signatures = self.TRANSFER_SIGNATURES
         for log in receipt['logs']:
             try:
                 if not log.get('topics'):
@@ -78,6 +86,10 @@ class TokenAnalytics:
                     
                 topic0 = log['topics'][0] if isinstance(log['topics'][0], str) else log['topics'][0].hex()
                 
+                # Most logs (approvals, swaps, syncs) are not transfers
+                if topic0 not in transfer_signatures:
+                    continue
+                    
                 if topic0 == self.ERC20_TRANSFER_SIGNATURE:
                     # Could be ERC20 or ERC721
                     transfer = await self._parse_erc20_721_transfer(log, tx_data, block_timestamp)
@@ -27,6 +27,7 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
 from core.config import Config
+from core.event_loop import install_uvloop
 from core.multichain_client import MultiChainClient
 from core.multichain_influxdb_client import MultiChainInfluxDB
 from processors.multichain_processor import MultiChainProcessor
@@ -709,4 +710,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Batching InfluxDB Writer
+
+Buffers line-protocol records in memory and writes them from a background
+thread in large requests, flushing when a batch reaches its record or byte
+limit or when its oldest record has waited for the flush interval. Callers
+only pay for formatting the record; the HTTP round trip is amortized over
+thousands of records. Each batch is sent as one request per measurement, so
+a request touches the series of a single measurement instead of interleaving
+blocks, transactions and events.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, List
+
+from influxdb_client import WritePrecision
+from influxdb_client.client.exceptions import InfluxDBError
+from urllib3.exceptions import HTTPError
+
+logger = logging.getLogger(__name__)
+
+# Transport failures the writer logs instead of raising
+_WRITE_ERRORS = (InfluxDBError, HTTPError, OSError)
+
+# Marks the end of the write queue
+_WRITE_QUEUE_SENTINEL = object()
+
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_BATCH_BYTES = 10 * 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_QUEUE_SIZE = 50000
+DEFAULT_QUEUE_TIMEOUT = 5.0
+
+
+def _measurement(line: str) -> str:
+    """Return the measurement name of a line-protocol record."""
+    # Measurement names written by this project never contain escaped separators
+    end = line.find(' ')
+    comma = line.find(',', 0, end)
+    return line[:comma if comma >= 0 else end]
+
+
+class BatchingInfluxWriter:
+    """Background writer that groups queued line-protocol records into batched writes."""
+
+    def __init__(self, write_api: Any, bucket: str, org: str,
+                 max_batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_batch_bytes: int = DEFAULT_BATCH_BYTES,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+                 write_precision: str = WritePrecision.NS):
+        self.write_api = write_api
+        self.bucket = bucket
+        self.org = org
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.flush_interval = flush_interval
+        self.write_precision = write_precision
+
+        # A full queue applies backpressure to callers for up to queue_timeout seconds
+        self._queue_timeout = queue_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+        # Records that never reached InfluxDB: dropped on a full queue (counted by
+        # callers) or lost in a failed write (counted by the worker)
+        self.dropped_records = 0
+        self.failed_records = 0
+
+        self._thread = threading.Thread(target=self._worker, name="influxdb-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, config: Any, write_api: Any, bucket: str, org: str, **kwargs) -> "BatchingInfluxWriter":
+        """Create a writer using the influxdb.write_* settings of a Config."""
+        return cls(
+            write_api, bucket, org,
+            max_batch_size=config.get('influxdb.write_batch_size', DEFAULT_BATCH_SIZE),
+            max_batch_bytes=config.get('influxdb.write_batch_bytes', DEFAULT_BATCH_BYTES),
+            flush_interval=config.get('influxdb.write_flush_interval', DEFAULT_FLUSH_INTERVAL),
+            queue_size=config.get('influxdb.write_queue_size', DEFAULT_QUEUE_SIZE),
+            queue_timeout=config.get('influxdb.write_queue_timeout', DEFAULT_QUEUE_TIMEOUT),
+            **kwargs
+        )
+
+    def write_lines(self, lines: List[str], description: str):
+        """Queue line-protocol records, blocking while the queue is full."""
+        for index, line in enumerate(lines):
+            try:
+                self._queue.put_nowait(line)
+            except queue.Full:
+                try:
+                    self._queue.put(line, timeout=self._queue_timeout)
+                except queue.Full:
+                    self.dropped_records += len(lines) - index
+                    logger.error(f"Write queue full, dropped {len(lines) - index} records of {description}")
+                    return
+
+    def _worker(self):
+        """Collect queued records into batches and write them until the sentinel is received."""
+        running = True
+        while running:
+            batch = defaultdict(list)
+            batch_size = 0
+            batch_bytes = 0
+            line = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+
+            while line is not _WRITE_QUEUE_SENTINEL:
+                batch[_measurement(line)].append(line)
+                batch_size += 1
+                batch_bytes += len(line)
+                if batch_size >= self.max_batch_size or batch_bytes >= self.max_batch_bytes:
+                    break
+                try:
+                    line = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            else:
+                running = False
+
+            # Any failure only loses this batch: the thread keeps running and the
+            # records are always marked done, so flush() cannot block forever
+            try:
+                for measurement, records in batch.items():
+                    try:
+                        self.write_api.write(bucket=self.bucket, org=self.org, record=records,
+                                             write_precision=self.write_precision)
+                    except _WRITE_ERRORS as e:
+                        self.failed_records += len(records)
+                        logger.error(f"Error writing batch of {len(records)} queued {measurement} records: {e}")
+                    except Exception:
+                        self.failed_records += len(records)
+                        logger.exception(f"Unexpected error writing batch of {len(records)} queued {measurement} records")
+            finally:
+                for _ in range(batch_size + (0 if running else 1)):
+                    self._queue.task_done()
+
+    @property
+    def lost_records(self) -> int:
+        """Number of records dropped or not written since the writer was created."""
+        return self.dropped_records + self.failed_records
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write any queued records and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(_WRITE_QUEUE_SENTINEL)
+            self._thread.join()
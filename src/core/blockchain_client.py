@@ -4,13 +4,13 @@ Handles all blockchain interactions with robust error handling and connection po
 """
 
 import asyncio
-import json
 import logging
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Tuple
 from datetime import datetime
 import time
 
 import aiohttp
+import orjson
 from web3 import Web3
 try:
     from web3.middleware import geth_poa_middleware
@@ -23,6 +23,31 @@ from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Requests per JSON-RPC batch (most providers cap batches at 500-1000 calls)
+DEFAULT_RPC_BATCH_SIZE = 500
+
+# JSON-RPC error code of a method the node does not implement
+JSONRPC_METHOD_NOT_FOUND = -32601
+
+
+def full_transactions(block_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return a block's transaction objects, or [] if it only lists hashes.
+    
+    A block is fetched either with full transactions or with hashes only, so
+    the format is checked once on the first entry instead of once per transaction.
+    """
+    transactions = block_data.get('transactions') or []
+    return transactions if isinstance(transactions[0] if transactions else None, dict) else []
+
+
+def inline_receipts(transactions: List[Dict[str, Any]]) -> bool:
+    """Return True if a block's transaction objects carry their receipt's status and gasUsed.
+    
+    Some nodes return these inline with the block, making the receipt fetch
+    unnecessary. Like full_transactions, only the first entry is checked.
+    """
+    return bool(transactions) and 'status' in transactions[0] and 'gasUsed' in transactions[0]
+
 
 class BlockchainClient:
     """High-performance blockchain client with connection pooling and error handling."""
@@ -39,11 +64,13 @@ class BlockchainClient:
             self.ws_url = config.get('blockchain.ws_url', ws_url)
             self.max_connections = config.get('performance.max_connections', max_connections)
             self.timeout = config.get('performance.connection_timeout', timeout)
+            self.rpc_batch_size = config.get('performance.rpc_batch_size', DEFAULT_RPC_BATCH_SIZE)
         else:  # It's a direct RPC URL string or None
             self.rpc_url = config_or_rpc_url or "http://localhost:8545"
             self.ws_url = ws_url
             self.max_connections = max_connections
             self.timeout = timeout
+            self.rpc_batch_size = DEFAULT_RPC_BATCH_SIZE
         
         # Initialize Web3 instance
         self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
@@ -58,6 +85,14 @@ class BlockchainClient:
         # Initialize HTTP session with connection pooling
         self.session = self._create_session()
         
+        # Keep-alive pool for the async JSON-RPC calls, created on first use in the
+        # running event loop (an aiohttp session cannot outlive or change its loop)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Cleared once the node rejects eth_getBlockReceipts (receipts are batched per hash instead)
+        self._block_receipts_supported = True
+        
         # Connection state
         self._connected = False
         self._chain_id = None
@@ -120,6 +155,23 @@ class BlockchainClient:
             
         return False
         
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the pooled aiohttp session, creating it for the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._http_session is None or self._http_session.closed or self._http_session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                ttl_dns_cache=300,
+            )
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Content-Type": "application/json"}
+            )
+            self._http_session_loop = loop
+        return self._http_session
+        
     def _rate_limit(self):
         """Simple rate limiting."""
         current_time = time.time()
@@ -132,6 +184,22 @@ class BlockchainClient:
         
     async def _make_rpc_call(self, method: str, params: List = None) -> Dict[str, Any]:
         """Make async RPC call with error handling."""
+        response = await self._make_rpc_request(method, params)
+        if response is None:
+            return None
+            
+        if "error" in response:
+            logger.error(f"RPC error for {method}: {response['error']}")
+            return None
+            
+        return response.get("result")
+        
+    async def _make_rpc_request(self, method: str, params: List = None) -> Optional[Dict[str, Any]]:
+        """Send one JSON-RPC request and return its response object.
+        
+        Returns None if no response arrived (transport or HTTP failure); a JSON-RPC
+        error is returned as the response's "error" member for the caller to inspect.
+        """
         if params is None:
             params = []
             
@@ -145,29 +213,59 @@ class BlockchainClient:
         self._rate_limit()
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(
-                    self.rpc_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
+            async with self._get_http_session().post(self.rpc_url, data=orjson.dumps(payload)) as response:
+                
+                if response.status == 200:
+                    return await response.json(loads=orjson.loads)
+                else:
+                    logger.error(f"HTTP error {response.status} for {method}")
+                    return None
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if "error" in result:
-                            logger.error(f"RPC error for {method}: {result['error']}")
-                            return None
-                            
-                        return result.get("result")
-                    else:
-                        logger.error(f"HTTP error {response.status} for {method}")
-                        return None
-                        
         except Exception as e:
             logger.error(f"Exception in RPC call {method}: {e}")
             return None
             
+    async def _make_batch_rpc_call(self, method: str, params_list: List[List]) -> List[Optional[Any]]:
+        """Make one JSON-RPC batch request calling a method once per params entry.
+        
+        Returns the results in request order; entries that failed are None.
+        """
+        if not params_list:
+            return []
+            
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            for request_id, params in enumerate(params_list)
+        ]
+        results = [None] * len(params_list)
+        
+        self._rate_limit()
+        
+        try:
+            async with self._get_http_session().post(self.rpc_url, data=orjson.dumps(payload)) as response:
+                
+                if response.status != 200:
+                    logger.error(f"HTTP error {response.status} for batched {method}")
+                    return results
+                    
+                body = await response.json(loads=orjson.loads)
+                if not isinstance(body, list):
+                    # Servers without batch support answer with a single error object
+                    logger.error(f"RPC batch not supported for {method}: {body.get('error')}")
+                    return results
+                    
+                # Responses may arrive in any order; match them back by id
+                for item in body:
+                    if "error" in item:
+                        logger.error(f"RPC error for {method}: {item['error']}")
+                    elif isinstance(item.get("id"), int) and 0 <= item["id"] < len(results):
+                        results[item["id"]] = item.get("result")
+                        
+        except Exception as e:
+            logger.error(f"Exception in batched RPC call {method}: {e}")
+            
+        return results
+            
     def _make_sync_rpc_call(self, method: str, params: List = None) -> Dict[str, Any]:
         """Make synchronous RPC call."""
         if params is None:
@@ -185,13 +283,13 @@ class BlockchainClient:
         try:
             response = self.session.post(
                 self.rpc_url,
-                json=payload,
+                data=orjson.dumps(payload),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 
                 if "error" in result:
                     logger.error(f"RPC error for {method}: {result['error']}")
@@ -237,6 +335,53 @@ class BlockchainClient:
         """Get transaction receipt."""
         return await self._make_rpc_call("eth_getTransactionReceipt", [tx_hash])
         
+    async def get_block_receipts(self, block_number: int) -> Optional[List[Dict[str, Any]]]:
+        """Get every receipt of a block in one eth_getBlockReceipts call.
+        
+        Returns None if the node does not support the method (remembered, so it
+        is not asked again) or the call failed; use get_receipts_batch then.
+        """
+        if not self._block_receipts_supported:
+            return None
+            
+        response = await self._make_rpc_request("eth_getBlockReceipts", [hex(block_number)])
+        if response is None:
+            return None
+            
+        error = response.get("error")
+        if error:
+            # Only a missing method is permanent; other errors are retried next block
+            if isinstance(error, dict) and error.get("code") == JSONRPC_METHOD_NOT_FOUND:
+                logger.info("eth_getBlockReceipts unavailable, batching receipts per transaction")
+                self._block_receipts_supported = False
+            else:
+                logger.error(f"RPC error for eth_getBlockReceipts: {error}")
+            return None
+            
+        return response.get("result")
+        
+    async def get_block_receipts_by_hash(self, block_number: int,
+                                         transactions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Get the receipts of a block's transactions keyed by transaction hash.
+        
+        Transactions that carry their receipt fields inline serve as their own
+        receipts. Otherwise uses eth_getBlockReceipts where the node supports it
+        and batched eth_getTransactionReceipt calls for the hashes if not.
+        """
+        if not transactions:
+            return {}
+        if inline_receipts(transactions):
+            return {tx['hash']: tx for tx in transactions}
+            
+        tx_hashes = [tx['hash'] for tx in transactions]
+        receipts = await self.get_block_receipts(block_number)
+        if receipts is None:
+            return {
+                tx_hash: receipt
+                for tx_hash, receipt in zip(tx_hashes, await self.get_receipts_batch(tx_hashes)) if receipt
+            }
+        return {receipt['transactionHash']: receipt for receipt in receipts if receipt}
+        
     async def get_logs(self, from_block: int, to_block: int, 
                       addresses: List[str] = None, 
                       topics: List[str] = None) -> Optional[List[Dict[str, Any]]]:
@@ -293,6 +438,40 @@ class BlockchainClient:
             
         return await asyncio.gather(*tasks, return_exceptions=True)
         
+    async def iter_blocks_batch(self, start_block: int, end_block: int
+                                ) -> AsyncIterator[Tuple[int, Union[Optional[Dict[str, Any]], Exception]]]:
+        """Yield (block_number, block) for a range of blocks as their responses arrive.
+        
+        Blocks come in completion order, not block order. Like get_blocks_batch,
+        a failed fetch yields the exception in place of the block.
+        """
+        async def fetch(block_num: int):
+            try:
+                return block_num, await self.get_block(block_num, include_transactions=True)
+            except Exception as e:
+                return block_num, e
+                
+        for next_block in asyncio.as_completed([fetch(block_num) for block_num in range(start_block, end_block + 1)]):
+            yield await next_block
+        
+    async def get_receipts_batch(self, tx_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get receipts for many transactions with batched JSON-RPC requests.
+        
+        Issues one HTTP round trip per rpc_batch_size hashes instead of one per
+        transaction. Receipts are returned in the order of tx_hashes (None where
+        a receipt could not be fetched).
+        """
+        chunks = [tx_hashes[i:i + self.rpc_batch_size] for i in range(0, len(tx_hashes), self.rpc_batch_size)]
+        results = await asyncio.gather(*(
+            self._make_batch_rpc_call("eth_getTransactionReceipt", [[tx_hash] for tx_hash in chunk])
+            for chunk in chunks
+        ))
+        return [receipt for chunk_receipts in results for receipt in chunk_receipts]
+        
+    async def wait_for_new_head(self, timeout: float):
+        """Wait until a new block may be available (over HTTP, simply the poll interval)."""
+        await asyncio.sleep(timeout)
+        
     def get_block_sync(self, block_number: Union[int, str], 
                       include_transactions: bool = True) -> Optional[Dict[str, Any]]:
         """Synchronous version of get_block for use in non-async contexts."""
@@ -305,9 +484,27 @@ class BlockchainClient:
                                        [block_identifier, include_transactions])
         
     def close(self):
-        """Clean up connections."""
+        """Clean up connections.
+        
+        From async code prefer aclose(), which also waits for the pooled
+        connections of the async calls to close.
+        """
         if self.session:
             self.session.close()
+        
+        http_session, self._http_session = self._http_session, None
+        if http_session is not None and not http_session.closed:
+            try:
+                asyncio.get_running_loop().create_task(http_session.close())
+            except RuntimeError:
+                pass  # No running loop: the session's loop has already been closed
+                
+    async def aclose(self):
+        """Clean up connections, including the async connection pool."""
+        http_session, self._http_session = self._http_session, None
+        if http_session is not None and not http_session.closed:
+            await http_session.close()
+        self.close()
             
     @property
     def is_connected(self) -> bool:
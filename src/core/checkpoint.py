@@ -0,0 +1,59 @@
+"""
+Block Checkpoint
+
+Append-only record of the last block a processor has fully finished, so a
+restarted run resumes from a local file instead of querying InfluxDB for its
+latest stored block. Each checkpoint is one appended, fsynced line; only the
+file's tail is read back, and a last line without its newline (torn by a
+crash mid-append) is ignored.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class BlockCheckpoint:
+    """Resume checkpoint file holding one finished block number per line."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @classmethod
+    def from_config(cls, config: Any) -> "BlockCheckpoint":
+        """Create the checkpoint for the configured chain under processing.checkpoint_dir."""
+        return cls(
+            Path(config.get('processing.checkpoint_dir', 'logs')) /
+            f"checkpoint.{config.get('blockchain.chain_id', 614)}.log"
+        )
+
+    def read(self) -> Optional[int]:
+        """Return the last checkpointed block, or None if there is no usable checkpoint."""
+        try:
+            with open(self.path, 'rb') as f:
+                # Only the last line matters; read just the file's tail
+                f.seek(max(0, os.fstat(f.fileno()).st_size - 64))
+                lines = f.read().split(b"\n")
+            # The last element is what follows the final newline: empty unless
+            # the last append was torn, and never a complete checkpoint
+            complete = [line for line in lines[:-1] if line.strip()]
+            return int(complete[-1]) if complete else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+    def write(self, block_number: int):
+        """Durably append a finished block number to the checkpoint file."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(f"{block_number}\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning(f"Could not write checkpoint {self.path}: {e}")
@@ -0,0 +1,35 @@
+"""
+Event Loop Setup
+
+Optional uvloop integration for the asyncio entry points. uvloop is a drop-in,
+libuv-based event loop with noticeably lower per-callback overhead; when it is
+not installed (or on Windows) the standard asyncio loop is used unchanged.
+"""
+
+import asyncio
+import logging
+
+# Optional faster event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for event loops created after this call (e.g. by asyncio.run)
+
+    Must be called before the loop is started; an already running loop keeps
+    its implementation. Returns True if uvloop was installed.
+    """
+    if not UVLOOP_AVAILABLE:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed uvloop event loop policy")
+    return True
@@ -5,15 +5,33 @@ Handles all database operations for storing and querying blockchain data.
 
 import logging
 from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timezone
-import json
+from datetime import datetime
+import time
 
 from influxdb_client import InfluxDBClient as InfluxDB, Point, WritePrecision
 from influxdb_client.client.write_api import SYNCHRONOUS, ASYNCHRONOUS
 import pandas as pd
 
+from .batching_writer import BatchingInfluxWriter
+from .udp_writer import UdpLineProtocolWriteApi
+
 logger = logging.getLogger(__name__)
 
+# Line-protocol escaping for tag values (mirrors influxdb_client's Point)
+_ESCAPE_TAG = str.maketrans({
+    ',': r'\,',
+    '=': r'\=',
+    ' ': r'\ ',
+    '\n': r'\n',
+    '\t': r'\t',
+    '\r': r'\r',
+})
+
+# The hot write paths below format line protocol directly instead of building
+# Points: tag keys are written in the sorted order InfluxDB expects, so nothing
+# is sorted per call. Addresses, hashes and topics are hex and need no escaping
+_BLOCK_TAGS = "blocks,chain_id=614,miner={miner},network=mainnet"
+
 
 class BlockchainInfluxDB:
     """InfluxDB client optimized for blockchain data storage."""
@@ -32,11 +50,36 @@ class BlockchainInfluxDB:
             self.org = org or 'glq-analytics'
             self.bucket = bucket or 'blockchain_data'
         
-        # Initialize client
-        self.client = InfluxDB(url=self.url, token=self.token, org=self.org)
+        # Initialize client (gzip-compressed request/response bodies)
+        self.client = InfluxDB(url=self.url, token=self.token, org=self.org, enable_gzip=True)
         self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
         self.query_api = self.client.query_api()
         
+        # Block, transaction, event and token transfer points are buffered and
+        # written in large batches by background threads. Blocks carry their
+        # seconds-resolution chain timestamp as-is and go through a writer at
+        # second precision; the others keep nanosecond times, since rows of one
+        # block would otherwise share a timestamp and overwrite each other.
+        # With influxdb.write_transport "udp" the buffered records go to an
+        # InfluxDB UDP listener instead, unacknowledged
+        self._udp_write_api = None
+        if hasattr(config_or_url, 'get'):
+            line_write_api = self.write_api
+            transport = config_or_url.get('influxdb.write_transport', 'http')
+            if transport == 'udp':
+                self._udp_write_api = line_write_api = UdpLineProtocolWriteApi.from_config(config_or_url)
+            elif transport != 'http':
+                logger.warning(f"Unsupported InfluxDB write transport {transport!r}, using http")
+                
+            self._writer = BatchingInfluxWriter.from_config(config_or_url, line_write_api, self.bucket, self.org)
+            self._block_writer = BatchingInfluxWriter.from_config(
+                config_or_url, line_write_api, self.bucket, self.org, write_precision=WritePrecision.S
+            )
+        else:
+            self._writer = BatchingInfluxWriter(self.write_api, self.bucket, self.org)
+            self._block_writer = BatchingInfluxWriter(self.write_api, self.bucket, self.org,
+                                                      write_precision=WritePrecision.S)
+        
         # Connection state
         self._connected = False
         
@@ -57,37 +100,36 @@ class BlockchainInfluxDB:
     def write_block(self, block_data: Dict[str, Any], block_time_diff: Optional[float] = None):
         """Write block data to InfluxDB."""
         try:
-            # Convert timestamp
-            timestamp = datetime.fromtimestamp(int(block_data['timestamp'], 16), tz=timezone.utc)
+            # Block timestamps are whole seconds
+            timestamp = int(block_data['timestamp'], 16)
             
             # Calculate gas utilization
             gas_used = int(block_data['gasUsed'], 16)
             gas_limit = int(block_data['gasLimit'], 16)
-            gas_utilization = gas_used / gas_limit if gas_limit > 0 else 0
-            
-            point = Point("blocks") \
-                .tag("chain_id", "614") \
-                .tag("network", "mainnet") \
-                .tag("miner", block_data.get('miner', '0x0000000000000000000000000000000000000000')) \
-                .field("block_number", int(block_data['number'], 16)) \
-                .field("gas_limit", gas_limit) \
-                .field("gas_used", gas_used) \
-                .field("transaction_count", len(block_data.get('transactions', []))) \
-                .field("size", int(block_data.get('size', '0x0'), 16)) \
-                .field("difficulty", block_data.get('difficulty', '0x0')) \
-                .field("total_difficulty", block_data.get('totalDifficulty', '0x0')) \
-                .field("gas_utilization", gas_utilization) \
-                .time(timestamp, WritePrecision.NS)
+            gas_utilization = gas_used / gas_limit if gas_limit > 0 else 0.0
+            
+            fields = (
+                f"block_number={int(block_data['number'], 16)}i"
+                f",difficulty=\"{block_data.get('difficulty', '0x0')}\""
+                f",gas_limit={gas_limit}i"
+                f",gas_used={gas_used}i"
+                f",gas_utilization={gas_utilization}"
+                f",size={int(block_data.get('size', '0x0'), 16)}i"
+                f",total_difficulty=\"{block_data.get('totalDifficulty', '0x0')}\""
+                f",transaction_count={len(block_data.get('transactions', []))}i"
+            )
             
             # Add base fee if available (EIP-1559)
             if 'baseFeePerGas' in block_data:
-                point = point.field("base_fee_per_gas", int(block_data['baseFeePerGas'], 16))
+                fields += f",base_fee_per_gas={int(block_data['baseFeePerGas'], 16)}i"
             
-            # Add block time if calculated
+            # Add block time if calculated (integer seconds from the processors)
             if block_time_diff:
-                point = point.field("block_time", block_time_diff)
+                fields += (f",block_time={block_time_diff}i" if isinstance(block_time_diff, int)
+                           else f",block_time={float(block_time_diff)}")
                 
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+            miner = block_data.get('miner', '0x0000000000000000000000000000000000000000')
+            self._block_writer.write_lines([f"{_BLOCK_TAGS.format(miner=miner)} {fields} {timestamp}"], "block data")
             
         except Exception as e:
             logger.error(f"Error writing block data: {e}")
@@ -95,75 +137,94 @@ class BlockchainInfluxDB:
     def write_transaction(self, tx_data: Dict[str, Any], block_number: int, 
                          status: str = "success", gas_used: int = None):
         """Write transaction data to InfluxDB."""
-        try:
-            # Determine transaction type
-            tx_type = self._classify_transaction(tx_data)
-            
-            # Calculate transaction fee
-            gas_price = int(tx_data.get('gasPrice', '0x0'), 16)
-            gas_limit = int(tx_data.get('gas', '0x0'), 16)
-            actual_gas_used = gas_used or gas_limit
-            transaction_fee = gas_price * actual_gas_used
-            
-            # Handle None values for to_address (contract creation)
-            to_address = tx_data.get('to') 
-            to_address_safe = to_address.lower() if to_address else ''
-            
-            point = Point("transactions") \
-                .tag("chain_id", "614") \
-                .tag("from_address", tx_data['from'].lower()) \
-                .tag("to_address", to_address_safe) \
-                .tag("transaction_type", tx_type) \
-                .tag("status", status) \
-                .field("block_number", block_number) \
-                .field("transaction_index", int(tx_data['transactionIndex'], 16)) \
-                .field("hash", tx_data['hash']) \
-                .field("nonce", int(tx_data['nonce'], 16)) \
-                .field("value", tx_data['value']) \
-                .field("gas_limit", gas_limit) \
-                .field("gas_used", actual_gas_used) \
-                .field("gas_price", gas_price) \
-                .field("transaction_fee", str(transaction_fee)) \
-                .field("input_data_size", len(tx_data.get('input', '0x')) // 2) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-            
-            # Add effective gas price if available
-            if 'effectiveGasPrice' in tx_data:
-                point = point.field("effective_gas_price", int(tx_data['effectiveGasPrice'], 16))
+        self.write_transactions([tx_data], block_number, [status], [gas_used])
+    
+    def write_transactions(self, tx_rows: List[Dict[str, Any]], block_number: int,
+                           statuses: Optional[List[str]] = None, gas_used: Optional[List[Optional[int]]] = None):
+        """Write a list of transactions from one block as a single line-protocol batch."""
+        if statuses is None:
+            statuses = ["success"] * len(tx_rows)
+        if gas_used is None:
+            gas_used = [None] * len(tx_rows)
+        
+        lines = []
+        append = lines.append
+        for tx_data, status, tx_gas_used in zip(tx_rows, statuses, gas_used):
+            try:
+                # Determine transaction type
+                tx_type = self._classify_transaction(tx_data)
                 
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
-            logger.error(f"Error writing transaction data: {e}")
+                # Calculate transaction fee
+                gas_price = int(tx_data.get('gasPrice', '0x0'), 16)
+                gas_limit = int(tx_data.get('gas', '0x0'), 16)
+                actual_gas_used = tx_gas_used or gas_limit
+                transaction_fee = gas_price * actual_gas_used
+                
+                # Empty tag values are not allowed, so contract creations omit to_address
+                to_address = tx_data.get('to')
+                tags = f"transactions,chain_id=614,from_address={tx_data['from'].lower()},status={status.translate(_ESCAPE_TAG)}"
+                if to_address:
+                    tags += f",to_address={to_address.lower()}"
+                tags += f",transaction_type={tx_type}"
+                
+                fields = (
+                    f"block_number={block_number}i"
+                    f",gas_limit={gas_limit}i"
+                    f",gas_price={gas_price}i"
+                    f",gas_used={actual_gas_used}i"
+                    f",hash=\"{tx_data['hash']}\""
+                    f",input_data_size={len(tx_data.get('input', '0x')) // 2}i"
+                    f",nonce={int(tx_data['nonce'], 16)}i"
+                    f",transaction_fee=\"{transaction_fee}\""
+                    f",transaction_index={int(tx_data['transactionIndex'], 16)}i"
+                    f",value=\"{tx_data['value']}\""
+                )
+                
+                # Add effective gas price if available
+                if 'effectiveGasPrice' in tx_data:
+                    fields += f",effective_gas_price={int(tx_data['effectiveGasPrice'], 16)}i"
+                    
+                append(f"{tags} {fields} {time.time_ns()}")
+                
+            except Exception as e:
+                logger.error(f"Error writing transaction data: {e}")
+        
+        if lines:
+            self._writer.write_lines(lines, "transaction data")
     
     def write_event(self, event_data: Dict[str, Any], block_number: int, tx_hash: str):
         """Write event/log data to InfluxDB."""
-        try:
-            point = Point("events") \
-                .tag("chain_id", "614") \
-                .tag("contract_address", event_data['address'].lower()) \
-                .tag("event_signature", event_data.get('topics', [''])[0]) \
-                .field("block_number", block_number) \
-                .field("transaction_hash", tx_hash) \
-                .field("log_index", int(event_data.get('logIndex', '0x0'), 16)) \
-                .field("data", event_data.get('data', '')) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-            
-            # Add topics as tags if available
-            topics = event_data.get('topics', [])
-            if len(topics) > 0:
-                point = point.tag("topic0", topics[0])
-            if len(topics) > 1:
-                point = point.tag("topic1", topics[1])
-            if len(topics) > 2:
-                point = point.tag("topic2", topics[2])
-            if len(topics) > 3:
-                point = point.tag("topic3", topics[3])
+        self.write_events([event_data], block_number, [tx_hash])
+    
+    def write_events(self, event_rows: List[Dict[str, Any]], block_number: int, tx_hashes: List[str]):
+        """Write a list of events from one block as a single line-protocol batch."""
+        lines = []
+        append = lines.append
+        for event_data, tx_hash in zip(event_rows, tx_hashes):
+            try:
+                tags = f"events,chain_id=614,contract_address={event_data['address'].lower()}"
                 
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
-            logger.error(f"Error writing event data: {e}")
+                # Add the signature and topics as tags if available
+                topics = event_data.get('topics', [])
+                if topics:
+                    tags += f",event_signature={topics[0]}"
+                for index, topic in enumerate(topics[:4]):
+                    tags += f",topic{index}={topic}"
+                
+                fields = (
+                    f"block_number={block_number}i"
+                    f",data=\"{event_data.get('data', '')}\""
+                    f",log_index={int(event_data.get('logIndex', '0x0'), 16)}i"
+                    f",transaction_hash=\"{tx_hash}\""
+                )
+                    
+                append(f"{tags} {fields} {time.time_ns()}")
+                
+            except Exception as e:
+                logger.error(f"Error writing event data: {e}")
+        
+        if lines:
+            self._writer.write_lines(lines, "event data")
     
     def write_token_transfer(self, transfer_data: Dict[str, Any]):
         """Write token transfer data."""
@@ -190,7 +251,7 @@ class BlockchainInfluxDB:
             if 'token_id' in transfer_data:  # For NFTs
                 point = point.field("token_id", transfer_data['token_id'])
                 
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+            self._writer.write_lines([point.to_line_protocol()], "token transfer data")
             
         except Exception as e:
             logger.error(f"Error writing token transfer data: {e}")
@@ -436,8 +497,22 @@ class BlockchainInfluxDB:
             logger.error(f"Error clearing all data: {e}")
             raise
     
+    def flush(self):
+        """Block until every buffered point has been written."""
+        self._block_writer.flush()
+        self._writer.flush()
+    
+    @property
+    def lost_records(self) -> int:
+        """Number of buffered records that were dropped or failed to write."""
+        return self._block_writer.lost_records + self._writer.lost_records
+    
     def close(self):
-        """Close InfluxDB connections."""
+        """Flush buffered points, stop the background writer and close InfluxDB connections."""
+        self._block_writer.close()
+        self._writer.close()
+        if self._udp_write_api:
+            self._udp_write_api.close()
         if self.client:
             self.client.close()
     
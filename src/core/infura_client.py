@@ -10,7 +10,7 @@ import aiohttp
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-import json
+import orjson
 from asyncio_throttle import Throttler
 import os
 
@@ -18,6 +18,15 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+
+class RPCError(Exception):
+    """JSON-RPC error returned by a node; code is the error object's code (if any)."""
+    
+    def __init__(self, error_info: Any):
+        super().__init__(f"RPC Error: {error_info}")
+        self.code = error_info.get('code') if isinstance(error_info, dict) else None
+
+
 class InfuraClient:
     """
     Manages connections to multiple blockchain networks through Infura.
@@ -167,8 +176,8 @@ class InfuraClient:
                     }
                     
                     try:
-                        async with session.post(url, json=payload) as response:
-                            response_data = await response.json()
+                        async with session.post(url, data=orjson.dumps(payload)) as response:
+                            response_data = await response.json(loads=orjson.loads)
                             
                             # Handle rate limiting with exponential backoff
                             if response.status == 429:
@@ -204,7 +213,7 @@ class InfuraClient:
                                         continue
                                 
                                 logger.error(f"RPC error for {chain_id}: {error_info}")
-                                raise Exception(f"RPC Error: {error_info}")
+                                raise RPCError(error_info)
                             
                             return response_data.get('result')
                             
@@ -294,8 +303,8 @@ class InfuraClient:
                     batch_payload.append(payload)
                 
                 try:
-                    async with session.post(url, json=batch_payload) as response:
-                        response_data = await response.json()
+                    async with session.post(url, data=orjson.dumps(batch_payload)) as response:
+                        response_data = await response.json(loads=orjson.loads)
                         
                         if response.status != 200:
                             logger.error(f"Batch HTTP error {response.status} for {chain_id}")
@@ -366,7 +375,7 @@ class InfuraClient:
             "id": 1
         }
         
-        await ws.send_str(json.dumps(subscribe_msg))
+        await ws.send_str(orjson.dumps(subscribe_msg).decode())
         logger.info(f"Subscribed to new blocks for {chain_id}")
         return ws
     
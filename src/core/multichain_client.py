@@ -7,16 +7,22 @@ including the local GLQ chain and external chains via Infura.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
 from datetime import datetime
 import os
 
+from eth_abi import encode as abi_encode, decode as abi_decode
+
 from .config import Config
-from .blockchain_client import BlockchainClient
-from .infura_client import InfuraClient
+from .blockchain_client import BlockchainClient, DEFAULT_RPC_BATCH_SIZE, JSONRPC_METHOD_NOT_FOUND
+from .infura_client import InfuraClient, RPCError
 
 logger = logging.getLogger(__name__)
 
+# Multicall3 is deployed at the same address on every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_AGGREGATE3_SELECTOR = "0x82ad56cb"  # aggregate3((address,bool,bytes)[])
+
 class MultiChainClient:
     """
     Unified client for interacting with multiple blockchain networks.
@@ -36,6 +42,10 @@ class MultiChainClient:
         # Connection status
         self.connected_chains: Dict[str, bool] = {}
         
+        # Chains whose nodes rejected eth_getBlockReceipts (receipts are batched per hash instead)
+        self._no_block_receipts: Set[str] = set()
+        self.rpc_batch_size = config.get('performance.rpc_batch_size', DEFAULT_RPC_BATCH_SIZE)
+        
         logger.info(f"Initialized multi-chain client for {len(self.chains)} chains")
     
     def _get_enabled_chains(self) -> Dict[str, Dict[str, Any]]:
@@ -210,6 +220,50 @@ class MultiChainClient:
         else:
             return await client.get_transaction_receipt(tx_hash)
     
+    async def get_block_receipts(self, chain_id: str, block_number: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get every receipt of a block in one eth_getBlockReceipts call
+        
+        Returns None if the chain's node does not support the method (remembered,
+        so it is not asked again) or the call failed; use get_receipts_batch then.
+        """
+        if chain_id in self._no_block_receipts:
+            return None
+        
+        client = self._get_client(chain_id)
+        
+        # RPC clients remember an unsupported method themselves
+        if not isinstance(client, InfuraClient):
+            return await client.get_block_receipts(block_number)
+        
+        # Only a missing method is remembered; other failures are retried next block
+        try:
+            return await client.make_request(chain_id, "eth_getBlockReceipts", [hex(block_number)])
+        except RPCError as e:
+            if e.code == JSONRPC_METHOD_NOT_FOUND:
+                logger.info(f"eth_getBlockReceipts unavailable for {chain_id}, batching receipts per transaction")
+                self._no_block_receipts.add(chain_id)
+            else:
+                logger.debug(f"eth_getBlockReceipts failed for {chain_id}: {e}")
+        except Exception as e:
+            logger.debug(f"eth_getBlockReceipts failed for {chain_id}: {e}")
+        return None
+    
+    async def get_receipts_batch(self, chain_id: str, tx_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get receipts for many transactions with batched JSON-RPC requests (in tx_hashes order)"""
+        client = self._get_client(chain_id)
+        
+        if isinstance(client, InfuraClient):
+            results = []
+            for i in range(0, len(tx_hashes), self.rpc_batch_size):
+                results.extend(await client.batch_request(chain_id, [
+                    {"method": "eth_getTransactionReceipt", "params": [tx_hash]}
+                    for tx_hash in tx_hashes[i:i + self.rpc_batch_size]
+                ]))
+            return results
+        else:
+            return await client.get_receipts_batch(tx_hashes)
+    
     async def get_chain_id(self, chain_id: str) -> Optional[int]:
         """Get the actual chain ID from the blockchain"""
         client = self._get_client(chain_id)
@@ -257,6 +311,45 @@ class MultiChainClient:
         else:
             return await client.get_blocks_batch(start_block, end_block)
     
+    async def multicall3(self, chain_id: str, calls: List[Tuple[Union[str, bytes], str]]) -> Optional[List[Optional[bytes]]]:
+        """
+        Execute read-only contract calls in a single eth_call through Multicall3
+        
+        Args:
+            chain_id: Chain identifier
+            calls: List of (contract address as hex or raw 20 bytes, 0x-prefixed calldata) pairs
+            
+        Returns:
+            Raw return data per call (None where that call reverted), or None if
+            the aggregate call itself failed (e.g. Multicall3 is not deployed)
+        """
+        if not calls:
+            return []
+        
+        client = self._get_client(chain_id)
+        
+        call_data = MULTICALL3_AGGREGATE3_SELECTOR + abi_encode(
+            ['(address,bool,bytes)[]'],
+            [[(address, True, bytes.fromhex(data[2:])) for address, data in calls]]
+        ).hex()
+        params = [{"to": MULTICALL3_ADDRESS, "data": call_data}, "latest"]
+        
+        try:
+            if isinstance(client, InfuraClient):
+                result = await client.make_request(chain_id, "eth_call", params)
+            else:
+                result = await client._make_rpc_call("eth_call", params)
+            
+            if not result or result == "0x":
+                return None
+            
+            (results,) = abi_decode(['(bool,bytes)[]'], bytes.fromhex(result[2:]))
+            return [return_data if success else None for success, return_data in results]
+            
+        except Exception as e:
+            logger.warning(f"Multicall3 request failed for {chain_id}: {e}")
+            return None
+    
     # Multi-chain operations
     async def get_latest_blocks_all_chains(self) -> Dict[str, Optional[int]]:
         """Get latest block numbers for all connected chains"""
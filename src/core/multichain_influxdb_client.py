@@ -5,19 +5,140 @@ This module extends the existing InfluxDB client to support multiple blockchain
 with chain-specific data storage and querying capabilities.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timezone
-import json
+import time
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta
 
 from influxdb_client import InfluxDBClient as InfluxDB, Point, WritePrecision
 from influxdb_client.client.write_api import SYNCHRONOUS, ASYNCHRONOUS
+from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+from influxdb_client.client.exceptions import InfluxDBError
+from urllib3.exceptions import HTTPError
+import orjson
 import pandas as pd
 
+from .batching_writer import BatchingInfluxWriter
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Transaction type keyed by (is_contract_creation, has_value, has_input)
+_TX_CLASS = {
+    (True, True, True): "contract_creation",
+    (True, True, False): "contract_creation",
+    (True, False, True): "contract_creation",
+    (True, False, False): "contract_creation",
+    (False, True, True): "contract_call",
+    (False, True, False): "transfer",
+    (False, False, True): "contract_call",
+    (False, False, False): "contract_call",
+}
+
+# Transport failures that write methods log instead of raising
+_WRITE_ERRORS = (InfluxDBError, HTTPError, OSError)
+
+# Line-protocol escaping for tag values (mirrors influxdb_client's Point)
+_ESCAPE_TAG = str.maketrans({
+    ',': r'\,',
+    '=': r'\=',
+    ' ': r'\ ',
+    '\n': r'\n',
+    '\t': r'\t',
+    '\r': r'\r',
+})
+
+# Line-protocol escaping for string field values
+_ESCAPE_FIELD_STRING = str.maketrans({
+    '"': r'\"',
+    '\\': r'\\',
+})
+
+# Flux query shapes; per-call values are bound as extern options through query
+# params so the server sees the same script text for every chain, range and address
+_LATEST_BLOCK_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "blocks")
+              |> filter(fn: (r) => r["_field"] == "block_number")
+              |> last()
+            '''
+
+_CHAIN_LATEST_BLOCK_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "blocks")
+              |> filter(fn: (r) => r["_field"] == "block_number")
+              |> filter(fn: (r) => r["chain_id"] == _chain_id)
+              |> last()
+            '''
+
+_BLOCK_RANGE_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "blocks")
+              |> filter(fn: (r) => r["chain_id"] == _chain_id)
+              |> filter(fn: (r) => r["block_number"] >= _start_block and r["block_number"] <= _end_block)
+            '''
+
+_ADDRESS_ACTIVITY_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "transactions")
+              |> filter(fn: (r) => r["from_address"] == _address or r["to_address"] == _address)
+            '''
+
+_CHAIN_ADDRESS_ACTIVITY_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "transactions")
+              |> filter(fn: (r) => r["chain_id"] == _chain_id)
+              |> filter(fn: (r) => r["from_address"] == _address or r["to_address"] == _address)
+            '''
+
+_CROSS_CHAIN_COMPARISON_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["_measurement"] == "network_metrics")
+              |> filter(fn: (r) => r["_field"] == _metric)
+              |> group(columns: ["chain_name"])
+              |> aggregateWindow(every: 1h, fn: mean, createEmpty: false)
+            '''
+
+_ACTIVITY_SUMMARY_FLUX = '''
+            from(bucket: _bucket)
+              |> range(start: _start)
+              |> filter(fn: (r) => r["chain_id"] == _chain_id)
+              |> filter(fn: (r) => r["_measurement"] == "transactions")
+              |> count()
+            '''
+
+_DURATION_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+
+def _range_start(timerange: str) -> timedelta:
+    """Convert a relative time range such as '24h' or '7d' into a negative range start."""
+    unit = _DURATION_UNITS.get(timerange[-1:])
+    if unit is None or not timerange[:-1].isdigit():
+        raise ValueError(f"Unsupported time range '{timerange}'")
+    return -timedelta(**{unit: int(timerange[:-1])})
+
+
+def _address_tag(address: Union[str, bytes]) -> str:
+    """Lowercase hex tag value for an address given as hex or as raw 20 bytes."""
+    if isinstance(address, bytes):
+        return "0x" + address.hex()
+    return address.lower()
+
+
+# Fields each write method requires before building a point
+_BLOCK_KEYS = ('number', 'timestamp', 'gasUsed', 'gasLimit')
+_TRANSACTION_KEYS = ('hash', 'from', 'nonce', 'value', 'transactionIndex')
+_EVENT_KEYS = ('address',)
+_TOKEN_TRANSFER_KEYS = ('token_address', 'from_address', 'to_address', 'block_number', 'transaction_hash', 'amount')
+_CONTRACT_KEYS = ('address',)
+
 
 class MultiChainInfluxDB:
     """Multi-chain InfluxDB client optimized for blockchain data storage across multiple networks."""
@@ -31,17 +152,29 @@ class MultiChainInfluxDB:
         self.org = config.influxdb_org
         self.bucket = config.influxdb_bucket
         
-        # Initialize client
-        self.client = InfluxDB(url=self.url, token=self.token, org=self.org)
+        # Initialize client (gzip-compressed request/response bodies)
+        self.client = InfluxDB(url=self.url, token=self.token, org=self.org, enable_gzip=True)
         self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
         self.query_api = self.client.query_api()
+        self.delete_api = self.client.delete_api()
         
         # Chain configuration
         self.chains = config.chains
+        self._chain_tags: Dict[str, Dict[str, str]] = {}
+        self._chain_tag_prefixes: Dict[str, str] = {}
         
         # Connection state
         self._connected = False
         
+        # Line-protocol records are built on the caller thread and written in
+        # batches by a background thread; a full queue applies backpressure.
+        # Blocks carry their seconds-resolution chain timestamp as-is through a
+        # second-precision writer; other rows need nanoseconds to stay distinct
+        self._writer = BatchingInfluxWriter.from_config(config, self.write_api, self.bucket, self.org)
+        self._block_writer = BatchingInfluxWriter.from_config(
+            config, self.write_api, self.bucket, self.org, write_precision=WritePrecision.S
+        )
+        
         logger.info(f"Initialized multi-chain InfluxDB client for {len(self.chains)} chains")
     
     async def connect(self) -> bool:
@@ -65,319 +198,532 @@ class MultiChainInfluxDB:
         return self.chains[chain_id]
     
     def _get_chain_tags(self, chain_id: str) -> Dict[str, str]:
-        """Get standard chain tags for data points."""
-        chain_config = self.get_chain_info(chain_id)
-        return {
-            "chain_id": str(chain_config['chain_id']),
-            "chain_name": chain_config['name'],
-            "network": chain_config.get('network_type', 'mainnet'),
-            "provider": chain_config.get('provider', 'unknown')
-        }
+        """Get standard chain tags for data points (cached per chain; do not mutate)."""
+        chain_tags = self._chain_tags.get(chain_id)
+        if chain_tags is None:
+            chain_config = self.get_chain_info(chain_id)
+            chain_tags = {
+                "chain_id": str(chain_config['chain_id']),
+                "chain_name": chain_config['name'],
+                "network": chain_config.get('network_type', 'mainnet'),
+                "provider": chain_config.get('provider', 'unknown')
+            }
+            self._chain_tags[chain_id] = chain_tags
+        return chain_tags
     
-    def write_block(self, chain_id: str, block_data: Dict[str, Any], block_time_diff: Optional[float] = None):
-        """Write block data to InfluxDB with chain context."""
-        try:
-            # Convert timestamp
-            timestamp = datetime.fromtimestamp(int(block_data['timestamp'], 16), tz=timezone.utc)
+    def _get_chain_tag_prefix(self, chain_id: str) -> str:
+        """Get the escaped line-protocol tag prefix shared by every point of a chain."""
+        prefix = self._chain_tag_prefixes.get(chain_id)
+        if prefix is None:
+            prefix = ''.join(
+                f",{key}={str(value).translate(_ESCAPE_TAG)}"
+                for key, value in self._get_chain_tags(chain_id).items()
+            )
+            self._chain_tag_prefixes[chain_id] = prefix
+        return prefix
+    
+    def _write_lines(self, lines: List[str], description: str):
+        """Queue line-protocol records for the background writer, blocking while the queue is full."""
+        self._writer.write_lines(lines, description)
+    
+    def flush(self):
+        """Block until every queued line-protocol record has been written."""
+        self._block_writer.flush()
+        self._writer.flush()
+    
+    @property
+    def lost_records(self) -> int:
+        """Number of queued records that were dropped or failed to write."""
+        return self._block_writer.lost_records + self._writer.lost_records
+    
+    def write_blocks(self, chain_id: str, blocks: List[Dict[str, Any]],
+                     block_time_diffs: Optional[List[Optional[float]]] = None):
+        """Write a list of blocks for one chain as a single line-protocol batch."""
+        prefix = "blocks" + self._get_chain_tag_prefix(chain_id)
+        if block_time_diffs is None:
+            block_time_diffs = [None] * len(blocks)
+        
+        lines = []
+        append = lines.append
+        for block_data, block_time_diff in zip(blocks, block_time_diffs):
+            missing = [key for key in _BLOCK_KEYS if key not in block_data]
+            if missing:
+                logger.error(f"Skipping block for chain {chain_id}: missing fields {missing}")
+                continue
             
             # Calculate gas utilization
             gas_used = int(block_data['gasUsed'], 16)
             gas_limit = int(block_data['gasLimit'], 16)
-            gas_utilization = gas_used / gas_limit if gas_limit > 0 else 0
-            
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("blocks") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("miner", block_data.get('miner', '0x0000000000000000000000000000000000000000')) \
-                .field("block_number", int(block_data['number'], 16)) \
-                .field("gas_limit", gas_limit) \
-                .field("gas_used", gas_used) \
-                .field("transaction_count", len(block_data.get('transactions', []))) \
-                .field("size", int(block_data.get('size', '0x0'), 16)) \
-                .field("difficulty", block_data.get('difficulty', '0x0')) \
-                .field("total_difficulty", block_data.get('totalDifficulty', '0x0')) \
-                .field("gas_utilization", gas_utilization) \
-                .time(timestamp, WritePrecision.NS)
+            gas_utilization = gas_used / gas_limit if gas_limit > 0 else 0.0
+            
+            fields = (
+                f"block_number={int(block_data['number'], 16)}i"
+                f",difficulty=\"{block_data.get('difficulty', '0x0')}\""
+                f",gas_limit={gas_limit}i"
+                f",gas_used={gas_used}i"
+                f",gas_utilization={gas_utilization}"
+                f",size={int(block_data.get('size', '0x0'), 16)}i"
+                f",total_difficulty=\"{block_data.get('totalDifficulty', '0x0')}\""
+                f",transaction_count={len(block_data.get('transactions', []))}i"
+            )
             
             # Add base fee if available (EIP-1559)
             if 'baseFeePerGas' in block_data:
-                point = point.field("base_fee_per_gas", int(block_data['baseFeePerGas'], 16))
+                fields += f",base_fee_per_gas={int(block_data['baseFeePerGas'], 16)}i"
             
             # Add block time if calculated
             if block_time_diff:
-                point = point.field("block_time", block_time_diff)
-                
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+                fields += f",block_time={float(block_time_diff)}"
             
-        except Exception as e:
-            logger.error(f"Error writing block data for chain {chain_id}: {e}")
+            miner = block_data.get('miner', '0x0000000000000000000000000000000000000000')
+            append(f"{prefix},miner={miner} {fields} {int(block_data['timestamp'], 16)}")
+        
+        self._block_writer.write_lines(lines, f"block data for chain {chain_id}")
     
-    def write_transaction(self, chain_id: str, tx_data: Dict[str, Any], block_number: int, 
-                         status: str = "success", gas_used: int = None):
-        """Write transaction data to InfluxDB with chain context."""
-        try:
+    def write_block(self, chain_id: str, block_data: Dict[str, Any], block_time_diff: Optional[float] = None):
+        """Write block data to InfluxDB with chain context."""
+        self.write_blocks(chain_id, [block_data], [block_time_diff])
+    
+    def write_transactions(self, chain_id: str, tx_rows: List[Dict[str, Any]], block_number: int,
+                           statuses: Optional[List[str]] = None, gas_used: Optional[List[Optional[int]]] = None,
+                           timestamp_ns: Optional[int] = None):
+        """Write a list of transactions from one block as a single line-protocol batch.
+        
+        timestamp_ns is the block's time (now if omitted); each row is offset from it
+        by its transaction index, so rows sharing a tag set do not overwrite each other.
+        """
+        prefix = "transactions" + self._get_chain_tag_prefix(chain_id)
+        if statuses is None:
+            statuses = ["success"] * len(tx_rows)
+        if gas_used is None:
+            gas_used = [None] * len(tx_rows)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        
+        lines = []
+        append = lines.append
+        for tx_data, status, tx_gas_used in zip(tx_rows, statuses, gas_used):
+            missing = [key for key in _TRANSACTION_KEYS if key not in tx_data]
+            if missing:
+                logger.error(f"Skipping transaction for chain {chain_id}: missing fields {missing}")
+                continue
+            
             # Determine transaction type
+            to_address = tx_data.get('to')
+            input_data = tx_data.get('input', '0x')
             tx_type = self._classify_transaction(tx_data)
             
             # Calculate transaction fee
             gas_price = int(tx_data.get('gasPrice', '0x0'), 16)
             gas_limit = int(tx_data.get('gas', '0x0'), 16)
-            actual_gas_used = gas_used or gas_limit
-            transaction_fee = gas_price * actual_gas_used
-            
-            # Handle None values for to_address (contract creation)
-            to_address = tx_data.get('to') 
-            to_address_safe = to_address.lower() if to_address else ''
-            
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("transactions") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("from_address", tx_data['from'].lower()) \
-                .tag("to_address", to_address_safe) \
-                .tag("transaction_type", tx_type) \
-                .tag("status", status) \
-                .field("block_number", block_number) \
-                .field("transaction_index", int(tx_data['transactionIndex'], 16)) \
-                .field("hash", tx_data['hash']) \
-                .field("nonce", int(tx_data['nonce'], 16)) \
-                .field("value", tx_data['value']) \
-                .field("gas_limit", gas_limit) \
-                .field("gas_used", actual_gas_used) \
-                .field("gas_price", gas_price) \
-                .field("transaction_fee", str(transaction_fee)) \
-                .field("input_data_size", len(tx_data.get('input', '0x')) // 2) \
-                .time(datetime.utcnow(), WritePrecision.NS)
+            actual_gas_used = tx_gas_used or gas_limit
+            transaction_index = int(tx_data['transactionIndex'], 16)
+            
+            # Empty tag values are not allowed, so contract creations omit to_address
+            tags = f",from_address={tx_data['from'].lower()}"
+            if to_address:
+                tags += f",to_address={to_address.lower()}"
+            tags += f",transaction_type={tx_type},status={status.translate(_ESCAPE_TAG)}"
+            
+            fields = (
+                f"block_number={block_number}i"
+                f",gas_limit={gas_limit}i"
+                f",gas_price={gas_price}i"
+                f",gas_used={actual_gas_used}i"
+                f",hash=\"{tx_data['hash']}\""
+                f",input_data_size={len(input_data) // 2}i"
+                f",nonce={int(tx_data['nonce'], 16)}i"
+                f",transaction_fee=\"{gas_price * actual_gas_used}\""
+                f",transaction_index={transaction_index}i"
+                f",value=\"{tx_data['value']}\""
+            )
             
             # Add effective gas price if available
             if 'effectiveGasPrice' in tx_data:
-                point = point.field("effective_gas_price", int(tx_data['effectiveGasPrice'], 16))
-                
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+                fields += f",effective_gas_price={int(tx_data['effectiveGasPrice'], 16)}i"
             
-        except Exception as e:
-            logger.error(f"Error writing transaction data for chain {chain_id}: {e}")
+            append(f"{prefix}{tags} {fields} {timestamp_ns + transaction_index}")
+        
+        self._write_lines(lines, f"transaction data for chain {chain_id}")
     
-    def write_event(self, chain_id: str, event_data: Dict[str, Any], block_number: int, tx_hash: str):
-        """Write event/log data to InfluxDB with chain context."""
-        try:
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("events") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("contract_address", event_data['address'].lower()) \
-                .tag("event_signature", event_data.get('topics', [''])[0]) \
-                .field("block_number", block_number) \
-                .field("transaction_hash", tx_hash) \
-                .field("log_index", int(event_data.get('logIndex', '0x0'), 16)) \
-                .field("data", event_data.get('data', '')) \
-                .time(datetime.utcnow(), WritePrecision.NS)
+    def write_transaction_batch(self, chain_id: str, batch: Any):
+        """Write a block's processed transactions (processors.schemas.TRANSACTION_SCHEMA batch) at once."""
+        prefix = "transactions" + self._get_chain_tag_prefix(chain_id)
+        
+        # Columns are converted to Python values once each, then walked in step
+        column = batch.column
+        lines = []
+        append = lines.append
+        for (block_number, tx_hash, from_addr, to_addr, value, gas_used, gas_price, transaction_fee,
+             status, transaction_type, input_data_size, timestamp_us, nonce, transaction_index,
+             effective_gas_price, max_fee_per_gas, max_priority_fee_per_gas, tx_type_raw,
+             is_bridge_tx, is_l2) in zip(
+                column("block_number").to_pylist(), column("tx_hash").to_pylist(),
+                column("from_addr").to_pylist(), column("to_addr").to_pylist(),
+                column("value").to_pylist(), column("gas_used").to_pylist(),
+                column("gas_price").to_pylist(), column("transaction_fee").to_pylist(),
+                column("status").to_pylist(), column("transaction_type").to_pylist(),
+                column("input_data_size").to_pylist(), column("timestamp").cast("int64").to_pylist(),
+                column("nonce").to_pylist(), column("transaction_index").to_pylist(),
+                column("effective_gas_price").to_pylist(), column("max_fee_per_gas").to_pylist(),
+                column("max_priority_fee_per_gas").to_pylist(), column("tx_type_raw").to_pylist(),
+                column("is_bridge_tx").to_pylist(), column("is_l2").to_pylist()):
+            # Addresses are raw 20-byte values. Empty tag values are not allowed,
+            # so contract creations omit to_address
+            tags = f",from_address=0x{from_addr.hex()}"
+            if to_addr:
+                tags += f",to_address=0x{to_addr.hex()}"
+            tags += f",transaction_type={transaction_type},status={status}"
+            
+            fields = (
+                f"block_number={block_number}i"
+                f",effective_gas_price={effective_gas_price}i"
+                f",gas_price={gas_price}i"
+                f",gas_used={gas_used}i"
+                f",hash=\"0x{tx_hash.hex()}\""
+                f",input_data_size={input_data_size}i"
+                f",is_bridge_tx={is_bridge_tx}"
+                f",is_l2={is_l2}"
+                f",nonce={nonce}i"
+                f",transaction_fee=\"{transaction_fee}\""
+                f",transaction_index={transaction_index}i"
+                f",tx_type=\"{tx_type_raw}\""
+                f",value=\"{int.from_bytes(value, 'big')}\""
+            )
+            
+            # EIP-1559 fee caps only exist on type 2 transactions
+            if max_fee_per_gas is not None:
+                fields += f",max_fee_per_gas={max_fee_per_gas}i"
+            if max_priority_fee_per_gas is not None:
+                fields += f",max_priority_fee_per_gas={max_priority_fee_per_gas}i"
+            
+            # Rows of one block share its timestamp; offsetting by the transaction
+            # index keeps points with the same tag set from overwriting each other
+            timestamp_ns = timestamp_us // 1_000_000 * 1_000_000_000 + transaction_index
+            append(f"{prefix}{tags} {fields} {timestamp_ns}")
+        
+        self._write_lines(lines, f"processed transaction data for chain {chain_id}")
+    
+    def write_event_batch(self, chain_id: str, batch: Any):
+        """Write a block's processed events (processors.schemas.EVENT_SCHEMA batch) at once."""
+        prefix = "events" + self._get_chain_tag_prefix(chain_id)
+        
+        column = batch.column
+        lines = []
+        append = lines.append
+        for block_number, tx_hash, log_index, contract_addr, topics, data, timestamp_us in zip(
+                column("block_number").to_pylist(), column("tx_hash").to_pylist(),
+                column("log_index").to_pylist(), column("contract_addr").to_pylist(),
+                column("topics").to_pylist(), column("data").to_pylist(),
+                column("timestamp").cast("int64").to_pylist()):
+            tags = f",contract_address=0x{contract_addr.hex()}"
+            if topics:
+                tags += f",event_signature=0x{topics[0].hex()}"
+            for index, topic in enumerate(topics[:4]):
+                tags += f",topic{index}=0x{topic.hex()}"
+            
+            fields = (
+                f"block_number={block_number}i"
+                f",data=\"0x{data.hex()}\""
+                f",log_index={log_index}i"
+                f",transaction_hash=\"0x{tx_hash.hex()}\""
+            )
+            
+            timestamp_ns = timestamp_us // 1_000_000 * 1_000_000_000 + log_index
+            append(f"{prefix}{tags} {fields} {timestamp_ns}")
+        
+        self._write_lines(lines, f"processed event data for chain {chain_id}")
+    
+    def write_token_transfer_batch(self, chain_id: str, batch: Any):
+        """Write a block's token transfers (processors.schemas.TOKEN_TRANSFER_SCHEMA batch) at once."""
+        prefix = "token_transfers" + self._get_chain_tag_prefix(chain_id)
+        
+        column = batch.column
+        lines = []
+        append = lines.append
+        for (block_number, tx_hash, log_index, token_addr, token_standard, from_addr, to_addr, amount,
+             token_id, token_symbol, token_name, token_decimals, timestamp_us) in zip(
+                column("block_number").to_pylist(), column("tx_hash").to_pylist(),
+                column("log_index").to_pylist(), column("token_addr").to_pylist(),
+                column("token_standard").to_pylist(), column("from_addr").to_pylist(),
+                column("to_addr").to_pylist(), column("amount").to_pylist(),
+                column("token_id").to_pylist(), column("token_symbol").to_pylist(),
+                column("token_name").to_pylist(), column("token_decimals").to_pylist(),
+                column("timestamp").cast("int64").to_pylist()):
+            tags = (
+                f",from_address=0x{from_addr.hex()}"
+                f",to_address=0x{to_addr.hex()}"
+                f",token_address=0x{token_addr.hex()}"
+                f",token_standard={token_standard}"
+            )
+            
+            # Raw uint256 amounts are stored as decimal strings
+            fields = (
+                f"amount=\"{int.from_bytes(amount, 'big')}\""
+                f",block_number={block_number}i"
+                f",log_index={log_index}i"
+                f",transaction_hash=\"0x{tx_hash.hex()}\""
+            )
+            
+            # Token metadata if available (token_id for NFTs)
+            if token_decimals is not None:
+                fields += f",token_decimals={token_decimals}i"
+            if token_id is not None:
+                fields += f",token_id=\"{token_id}\""
+            if token_name is not None:
+                fields += f",token_name=\"{token_name.translate(_ESCAPE_FIELD_STRING)}\""
+            if token_symbol is not None:
+                fields += f",token_symbol=\"{token_symbol.translate(_ESCAPE_FIELD_STRING)}\""
+            
+            timestamp_ns = timestamp_us // 1_000_000 * 1_000_000_000 + log_index
+            append(f"{prefix}{tags} {fields} {timestamp_ns}")
+        
+        self._write_lines(lines, f"processed token transfer data for chain {chain_id}")
+    
+    def write_transaction(self, chain_id: str, tx_data: Dict[str, Any], block_number: int, 
+                         status: str = "success", gas_used: int = None):
+        """Write transaction data to InfluxDB with chain context."""
+        self.write_transactions(chain_id, [tx_data], block_number, [status], [gas_used])
+    
+    def write_events(self, chain_id: str, event_rows: List[Dict[str, Any]], block_number: int,
+                     tx_hashes: List[str], timestamp_ns: Optional[int] = None):
+        """Write a list of events from one block as a single line-protocol batch.
+        
+        timestamp_ns is the block's time (now if omitted); each row is offset from it
+        by its log index, so rows sharing a tag set do not overwrite each other.
+        """
+        prefix = "events" + self._get_chain_tag_prefix(chain_id)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        
+        lines = []
+        append = lines.append
+        for event_data, tx_hash in zip(event_rows, tx_hashes):
+            missing = [key for key in _EVENT_KEYS if key not in event_data]
+            if missing:
+                logger.error(f"Skipping event for chain {chain_id}: missing fields {missing}")
+                continue
+            
+            tags = f",contract_address={event_data['address'].lower()}"
             
             # Add topics as tags if available
             topics = event_data.get('topics', [])
-            if len(topics) > 0:
-                point = point.tag("topic0", topics[0])
-            if len(topics) > 1:
-                point = point.tag("topic1", topics[1])
-            if len(topics) > 2:
-                point = point.tag("topic2", topics[2])
-            if len(topics) > 3:
-                point = point.tag("topic3", topics[3])
-                
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+            if topics and topics[0]:
+                tags += f",event_signature={topics[0]}"
+            for index, topic in enumerate(topics[:4]):
+                if topic:
+                    tags += f",topic{index}={topic}"
+            
+            log_index = int(event_data.get('logIndex', '0x0'), 16)
+            fields = (
+                f"block_number={block_number}i"
+                f",data=\"{event_data.get('data', '')}\""
+                f",log_index={log_index}i"
+                f",transaction_hash=\"{tx_hash}\""
+            )
             
-        except Exception as e:
-            logger.error(f"Error writing event data for chain {chain_id}: {e}")
+            append(f"{prefix}{tags} {fields} {timestamp_ns + log_index}")
+        
+        self._write_lines(lines, f"event data for chain {chain_id}")
+    
+    def write_event(self, chain_id: str, event_data: Dict[str, Any], block_number: int, tx_hash: str):
+        """Write event/log data to InfluxDB with chain context."""
+        self.write_events(chain_id, [event_data], block_number, [tx_hash])
     
     def write_token_transfer(self, chain_id: str, transfer_data: Dict[str, Any]):
         """Write token transfer data with chain context."""
+        missing = [key for key in _TOKEN_TRANSFER_KEYS if key not in transfer_data]
+        if missing:
+            logger.error(f"Skipping token transfer for chain {chain_id}: missing fields {missing}")
+            return
+        
+        point = Point.from_dict({
+            "measurement": "token_transfers",
+            "tags": {
+                **self._get_chain_tags(chain_id),
+                "token_address": _address_tag(transfer_data['token_address']),
+                "token_standard": transfer_data.get('standard', 'ERC20'),
+                "from_address": _address_tag(transfer_data['from_address']),
+                "to_address": _address_tag(transfer_data['to_address'])
+            },
+            "fields": {
+                "block_number": transfer_data['block_number'],
+                "transaction_hash": transfer_data['transaction_hash'],
+                "log_index": transfer_data.get('log_index', 0),
+                # Raw uint256 amounts (bytes) are stored as decimal strings
+                "amount": (str(int.from_bytes(transfer_data['amount'], 'big'))
+                           if isinstance(transfer_data['amount'], bytes) else transfer_data['amount']),
+                # Token metadata if available (token_id for NFTs); None fields are skipped
+                "token_name": transfer_data.get('token_name'),
+                "token_symbol": transfer_data.get('token_symbol'),
+                "token_decimals": transfer_data.get('token_decimals'),
+                "token_id": transfer_data.get('token_id')
+            },
+            "time": datetime.utcnow()
+        }, WritePrecision.NS)
+        
         try:
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("token_transfers") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("token_address", transfer_data['token_address'].lower()) \
-                .tag("token_standard", transfer_data.get('standard', 'ERC20')) \
-                .tag("from_address", transfer_data['from_address'].lower()) \
-                .tag("to_address", transfer_data['to_address'].lower()) \
-                .field("block_number", transfer_data['block_number']) \
-                .field("transaction_hash", transfer_data['transaction_hash']) \
-                .field("log_index", transfer_data.get('log_index', 0)) \
-                .field("amount", transfer_data['amount']) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-            
-            # Add token metadata if available
-            if 'token_name' in transfer_data:
-                point = point.field("token_name", transfer_data['token_name'])
-            if 'token_symbol' in transfer_data:
-                point = point.field("token_symbol", transfer_data['token_symbol'])
-            if 'token_decimals' in transfer_data:
-                point = point.field("token_decimals", transfer_data['token_decimals'])
-            if 'token_id' in transfer_data:  # For NFTs
-                point = point.field("token_id", transfer_data['token_id'])
-                
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
+        except _WRITE_ERRORS as e:
             logger.error(f"Error writing token transfer data for chain {chain_id}: {e}")
     
     def write_contract(self, chain_id: str, contract_data: Dict[str, Any]):
         """Write smart contract data with chain context."""
+        missing = [key for key in _CONTRACT_KEYS if key not in contract_data]
+        if missing:
+            logger.error(f"Skipping contract for chain {chain_id}: missing fields {missing}")
+            return
+        
+        point = Point.from_dict({
+            "measurement": "contracts",
+            "tags": {
+                **self._get_chain_tags(chain_id),
+                "contract_address": contract_data['address'].lower(),
+                "contract_type": contract_data.get('type', 'other'),
+                "deployer_address": contract_data.get('deployer', '').lower()
+            },
+            "fields": {
+                "deployment_block": contract_data.get('deployment_block', 0),
+                "deployment_transaction": contract_data.get('deployment_tx', ''),
+                "bytecode_size": contract_data.get('bytecode_size', 0),
+                "is_verified": contract_data.get('is_verified', False)
+            },
+            "time": datetime.utcnow()
+        }, WritePrecision.NS)
+        
         try:
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("contracts") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("contract_address", contract_data['address'].lower()) \
-                .tag("contract_type", contract_data.get('type', 'other')) \
-                .tag("deployer_address", contract_data.get('deployer', '').lower()) \
-                .field("deployment_block", contract_data.get('deployment_block', 0)) \
-                .field("deployment_transaction", contract_data.get('deployment_tx', '')) \
-                .field("bytecode_size", contract_data.get('bytecode_size', 0)) \
-                .field("is_verified", contract_data.get('is_verified', False)) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-                
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
+        except _WRITE_ERRORS as e:
             logger.error(f"Error writing contract data for chain {chain_id}: {e}")
     
     def write_network_metrics(self, chain_id: str, metrics_data: Dict[str, Any], period: str):
         """Write network-wide metrics with chain context."""
+        point = Point.from_dict({
+            "measurement": "network_metrics",
+            "tags": {
+                **self._get_chain_tags(chain_id),
+                "metric_type": period,
+                "period": metrics_data.get('period_id', '')
+            },
+            "fields": {
+                "start_block": metrics_data.get('start_block', 0),
+                "end_block": metrics_data.get('end_block', 0),
+                "avg_block_time": metrics_data.get('avg_block_time', 0.0),
+                "total_transactions": metrics_data.get('total_transactions', 0),
+                "total_gas_used": metrics_data.get('total_gas_used', 0),
+                "avg_gas_price": metrics_data.get('avg_gas_price', 0.0),
+                "active_addresses": metrics_data.get('active_addresses', 0),
+                "new_contracts": metrics_data.get('new_contracts', 0),
+                "total_value_transferred": metrics_data.get('total_value_transferred', '0')
+            },
+            "time": datetime.utcnow()
+        }, WritePrecision.NS)
+        
         try:
-            # Get chain tags
-            chain_tags = self._get_chain_tags(chain_id)
-            
-            point = Point("network_metrics") \
-                .tag("chain_id", chain_tags["chain_id"]) \
-                .tag("chain_name", chain_tags["chain_name"]) \
-                .tag("network", chain_tags["network"]) \
-                .tag("provider", chain_tags["provider"]) \
-                .tag("metric_type", period) \
-                .tag("period", metrics_data.get('period_id', '')) \
-                .field("start_block", metrics_data.get('start_block', 0)) \
-                .field("end_block", metrics_data.get('end_block', 0)) \
-                .field("avg_block_time", metrics_data.get('avg_block_time', 0.0)) \
-                .field("total_transactions", metrics_data.get('total_transactions', 0)) \
-                .field("total_gas_used", metrics_data.get('total_gas_used', 0)) \
-                .field("avg_gas_price", metrics_data.get('avg_gas_price', 0.0)) \
-                .field("active_addresses", metrics_data.get('active_addresses', 0)) \
-                .field("new_contracts", metrics_data.get('new_contracts', 0)) \
-                .field("total_value_transferred", metrics_data.get('total_value_transferred', '0')) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-                
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
+        except _WRITE_ERRORS as e:
             logger.error(f"Error writing network metrics for chain {chain_id}: {e}")
     
     def write_cross_chain_metrics(self, metrics_data: Dict[str, Any]):
         """Write cross-chain comparison metrics."""
+        point = Point("cross_chain_metrics") \
+            .tag("metric_type", metrics_data.get('type', 'comparison')) \
+            .field("chains_compared", orjson.dumps(metrics_data.get('chains', [])).decode()) \
+            .field("total_chains", metrics_data.get('chain_count', 0)) \
+            .field("total_blocks_processed", metrics_data.get('total_blocks', 0)) \
+            .field("total_transactions", metrics_data.get('total_transactions', 0)) \
+            .field("avg_block_time_across_chains", metrics_data.get('avg_block_time', 0.0)) \
+            .field("chain_activity_scores", orjson.dumps(metrics_data.get('activity_scores', {}), option=orjson.OPT_NON_STR_KEYS).decode()) \
+            .time(datetime.utcnow(), WritePrecision.NS)
+        
+        # Add individual chain metrics as separate fields
+        for chain_id, chain_metrics in metrics_data.get('chain_specific', {}).items():
+            point = point.field(f"chain_{chain_id}_latest_block", chain_metrics.get('latest_block', 0))
+            point = point.field(f"chain_{chain_id}_tps", chain_metrics.get('tps', 0.0))
+        
         try:
-            point = Point("cross_chain_metrics") \
-                .tag("metric_type", metrics_data.get('type', 'comparison')) \
-                .field("chains_compared", json.dumps(metrics_data.get('chains', []))) \
-                .field("total_chains", metrics_data.get('chain_count', 0)) \
-                .field("total_blocks_processed", metrics_data.get('total_blocks', 0)) \
-                .field("total_transactions", metrics_data.get('total_transactions', 0)) \
-                .field("avg_block_time_across_chains", metrics_data.get('avg_block_time', 0.0)) \
-                .field("chain_activity_scores", json.dumps(metrics_data.get('activity_scores', {}))) \
-                .time(datetime.utcnow(), WritePrecision.NS)
-            
-            # Add individual chain metrics as separate fields
-            for chain_id, chain_metrics in metrics_data.get('chain_specific', {}).items():
-                point = point.field(f"chain_{chain_id}_latest_block", chain_metrics.get('latest_block', 0))
-                point = point.field(f"chain_{chain_id}_tps", chain_metrics.get('tps', 0.0))
-                
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            
-        except Exception as e:
+        except _WRITE_ERRORS as e:
             logger.error(f"Error writing cross-chain metrics: {e}")
     
     def write_batch(self, points: List[Point]):
         """Write multiple points in batch for efficiency."""
         try:
             self.write_api.write(bucket=self.bucket, org=self.org, record=points)
-        except Exception as e:
+        except _WRITE_ERRORS as e:
             logger.error(f"Error writing batch data: {e}")
     
+    def _latest_block_query(self, chain_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Build the Flux query and params returning the latest stored block number."""
+        params = {"_bucket": self.bucket, "_start": _range_start("30d")}
+        if not chain_id:
+            return _LATEST_BLOCK_FLUX, params
+        
+        params["_chain_id"] = str(self.get_chain_info(chain_id)['chain_id'])
+        return _CHAIN_LATEST_BLOCK_FLUX, params
+    
     def query_latest_block(self, chain_id: Optional[str] = None) -> Optional[int]:
         """Get the latest block number stored in InfluxDB for a specific chain or all chains."""
         try:
-            chain_filter = ""
-            if chain_id:
-                chain_config = self.get_chain_info(chain_id)
-                chain_filter = f'|> filter(fn: (r) => r["chain_id"] == "{chain_config["chain_id"]}")'
+            query, params = self._latest_block_query(chain_id)
+            records = self.query_api.query_stream(org=self.org, query=query, params=params)
             
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: -30d)
-              |> filter(fn: (r) => r["_measurement"] == "blocks")
-              |> filter(fn: (r) => r["_field"] == "block_number")
-              {chain_filter}
-              |> last()
-            '''
-            
-            result = self.query_api.query(org=self.org, query=query)
-            
-            for table in result:
-                for record in table.records:
-                    return int(record.get_value())
+            # Only the first record is needed, so stream instead of building tables
+            for record in records:
+                return int(record.get_value())
                     
         except Exception as e:
             logger.error(f"Error querying latest block for chain {chain_id}: {e}")
             
         return None
     
-    def query_latest_blocks_all_chains(self) -> Dict[str, Optional[int]]:
-        """Get latest block numbers for all configured chains."""
-        latest_blocks = {}
+    async def _query_latest_block_async(self, query_api, chain_id: str) -> Optional[int]:
+        """Get the latest stored block number for a chain using the async query API."""
+        query, params = self._latest_block_query(chain_id)
+        records = await query_api.query_stream(org=self.org, query=query, params=params)
+        
+        async for record in records:
+            return int(record.get_value())
+        
+        return None
+    
+    async def query_latest_blocks_all_chains_async(self) -> Dict[str, Optional[int]]:
+        """Get latest block numbers for all configured chains, querying them concurrently."""
+        chain_ids = list(self.chains.keys())
         
-        for chain_id in self.chains.keys():
-            try:
-                latest_block = self.query_latest_block(chain_id)
-                latest_blocks[chain_id] = latest_block
-            except Exception as e:
-                logger.error(f"Error getting latest block for {chain_id}: {e}")
+        async with InfluxDBClientAsync(url=self.url, token=self.token, org=self.org, enable_gzip=True) as client:
+            query_api = client.query_api()
+            results = await asyncio.gather(
+                *[self._query_latest_block_async(query_api, chain_id) for chain_id in chain_ids],
+                return_exceptions=True
+            )
+        
+        latest_blocks = {}
+        for chain_id, result in zip(chain_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting latest block for {chain_id}: {result}")
                 latest_blocks[chain_id] = None
+            else:
+                latest_blocks[chain_id] = result
         
         return latest_blocks
     
+    def query_latest_blocks_all_chains(self) -> Dict[str, Optional[int]]:
+        """Get latest block numbers for all configured chains (sync wrapper)."""
+        return asyncio.run(self.query_latest_blocks_all_chains_async())
+    
     def query_block_range(self, chain_id: str, start_block: int, end_block: int) -> pd.DataFrame:
         """Query block data for a specific range on a specific chain."""
         try:
-            chain_config = self.get_chain_info(chain_id)
-            
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: -30d)
-              |> filter(fn: (r) => r["_measurement"] == "blocks")
-              |> filter(fn: (r) => r["chain_id"] == "{chain_config['chain_id']}")
-              |> filter(fn: (r) => r["block_number"] >= {start_block} and r["block_number"] <= {end_block})
-            '''
-            
-            result = self.query_api.query_data_frame(org=self.org, query=query)
+            params = {
+                "_bucket": self.bucket,
+                "_start": _range_start("30d"),
+                "_chain_id": str(self.get_chain_info(chain_id)['chain_id']),
+                "_start_block": start_block,
+                "_end_block": end_block
+            }
+            
+            result = self.query_api.query_data_frame(org=self.org, query=_BLOCK_RANGE_FLUX, params=params)
             return result
             
         except Exception as e:
@@ -387,20 +733,13 @@ class MultiChainInfluxDB:
     def query_address_activity(self, address: str, chain_id: Optional[str] = None, days: int = 7) -> pd.DataFrame:
         """Query transaction activity for a specific address, optionally filtered by chain."""
         try:
-            chain_filter = ""
+            params = {"_bucket": self.bucket, "_start": -timedelta(days=days), "_address": address.lower()}
+            query = _ADDRESS_ACTIVITY_FLUX
             if chain_id:
-                chain_config = self.get_chain_info(chain_id)
-                chain_filter = f'|> filter(fn: (r) => r["chain_id"] == "{chain_config["chain_id"]}")'
+                params["_chain_id"] = str(self.get_chain_info(chain_id)['chain_id'])
+                query = _CHAIN_ADDRESS_ACTIVITY_FLUX
             
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: -{days}d)
-              |> filter(fn: (r) => r["_measurement"] == "transactions")
-              {chain_filter}
-              |> filter(fn: (r) => r["from_address"] == "{address.lower()}" or r["to_address"] == "{address.lower()}")
-            '''
-            
-            result = self.query_api.query_data_frame(org=self.org, query=query)
+            result = self.query_api.query_data_frame(org=self.org, query=query, params=params)
             return result
             
         except Exception as e:
@@ -410,73 +749,76 @@ class MultiChainInfluxDB:
     def query_cross_chain_comparison(self, metric: str, timerange: str = "24h") -> pd.DataFrame:
         """Query cross-chain comparison data for a specific metric."""
         try:
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: -{timerange})
-              |> filter(fn: (r) => r["_measurement"] == "network_metrics")
-              |> filter(fn: (r) => r["_field"] == "{metric}")
-              |> group(columns: ["chain_name"])
-              |> aggregateWindow(every: 1h, fn: mean, createEmpty: false)
-            '''
+            params = {"_bucket": self.bucket, "_start": _range_start(timerange), "_metric": metric}
             
-            result = self.query_api.query_data_frame(org=self.org, query=query)
+            result = self.query_api.query_data_frame(org=self.org, query=_CROSS_CHAIN_COMPARISON_FLUX, params=params)
             return result
             
         except Exception as e:
             logger.error(f"Error querying cross-chain comparison: {e}")
             return pd.DataFrame()
     
-    def query_chain_activity_summary(self, timerange: str = "24h") -> Dict[str, Dict[str, Any]]:
-        """Get activity summary for all chains."""
-        summary = {}
+    def _activity_summary_params(self, chain_id: str, timerange: str) -> Dict[str, Any]:
+        """Build the Flux params counting a chain's transactions over a time range."""
+        return {
+            "_bucket": self.bucket,
+            "_start": _range_start(timerange),
+            "_chain_id": str(self.get_chain_info(chain_id)['chain_id'])
+        }
+    
+    async def _query_chain_activity_async(self, query_api, chain_id: str, timerange: str) -> Dict[str, Any]:
+        """Get the activity summary for a single chain using the async query API."""
+        chain_config = self.get_chain_info(chain_id)
+        params = self._activity_summary_params(chain_id, timerange)
+        records = await query_api.query_stream(org=self.org, query=_ACTIVITY_SUMMARY_FLUX, params=params)
+        tx_count = 0
         
-        for chain_id, chain_config in self.chains.items():
-            try:
-                # Query basic metrics for each chain
-                query = f'''
-                from(bucket: "{self.bucket}")
-                  |> range(start: -{timerange})
-                  |> filter(fn: (r) => r["chain_id"] == "{chain_config['chain_id']}")
-                  |> filter(fn: (r) => r["_measurement"] == "transactions")
-                  |> count()
-                '''
-                
-                result = self.query_api.query(org=self.org, query=query)
-                tx_count = 0
-                
-                for table in result:
-                    for record in table.records:
-                        tx_count = record.get_value()
-                        break
-                
-                summary[chain_id] = {
-                    'chain_name': chain_config['name'],
-                    'transaction_count': tx_count,
-                    'provider': chain_config.get('provider', 'unknown')
-                }
-                
-            except Exception as e:
-                logger.error(f"Error getting activity summary for {chain_id}: {e}")
+        async for record in records:
+            tx_count = record.get_value()
+            break
+        
+        return {
+            'chain_name': chain_config['name'],
+            'transaction_count': tx_count,
+            'provider': chain_config.get('provider', 'unknown')
+        }
+    
+    async def query_chain_activity_summary_async(self, timerange: str = "24h") -> Dict[str, Dict[str, Any]]:
+        """Get activity summary for all chains, querying them concurrently."""
+        chain_ids = list(self.chains.keys())
+        
+        async with InfluxDBClientAsync(url=self.url, token=self.token, org=self.org, enable_gzip=True) as client:
+            query_api = client.query_api()
+            results = await asyncio.gather(
+                *[self._query_chain_activity_async(query_api, chain_id, timerange) for chain_id in chain_ids],
+                return_exceptions=True
+            )
+        
+        summary = {}
+        for chain_id, result in zip(chain_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting activity summary for {chain_id}: {result}")
                 summary[chain_id] = {
-                    'chain_name': chain_config['name'],
+                    'chain_name': self.chains[chain_id]['name'],
                     'transaction_count': 0,
-                    'error': str(e)
+                    'error': str(result)
                 }
+            else:
+                summary[chain_id] = result
         
         return summary
     
+    def query_chain_activity_summary(self, timerange: str = "24h") -> Dict[str, Dict[str, Any]]:
+        """Get activity summary for all chains (sync wrapper)."""
+        return asyncio.run(self.query_chain_activity_summary_async(timerange))
+    
     def _classify_transaction(self, tx_data: Dict[str, Any]) -> str:
         """Classify transaction type based on data."""
-        # Simple classification logic
-        if not tx_data.get('to'):
-            return "contract_creation"
-        elif int(tx_data.get('value', '0x0'), 16) > 0:
-            if len(tx_data.get('input', '0x')) > 2:
-                return "contract_call"
-            else:
-                return "transfer"
-        else:
-            return "contract_call"
+        return _TX_CLASS[(
+            not tx_data.get('to'),
+            bool(tx_data.get('value', '0x0').lstrip('0x')),
+            len(tx_data.get('input', '0x')) > 2
+        )]
     
     async def delete_chain_data(self, chain_id: str, measurement: Optional[str] = None, 
                                start_time: str = "1970-01-01T00:00:00Z", end_time: str = None):
@@ -487,14 +829,12 @@ class MultiChainInfluxDB:
             if not end_time:
                 end_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
             
-            delete_api = self.client.delete_api()
-            
             # Build predicate for chain-specific deletion
             predicate = f'chain_id="{chain_config["chain_id"]}"'
             if measurement:
                 predicate = f'_measurement="{measurement}" AND {predicate}'
             
-            delete_api.delete(
+            self.delete_api.delete(
                 start=start_time,
                 stop=end_time,
                 predicate=predicate,
@@ -509,7 +849,9 @@ class MultiChainInfluxDB:
             raise
     
     def close(self):
-        """Close InfluxDB connections."""
+        """Flush queued writes, stop the background writers and close InfluxDB connections."""
+        self._block_writer.close()
+        self._writer.close()
         if self.client:
             self.client.close()
     
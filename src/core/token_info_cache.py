@@ -0,0 +1,146 @@
+"""
+Token Metadata Cache
+
+Two-tier cache for token metadata (symbol, name, decimals): an in-process dict
+in front of a SQLite file, filled in bulk through Multicall3 so every unknown
+token seen in a block is resolved with a single RPC. Token metadata is
+immutable, so entries never expire. A failed aggregate call is not cached;
+the chain is only left alone for MULTICALL_RETRY_INTERVAL seconds.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from eth_abi import decode as abi_decode
+
+from .config import Config
+from .multichain_client import MultiChainClient
+
+logger = logging.getLogger(__name__)
+
+# name() and symbol() are shared by ERC-20 and most NFT contracts
+SYMBOL_SELECTOR = "0x95d89b41"
+NAME_SELECTOR = "0x06fdde03"
+DECIMALS_SELECTOR = "0x313ce567"
+
+# Keep each aggregate eth_call comfortably below provider calldata/gas limits
+MAX_TOKENS_PER_MULTICALL = 300
+SQLITE_MAX_PARAMS = 500
+
+DEFAULT_CACHE_PATH = "~/.cache/blockchain_data/tokens.db"
+
+# Seconds before retrying Multicall3 on a chain where the aggregate call failed
+MULTICALL_RETRY_INTERVAL = 60.0
+
+
+def _decode_string(data: Optional[bytes]) -> Optional[str]:
+    """Decode a string return value, tolerating legacy bytes32 tokens (e.g. MKR)"""
+    if not data:
+        return None
+    try:
+        return abi_decode(['string'], data)[0]
+    except Exception:
+        if len(data) == 32:
+            return data.rstrip(b"\x00").decode("utf-8", errors="ignore") or None
+        return None
+
+
+def _decode_decimals(data: Optional[bytes]) -> Optional[int]:
+    """Decode a uint8 decimals() return value"""
+    if not data or len(data) < 32:
+        return None
+    decimals = int.from_bytes(data[:32], "big")
+    return decimals if decimals <= 255 else None
+
+
+class TokenInfoCache:
+    """In-memory + SQLite cache of token metadata keyed by (chain_id, raw 20-byte address)"""
+
+    def __init__(self, config: Config):
+        path = os.path.expanduser(config.get('performance.token_cache_path', DEFAULT_CACHE_PATH))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._memory: Dict[Tuple[str, bytes], Dict[str, Any]] = {}
+        # Per chain, the monotonic time before which Multicall3 is not retried
+        self._retry_at: Dict[str, float] = {}
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS token_info ("
+            "chain_id TEXT NOT NULL, address BLOB NOT NULL, symbol TEXT, name TEXT, "
+            "decimals INTEGER, fetched_at INTEGER NOT NULL, PRIMARY KEY (chain_id, address))"
+        )
+        self._db.commit()
+
+    def get(self, chain_id: str, token_address: bytes) -> Dict[str, Any]:
+        """Get cached token info (empty dict if the token has not been resolved)"""
+        return self._memory.get((chain_id, token_address), {})
+
+    async def warm(self, chain_id: str, token_addresses: Iterable[bytes], client: MultiChainClient):
+        """Resolve every token not yet in memory from disk, then via Multicall3"""
+        unknown = [address for address in set(token_addresses) if (chain_id, address) not in self._memory]
+        if not unknown:
+            return
+
+        unknown = self._load_from_disk(chain_id, unknown)
+
+        for i in range(0, len(unknown), MAX_TOKENS_PER_MULTICALL):
+            if time.monotonic() < self._retry_at.get(chain_id, 0.0):
+                return
+            await self._fetch(chain_id, unknown[i:i + MAX_TOKENS_PER_MULTICALL], client)
+
+    def _load_from_disk(self, chain_id: str, addresses: List[bytes]) -> List[bytes]:
+        """Load known tokens into memory and return the addresses still missing"""
+        for i in range(0, len(addresses), SQLITE_MAX_PARAMS):
+            chunk = addresses[i:i + SQLITE_MAX_PARAMS]
+            rows = self._db.execute(
+                "SELECT address, symbol, name, decimals FROM token_info "
+                f"WHERE chain_id = ? AND address IN ({','.join('?' * len(chunk))})",
+                [chain_id, *chunk]
+            )
+            for address, symbol, name, decimals in rows:
+                self._memory[(chain_id, address)] = {
+                    'symbol': symbol, 'name': name, 'decimals': decimals
+                }
+
+        return [address for address in addresses if (chain_id, address) not in self._memory]
+
+    async def _fetch(self, chain_id: str, addresses: List[bytes], client: MultiChainClient):
+        """Fetch symbol/name/decimals for a batch of tokens in one aggregate call"""
+        calls = []
+        for address in addresses:
+            calls.extend([(address, SYMBOL_SELECTOR), (address, NAME_SELECTOR), (address, DECIMALS_SELECTOR)])
+
+        results = await client.multicall3(chain_id, calls)
+
+        if results is None:
+            # Aggregate call failed (transient error or no Multicall3 on this chain):
+            # leave the tokens unknown and back off instead of asking on every block
+            logger.debug(f"Token metadata lookup failed on {chain_id}, "
+                         f"retrying in {MULTICALL_RETRY_INTERVAL:.0f}s")
+            self._retry_at[chain_id] = time.monotonic() + MULTICALL_RETRY_INTERVAL
+            return
+
+        fetched_at = int(time.time())
+        rows = []
+        for i, address in enumerate(addresses):
+            symbol, name, decimals = results[3 * i:3 * i + 3]
+            # Contracts that revert on these calls are stored with NULLs
+            # (negative cache) so they are never queried again
+            info = {
+                'symbol': _decode_string(symbol),
+                'name': _decode_string(name),
+                'decimals': _decode_decimals(decimals)
+            }
+            self._memory[(chain_id, address)] = info
+            rows.append((chain_id, address, info['symbol'], info['name'],
+                         info['decimals'], fetched_at))
+
+        self._db.executemany("INSERT OR REPLACE INTO token_info VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._db.commit()
+
+    def close(self):
+        """Close the on-disk cache"""
+        self._db.close()
@@ -0,0 +1,69 @@
+"""
+UDP Line-Protocol Writer
+
+Write API for the batching writers that sends line-protocol records to an
+InfluxDB UDP listener instead of POSTing them over HTTP. Records are packed
+into datagrams of at most max_datagram_size bytes; nothing is acknowledged,
+so records can be lost, which suits replays that a checkpoint restart can
+repeat. The listener decides the target database and expects nanosecond
+timestamps, so bucket and org are ignored and coarser timestamps are scaled.
+"""
+
+import logging
+import socket
+from typing import Any, List
+
+from influxdb_client import WritePrecision
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UDP_PORT = 8089
+# Fits a 1500 byte Ethernet MTU after IP and UDP headers
+DEFAULT_DATAGRAM_SIZE = 1400
+
+# Zeros appended to a record's trailing timestamp to make it nanoseconds
+_TO_NANOSECONDS = {
+    WritePrecision.NS: b"",
+    WritePrecision.US: b"000",
+    WritePrecision.MS: b"000000",
+    WritePrecision.S: b"000000000",
+}
+
+
+class UdpLineProtocolWriteApi:
+    """Sends line-protocol records to an InfluxDB UDP listener in MTU-sized datagrams."""
+
+    def __init__(self, host: str, port: int = DEFAULT_UDP_PORT,
+                 max_datagram_size: int = DEFAULT_DATAGRAM_SIZE):
+        self.address = (host, port)
+        self.max_datagram_size = max_datagram_size
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    @classmethod
+    def from_config(cls, config: Any) -> "UdpLineProtocolWriteApi":
+        """Create a UDP write API using the influxdb.udp_* settings of a Config."""
+        return cls(
+            config.get('influxdb.udp_host', 'localhost'),
+            config.get('influxdb.udp_port', DEFAULT_UDP_PORT),
+            config.get('influxdb.udp_max_datagram_size', DEFAULT_DATAGRAM_SIZE),
+        )
+
+    def write(self, bucket: str, org: str, record: List[str],
+              write_precision: str = WritePrecision.NS):
+        """Send records (each ending in its timestamp) as newline-separated datagrams."""
+        suffix = _TO_NANOSECONDS[write_precision]
+        datagram = bytearray()
+        for line in record:
+            data = line.encode() + suffix
+            if datagram and len(datagram) + 1 + len(data) > self.max_datagram_size:
+                self._socket.sendto(datagram, self.address)
+                datagram.clear()
+            if datagram:
+                datagram += b"\n"
+            datagram += data
+        if datagram:
+            self._socket.sendto(datagram, self.address)
+
+    def close(self):
+        """Close the UDP socket."""
+        self._socket.close()
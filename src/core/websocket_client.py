@@ -0,0 +1,167 @@
+"""
+WebSocket JSON-RPC Client
+Multiplexes all JSON-RPC calls over one persistent WebSocket connection and
+follows the chain tip with an eth_subscribe(newHeads) subscription instead of
+polling. Falls back to the HTTP transport of BlockchainClient whenever the
+WebSocket is unavailable (no ws_url, library not installed, or connection lost).
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import Optional, Dict, Any, List
+
+import orjson
+
+from .blockchain_client import BlockchainClient
+
+# Optional WebSocket transport
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    websockets = None
+    WEBSOCKETS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketBlockchainClient(BlockchainClient):
+    """BlockchainClient that sends JSON-RPC requests over a single WebSocket."""
+
+    def __init__(self, config_or_rpc_url = None,
+                 ws_url: Optional[str] = None,
+                 max_connections: int = 20,
+                 timeout: int = 30):
+        super().__init__(config_or_rpc_url, ws_url, max_connections, timeout)
+
+        # Connection state; responses are matched to their request by id
+        self._ws = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+
+        # newHeads subscription, created on the first wait_for_new_head call
+        self._new_heads_id: Optional[str] = None
+        self._new_head = asyncio.Event()
+
+    async def connect(self) -> bool:
+        """Open the WebSocket (if configured), then test the connection as usual."""
+        if self._ws is None and self.ws_url and WEBSOCKETS_AVAILABLE:
+            try:
+                self._ws = await websockets.connect(self.ws_url, max_size=None, open_timeout=self.timeout)
+                self._reader_task = asyncio.create_task(self._read_loop())
+                logger.info(f"Connected to JSON-RPC WebSocket at {self.ws_url}")
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                logger.warning(f"WebSocket connection to {self.ws_url} failed, using HTTP: {e}")
+                self._ws = None
+
+        return await super().connect()
+
+    async def _read_loop(self):
+        """Resolve pending requests and record subscription notifications as messages arrive."""
+        try:
+            async for message in self._ws:
+                body = orjson.loads(message)
+                for item in body if isinstance(body, list) else [body]:
+                    if item.get("method") == "eth_subscription":
+                        if item["params"].get("subscription") == self._new_heads_id:
+                            self._new_head.set()
+                        continue
+
+                    future = self._pending.pop(item.get("id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(item)
+
+        except websockets.exceptions.ConnectionClosed as e:
+            logger.warning(f"JSON-RPC WebSocket closed, falling back to HTTP: {e}")
+        finally:
+            ws, self._ws = self._ws, None
+            self._new_heads_id = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("JSON-RPC WebSocket closed"))
+            self._pending.clear()
+            await ws.close()
+
+    async def _send(self, requests: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Send requests in one frame and wait for their responses (None on timeout)."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            request["id"] = next(self._request_ids)
+            futures.append(self._pending.setdefault(request["id"], loop.create_future()))
+
+        try:
+            # Sent as a text frame; not every node accepts binary JSON-RPC frames
+            await self._ws.send(orjson.dumps(requests if len(requests) > 1 else requests[0]).decode())
+            done, _ = await asyncio.wait(futures, timeout=self.timeout)
+        finally:
+            for request in requests:
+                self._pending.pop(request["id"], None)
+
+        return [future.result() if future in done and not future.exception() else None for future in futures]
+
+    async def _make_rpc_request(self, method: str, params: List = None) -> Optional[Dict[str, Any]]:
+        """Send one JSON-RPC request over the WebSocket, or over HTTP without one."""
+        if self._ws is None:
+            return await super()._make_rpc_request(method, params)
+
+        self._rate_limit()
+
+        try:
+            [response] = await self._send([{"jsonrpc": "2.0", "method": method, "params": params or []}])
+        except Exception as e:
+            logger.error(f"Exception in WebSocket RPC call {method}: {e}")
+            return None
+
+        if response is None:
+            logger.error(f"Timed out waiting for WebSocket RPC response to {method}")
+        return response
+
+    async def _make_batch_rpc_call(self, method: str, params_list: List[List]) -> List[Optional[Any]]:
+        """Make one JSON-RPC batch request over the WebSocket, or over HTTP without one."""
+        if self._ws is None or not params_list:
+            return await super()._make_batch_rpc_call(method, params_list)
+
+        self._rate_limit()
+
+        try:
+            responses = await self._send([
+                {"jsonrpc": "2.0", "method": method, "params": params} for params in params_list
+            ])
+        except Exception as e:
+            logger.error(f"Exception in batched WebSocket RPC call {method}: {e}")
+            return [None] * len(params_list)
+
+        results = []
+        for response in responses:
+            if response is not None and "error" in response:
+                logger.error(f"RPC error for {method}: {response['error']}")
+            results.append(response.get("result") if response is not None else None)
+
+        return results
+
+    async def wait_for_new_head(self, timeout: float):
+        """Return when the node announces a new block, or after timeout seconds."""
+        if self._ws is None:
+            return await super().wait_for_new_head(timeout)
+
+        if self._new_heads_id is None:
+            self._new_heads_id = await self._make_rpc_call("eth_subscribe", ["newHeads"])
+            if self._new_heads_id is None:
+                return await super().wait_for_new_head(timeout)
+
+        try:
+            await asyncio.wait_for(self._new_head.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._new_head.clear()
+
+    def close(self):
+        """Close the WebSocket and the HTTP session."""
+        if self._reader_task is not None:
+            # The reader closes the socket as it exits
+            self._reader_task.cancel()
+            self._reader_task = None
+        super().close()
@@ -6,34 +6,92 @@ handling chain-specific logic, protocols, and data extraction patterns.
 """
 
 import asyncio
+import gc
 import logging
-from typing import Dict, List, Optional, Any, Set, Union
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
-import json
 import re
 
+import pyarrow as pa
 from web3 import Web3
 from web3.types import BlockData, TxData, LogReceipt
 
+from ..core.blockchain_client import full_transactions
 from ..core.config import Config
 from ..core.multichain_client import MultiChainClient
 from ..core.multichain_influxdb_client import MultiChainInfluxDB
+from ..core.token_info_cache import TokenInfoCache
+from .schemas import transactions_to_record_batch, events_to_record_batch, token_transfers_to_record_batch
+from .signature_registry import (
+    TRANSFER_SIGNATURE, TRANSFER_SINGLE_SIGNATURE, TRANSFER_BATCH_SIGNATURE, TRANSFER_DECODERS
+)
 
 logger = logging.getLogger(__name__)
 
+# uint256 amounts are carried as their raw 32-byte big-endian encoding (the same
+# bytes the EVM emits); use int.from_bytes(value, "big") where a number is needed
+UINT256_ZERO = bytes(32)
+UINT256_ONE = (1).to_bytes(32, "big")
 
-@dataclass
+
+# Addresses are carried as their raw 20 bytes from the RPC boundary on: less than
+# half the size of the 42-char hex string and compared with a single memcmp.
+# Use to_hex() where the display form is needed (tags, logs)
+def address_bytes(address: Optional[str]) -> Optional[bytes]:
+    """Convert a 0x-prefixed hex address to raw bytes (None/empty stays None)"""
+    return bytes.fromhex(address[2:]) if address else None
+
+
+def to_hex(address: Optional[bytes]) -> Optional[str]:
+    """Lowercase 0x-prefixed display form of a raw address"""
+    return "0x" + address.hex() if address is not None else None
+
+
+# Addresses decoded from indexed topics, shared across events. Busy blocks repeat
+# the same senders/receivers many times, so most lookups return an existing object
+_topic_addresses: Dict[str, bytes] = {}
+_TOPIC_ADDRESS_CACHE_SIZE = 65536
+
+
+def topic_address(topic: str) -> bytes:
+    """Extract the raw 20-byte address from a 32-byte indexed topic"""
+    address = _topic_addresses.get(topic)
+    if address is None:
+        if len(_topic_addresses) >= _TOPIC_ADDRESS_CACHE_SIZE:
+            _topic_addresses.clear()
+        address = _topic_addresses[topic] = bytes.fromhex(topic[-40:])  # Last 40 chars (20 bytes)
+    return address
+
+
+def _to_int(value: Union[int, str]) -> int:
+    """Coerce a JSON-RPC quantity (0x-prefixed hex string) or an int to int"""
+    if isinstance(value, int):
+        return value
+    return int(value, 16) if value.startswith("0x") else int(value)
+
+
+def _uint256_bytes(value: Union[int, str]) -> bytes:
+    """Convert a hex quantity (or int) to its raw 32-byte big-endian form"""
+    if isinstance(value, int):
+        return value.to_bytes(32, "big")
+    return bytes.fromhex(value[2:].zfill(64))
+
+
+@dataclass(slots=True, frozen=True)
 class ProcessedTransaction:
     """Standardized transaction data across chains"""
     chain_id: str
     block_number: int
     transaction_hash: str
-    from_address: str
-    to_address: Optional[str]
-    value: str  # Native currency value as string
+    from_address: Optional[bytes]  # Raw 20-byte addresses
+    to_address: Optional[bytes]
+    value: bytes  # Native currency value, raw uint256 (32 bytes big-endian)
     gas_used: int
     gas_price: int
     transaction_fee: str
@@ -41,19 +99,24 @@ class ProcessedTransaction:
     transaction_type: str
     input_data_size: int
     timestamp: datetime
-    
-    # Chain-specific additional data
-    extras: Dict[str, Any]
+    nonce: int
+    transaction_index: int
+    effective_gas_price: int
+    max_fee_per_gas: Optional[int]  # EIP-1559 transactions only
+    max_priority_fee_per_gas: Optional[int]
+    tx_type_raw: str  # Envelope type as reported by the node, e.g. "0x2"
+    is_bridge_tx: bool
+    is_l2: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessedEvent:
     """Standardized event/log data across chains"""
     chain_id: str
     block_number: int
     transaction_hash: str
     log_index: int
-    contract_address: str
+    contract_address: bytes  # Raw 20-byte address
     event_signature: str
     topics: List[str]
     data: str
@@ -61,18 +124,18 @@ class ProcessedEvent:
     timestamp: datetime
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class ProcessedTokenTransfer:
     """Standardized token transfer data"""
     chain_id: str
     block_number: int
     transaction_hash: str
     log_index: int
-    token_address: str
+    token_address: bytes  # Raw 20-byte addresses
     token_standard: str  # ERC20, ERC721, ERC1155
-    from_address: str
-    to_address: str
-    amount: str
+    from_address: bytes
+    to_address: bytes
+    amount: bytes  # Raw uint256 (32 bytes big-endian)
     token_id: Optional[str]  # For NFTs
     token_symbol: Optional[str]
     token_name: Optional[str]
@@ -83,195 +146,361 @@ class ProcessedTokenTransfer:
 class BaseChainProcessor(ABC):
     """Abstract base class for chain-specific processors"""
     
-    def __init__(self, chain_id: str, config: Config, multichain_client: MultiChainClient):
-        self.chain_id = chain_id
+    # Chain-specific transfer decoders, merged over the shared registry:
+    # {(topic0, topic count): method name}
+    extra_transfer_decoders: Dict[Tuple[str, int], str] = {}
+    
+    # Whether the transaction fee is charged at effectiveGasPrice (when present)
+    fee_uses_effective_gas_price = True
+    
+    # Whether this chain is a layer 2 rollup
+    is_l2 = False
+    
+    def __init__(self, chain_id: str, config: Config, multichain_client: MultiChainClient,
+                 token_cache: Optional[TokenInfoCache] = None):
+        # Interned: every row this processor emits references the same object
+        self.chain_id = sys.intern(chain_id)
         self.config = config
         self.client = multichain_client
         self.chain_config = config.chains.get(chain_id, {})
         self.chain_name = self.chain_config.get('name', chain_id)
+        # Shared between processors by their owner; opened on first use without one
+        self.token_cache = token_cache
+        
+        # Raw bridge contract addresses (transactions to them are bridge_transaction)
+        self._bridge_addrs: frozenset = frozenset()
         
         # Token contract signatures for events
-        self.erc20_transfer_signature = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-        self.erc721_transfer_signature = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-        self.erc1155_single_signature = "0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62"
-        self.erc1155_batch_signature = "0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb"
+        self.erc20_transfer_signature = TRANSFER_SIGNATURE
+        self.erc721_transfer_signature = TRANSFER_SIGNATURE
+        self.erc1155_single_signature = TRANSFER_SINGLE_SIGNATURE
+        self.erc1155_batch_signature = TRANSFER_BATCH_SIGNATURE
+        
+        # Bind the transfer decoders once (see signature_registry)
+        self._transfer_decoders = {
+            key: getattr(self, method_name)
+            for key, method_name in {**TRANSFER_DECODERS, **self.extra_transfer_decoders}.items()
+        }
         
+    @staticmethod
+    def _input_size(input_data: str) -> int:
+        """Calldata size in bytes of a 0x-prefixed hex string"""
+        return max(0, (len(input_data) - 2) >> 1)
+    
     @abstractmethod
     async def process_block(self, block_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process a block and return processed data"""
         pass
     
-    @abstractmethod
-    async def process_transaction(self, tx_data: Dict[str, Any], block_data: Dict[str, Any]) -> ProcessedTransaction:
-        """Process a transaction and return standardized data"""
-        pass
+    async def process_transaction(self, tx_data: Dict[str, Any], block_timestamp: datetime,
+                                  block_number: int) -> ProcessedTransaction:
+        """Process a transaction and return standardized data
+        
+        The block timestamp and number are decoded once per block by the caller
+        (see process_block) and shared by every transaction in it. Chains differ
+        only in their bridge addresses, fee rule and layer, which subclasses set
+        through _bridge_addrs, fee_uses_effective_gas_price and is_l2 rather
+        than re-implementing this method.
+        """
+        to_address = address_bytes(tx_data.get("to"))
+        input_data = tx_data.get("input") or "0x"
+        
+        if not to_address:  # Contract creation
+            tx_type = "contract_creation"
+        elif to_address in self._bridge_addrs:
+            tx_type = "bridge_transaction"
+        elif input_data != "0x":
+            tx_type = "contract_call"
+        else:
+            tx_type = "transfer"
+        
+        # Calculate transaction fee (EIP-1559 chains pay the effective gas price)
+        gas_used = _to_int(tx_data.get("gasUsed", 0))
+        gas_price = _to_int(tx_data.get("gasPrice", 0))
+        effective_gas_price = gas_price
+        if "effectiveGasPrice" in tx_data:
+            effective_gas_price = _to_int(tx_data["effectiveGasPrice"])
+        
+        fee_gas_price = effective_gas_price if self.fee_uses_effective_gas_price else gas_price
+        
+        max_fee_per_gas = tx_data.get("maxFeePerGas")
+        max_priority_fee_per_gas = tx_data.get("maxPriorityFeePerGas")
+        
+        return ProcessedTransaction(
+            chain_id=self.chain_id,
+            block_number=block_number,
+            transaction_hash=tx_data.get("hash", ""),
+            from_address=address_bytes(tx_data.get("from")),
+            to_address=to_address,
+            value=_uint256_bytes(tx_data.get("value", 0)),
+            gas_used=gas_used,
+            gas_price=gas_price,
+            transaction_fee=str(gas_used * fee_gas_price),
+            status="success" if tx_data.get("status") == "0x1" else "failed",
+            transaction_type=tx_type,
+            input_data_size=self._input_size(input_data),
+            timestamp=block_timestamp,
+            nonce=_to_int(tx_data.get("nonce", 0)),
+            transaction_index=_to_int(tx_data.get("transactionIndex", 0)),
+            effective_gas_price=effective_gas_price,
+            max_fee_per_gas=_to_int(max_fee_per_gas) if max_fee_per_gas is not None else None,
+            max_priority_fee_per_gas=(
+                _to_int(max_priority_fee_per_gas) if max_priority_fee_per_gas is not None else None
+            ),
+            tx_type_raw=tx_data.get("type", "0x0"),
+            is_bridge_tx=tx_type == "bridge_transaction",
+            is_l2=self.is_l2
+        )
     
-    @abstractmethod
     async def process_events(self, tx_receipt: Optional[Dict[str, Any]], 
-                           block_data: Dict[str, Any]) -> List[ProcessedEvent]:
-        """Process transaction events/logs"""
-        pass
+                           block_timestamp: datetime, block_number: int) -> List[ProcessedEvent]:
+        """Process transaction events/logs (default EVM implementation)"""
+        if not tx_receipt or "logs" not in tx_receipt:
+            return []
+        
+        return self._events_from_logs(tx_receipt["logs"], block_timestamp, block_number)
+    
+    def _events_from_logs(self, logs: List[Dict[str, Any]], block_timestamp: datetime,
+                          block_number: int) -> List[ProcessedEvent]:
+        """Build event rows for a list of raw logs in one tight synchronous loop"""
+        events = []
+        append = events.append
+        chain_id = self.chain_id
+        intern = sys.intern
+        
+        for log in logs:
+            topics = log.get("topics")
+            if not topics:
+                continue
+            
+            try:
+                # Positional in ProcessedEvent field order. A block repeats a handful of
+                # signatures across thousands of logs; interning topic0 shares one string
+                # per signature and lets the decoder table lookup match by identity
+                append(ProcessedEvent(
+                    chain_id,
+                    block_number,
+                    log.get("transactionHash", ""),
+                    _to_int(log.get("logIndex", 0)),
+                    bytes.fromhex(log.get("address", "0x")[2:]),
+                    intern(topics[0]),
+                    topics,
+                    log.get("data", ""),
+                    None,  # decoded_data: would implement ABI decoding
+                    block_timestamp
+                ))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.error(f"Error processing {self.chain_name} event: {e}")
+        
+        return events
+    
+    async def decode_block_batches(self, transactions: List[Dict[str, Any]],
+                                   receipts: List[Optional[Dict[str, Any]]], block_timestamp: datetime,
+                                   block_number: int) -> Tuple[pa.RecordBatch, pa.RecordBatch, List[ProcessedEvent]]:
+        """Decode a block's transactions and logs into columnar batches (pure CPU work, no network access)
+        
+        Also returns the events a transfer decoder handles, as rows: transfers need
+        the token metadata cache and client, so they are extracted by the caller.
+        """
+        processed_txs = []
+        events = []
+        transfer_events = []
+        decoders = self._transfer_decoders
+        
+        for tx_data, tx_receipt in zip(transactions, receipts):
+            processed_txs.append(await self.process_transaction(tx_data, block_timestamp, block_number))
+            for event in await self.process_events(tx_receipt, block_timestamp, block_number):
+                events.append(event)
+                if (event.event_signature, len(event.topics)) in decoders:
+                    transfer_events.append(event)
+        
+        return (transactions_to_record_batch(self.chain_id, processed_txs),
+                events_to_record_batch(self.chain_id, events), transfer_events)
+    
+    async def process_block_batches(self, transactions: List[Dict[str, Any]],
+                                    receipts: List[Optional[Dict[str, Any]]], block_timestamp: datetime,
+                                    block_number: int) -> Tuple[pa.RecordBatch, pa.RecordBatch, pa.RecordBatch]:
+        """Decode a block's transactions, events and token transfers into columnar batches"""
+        processed_txs, events, transfers = await self.process_block_full(
+            transactions, receipts, block_timestamp, block_number
+        )
+        return (transactions_to_record_batch(self.chain_id, processed_txs),
+                events_to_record_batch(self.chain_id, events),
+                token_transfers_to_record_batch(self.chain_id, transfers))
+    
+    async def process_block_full(self, transactions: List[Dict[str, Any]],
+                                 receipts: List[Optional[Dict[str, Any]]], block_timestamp: datetime,
+                                 block_number: int) -> Tuple[List[ProcessedTransaction], List[ProcessedEvent],
+                                                             List[ProcessedTokenTransfer]]:
+        """Decode a block's transactions, events and token transfers in one pass
+        
+        Each event is classified for transfer decoding as it is produced, so the
+        block's logs are walked once instead of once to build rows and again to
+        find transfers.
+        """
+        processed_txs = []
+        events = []
+        matched = []
+        decoders = self._transfer_decoders
+        
+        for tx_data, tx_receipt in zip(transactions, receipts):
+            processed_txs.append(await self.process_transaction(tx_data, block_timestamp, block_number))
+            for event in await self.process_events(tx_receipt, block_timestamp, block_number):
+                events.append(event)
+                decode = decoders.get((event.event_signature, len(event.topics)))
+                if decode:
+                    matched.append((decode, event))
+        
+        return processed_txs, events, await self._decode_transfer_events(matched)
     
     async def process_token_transfers(self, events: List[ProcessedEvent]) -> List[ProcessedTokenTransfer]:
         """Extract token transfers from events (default EVM implementation)"""
-        transfers = []
+        # Classify events first so all unknown token metadata is fetched in one
+        # multicall and the decoders run as one synchronous pass
+        decoders = self._transfer_decoders
+        matched = []
         
         for event in events:
+            decode = decoders.get((event.event_signature, len(event.topics)))
+            if decode:
+                matched.append((decode, event))
+        
+        return await self._decode_transfer_events(matched)
+    
+    async def _decode_transfer_events(self, matched: List[Tuple[Callable, ProcessedEvent]]) -> List[ProcessedTokenTransfer]:
+        """Decode (decoder, event) pairs into transfers, fetching unknown token metadata first"""
+        if matched:
+            if self.token_cache is None:
+                self.token_cache = TokenInfoCache(self.config)
+            await self.token_cache.warm(
+                self.chain_id, {event.contract_address for _, event in matched}, self.client
+            )
+        
+        # Decoders validate shape with plain checks and raise only on malformed
+        # hex; a single handler skips such events and resumes the same iterator,
+        # logging once per batch rather than once per bad event
+        transfers = []
+        failed = 0
+        last_error = None
+        remaining = iter(matched)
+        while True:
             try:
-                # ERC-20 Transfer
-                if (event.event_signature == self.erc20_transfer_signature and 
-                    len(event.topics) == 3):  # Transfer(from, to, value)
-                    
-                    transfer = await self._process_erc20_transfer(event)
-                    if transfer:
-                        transfers.append(transfer)
-                
-                # ERC-721 Transfer (same signature as ERC-20 but different topic structure)
-                elif (event.event_signature == self.erc721_transfer_signature and 
-                      len(event.topics) == 4):  # Transfer(from, to, tokenId)
-                    
-                    transfer = await self._process_erc721_transfer(event)
-                    if transfer:
-                        transfers.append(transfer)
-                
-                # ERC-1155 Transfers
-                elif event.event_signature == self.erc1155_single_signature:
-                    transfer = await self._process_erc1155_single_transfer(event)
-                    if transfer:
-                        transfers.append(transfer)
-                
-                elif event.event_signature == self.erc1155_batch_signature:
-                    batch_transfers = await self._process_erc1155_batch_transfer(event)
-                    transfers.extend(batch_transfers)
-                    
-            except Exception as e:
-                logger.error(f"Error processing token transfer from event: {e}")
-                continue
+                for decode, event in remaining:
+                    result = decode(event, self._get_token_info(event.contract_address))
+                    if isinstance(result, list):
+                        transfers.extend(result)
+                    elif result:
+                        transfers.append(result)
+                break
+            except (IndexError, TypeError, ValueError) as e:
+                failed += 1
+                last_error = e
+        
+        if failed:
+            logger.error(f"Skipped {failed} malformed {self.chain_name} token transfer event(s), last error: {last_error}")
         
         return transfers
     
-    async def _process_erc20_transfer(self, event: ProcessedEvent) -> Optional[ProcessedTokenTransfer]:
+    def _process_erc20_transfer(self, event: ProcessedEvent, token_info: Dict[str, Any]) -> Optional[ProcessedTokenTransfer]:
         """Process ERC-20 transfer event"""
-        try:
-            # Decode topics: [signature, from, to]
-            from_address = "0x" + event.topics[1][-40:]  # Last 40 chars (20 bytes)
-            to_address = "0x" + event.topics[2][-40:]
-            
-            # Decode data (value)
-            value = int(event.data, 16) if event.data and event.data != "0x" else 0
-            
-            # Try to get token info
-            token_info = await self._get_token_info(event.contract_address)
-            
-            return ProcessedTokenTransfer(
-                chain_id=self.chain_id,
-                block_number=event.block_number,
-                transaction_hash=event.transaction_hash,
-                log_index=event.log_index,
-                token_address=event.contract_address,
-                token_standard="ERC20",
-                from_address=from_address,
-                to_address=to_address,
-                amount=str(value),
-                token_id=None,
-                token_symbol=token_info.get('symbol'),
-                token_name=token_info.get('name'),
-                token_decimals=token_info.get('decimals'),
-                timestamp=event.timestamp
-            )
-            
-        except Exception as e:
-            logger.error(f"Error processing ERC-20 transfer: {e}")
-            return None
+        # Decode topics: [signature, from, to]
+        from_address = topic_address(event.topics[1])
+        to_address = topic_address(event.topics[2])
+        
+        # Data is the ABI-encoded uint256 value, already in the raw form we store
+        amount = bytes.fromhex(event.data[2:].zfill(64)) if event.data and event.data != "0x" else UINT256_ZERO
+        
+        return ProcessedTokenTransfer(
+            chain_id=self.chain_id,
+            block_number=event.block_number,
+            transaction_hash=event.transaction_hash,
+            log_index=event.log_index,
+            token_address=event.contract_address,
+            token_standard="ERC20",
+            from_address=from_address,
+            to_address=to_address,
+            amount=amount,
+            token_id=None,
+            token_symbol=token_info.get('symbol'),
+            token_name=token_info.get('name'),
+            token_decimals=token_info.get('decimals'),
+            timestamp=event.timestamp
+        )
     
-    async def _process_erc721_transfer(self, event: ProcessedEvent) -> Optional[ProcessedTokenTransfer]:
+    def _process_erc721_transfer(self, event: ProcessedEvent, token_info: Dict[str, Any]) -> Optional[ProcessedTokenTransfer]:
         """Process ERC-721 transfer event"""
-        try:
-            # Decode topics: [signature, from, to, tokenId]
-            from_address = "0x" + event.topics[1][-40:]
-            to_address = "0x" + event.topics[2][-40:]
-            token_id = str(int(event.topics[3], 16))
-            
-            # Try to get token info
-            token_info = await self._get_token_info(event.contract_address)
-            
-            return ProcessedTokenTransfer(
-                chain_id=self.chain_id,
-                block_number=event.block_number,
-                transaction_hash=event.transaction_hash,
-                log_index=event.log_index,
-                token_address=event.contract_address,
-                token_standard="ERC721",
-                from_address=from_address,
-                to_address=to_address,
-                amount="1",  # NFTs are always quantity 1
-                token_id=token_id,
-                token_symbol=token_info.get('symbol'),
-                token_name=token_info.get('name'),
-                token_decimals=None,
-                timestamp=event.timestamp
-            )
-            
-        except Exception as e:
-            logger.error(f"Error processing ERC-721 transfer: {e}")
-            return None
+        # Decode topics: [signature, from, to, tokenId]
+        from_address = topic_address(event.topics[1])
+        to_address = topic_address(event.topics[2])
+        token_id = str(int(event.topics[3], 16))
+        
+        return ProcessedTokenTransfer(
+            chain_id=self.chain_id,
+            block_number=event.block_number,
+            transaction_hash=event.transaction_hash,
+            log_index=event.log_index,
+            token_address=event.contract_address,
+            token_standard="ERC721",
+            from_address=from_address,
+            to_address=to_address,
+            amount=UINT256_ONE,  # NFTs are always quantity 1
+            token_id=token_id,
+            token_symbol=token_info.get('symbol'),
+            token_name=token_info.get('name'),
+            token_decimals=None,
+            timestamp=event.timestamp
+        )
     
-    async def _process_erc1155_single_transfer(self, event: ProcessedEvent) -> Optional[ProcessedTokenTransfer]:
+    def _process_erc1155_single_transfer(self, event: ProcessedEvent, token_info: Dict[str, Any]) -> Optional[ProcessedTokenTransfer]:
         """Process ERC-1155 single transfer event"""
-        try:
-            # TransferSingle(operator, from, to, id, value)
-            # Topics: [signature, operator, from, to]
-            from_address = "0x" + event.topics[2][-40:]
-            to_address = "0x" + event.topics[3][-40:]
-            
-            # Decode data: id (32 bytes) + value (32 bytes)
-            if len(event.data) >= 130:  # 0x + 64 + 64 chars
-                token_id = str(int(event.data[2:66], 16))  # First 32 bytes
-                amount = str(int(event.data[66:130], 16))  # Second 32 bytes
-            else:
-                return None
-            
-            token_info = await self._get_token_info(event.contract_address)
-            
-            return ProcessedTokenTransfer(
-                chain_id=self.chain_id,
-                block_number=event.block_number,
-                transaction_hash=event.transaction_hash,
-                log_index=event.log_index,
-                token_address=event.contract_address,
-                token_standard="ERC1155",
-                from_address=from_address,
-                to_address=to_address,
-                amount=amount,
-                token_id=token_id,
-                token_symbol=token_info.get('symbol'),
-                token_name=token_info.get('name'),
-                token_decimals=None,
-                timestamp=event.timestamp
-            )
-            
-        except Exception as e:
-            logger.error(f"Error processing ERC-1155 single transfer: {e}")
+        # Data: id (32 bytes) + value (32 bytes) = 0x + 64 + 64 chars
+        if len(event.data) < 130:
             return None
+        
+        # TransferSingle(operator, from, to, id, value)
+        # Topics: [signature, operator, from, to]
+        from_address = topic_address(event.topics[2])
+        to_address = topic_address(event.topics[3])
+        
+        # One native hex decode of both words, then byte slices of the result
+        words = bytes.fromhex(event.data[2:130])
+        token_id = str(int.from_bytes(words[:32], "big"))  # First 32 bytes
+        amount = words[32:]  # Second 32 bytes
+        
+        return ProcessedTokenTransfer(
+            chain_id=self.chain_id,
+            block_number=event.block_number,
+            transaction_hash=event.transaction_hash,
+            log_index=event.log_index,
+            token_address=event.contract_address,
+            token_standard="ERC1155",
+            from_address=from_address,
+            to_address=to_address,
+            amount=amount,
+            token_id=token_id,
+            token_symbol=token_info.get('symbol'),
+            token_name=token_info.get('name'),
+            token_decimals=None,
+            timestamp=event.timestamp
+        )
     
-    async def _process_erc1155_batch_transfer(self, event: ProcessedEvent) -> List[ProcessedTokenTransfer]:
+    def _process_erc1155_batch_transfer(self, event: ProcessedEvent, token_info: Dict[str, Any]) -> List[ProcessedTokenTransfer]:
         """Process ERC-1155 batch transfer event"""
         # Implementation would be more complex, parsing array data
         # For now, return empty list
         return []
     
-    async def _get_token_info(self, token_address: str) -> Dict[str, Any]:
-        """Get token information (symbol, name, decimals) - should be cached"""
-        # TODO: Implement token info caching and retrieval
-        # This would involve calling the token contract's methods
-        return {}
+    def _get_token_info(self, token_address: bytes) -> Dict[str, Any]:
+        """Get cached token information (symbol, name, decimals)"""
+        return self.token_cache.get(self.chain_id, token_address)
 
 
 class EthereumProcessor(BaseChainProcessor):
     """Ethereum Mainnet specialized processor"""
     
-    def __init__(self, config: Config, multichain_client: MultiChainClient):
-        super().__init__("ethereum", config, multichain_client)
+    def __init__(self, config: Config, multichain_client: MultiChainClient,
+                 token_cache: Optional[TokenInfoCache] = None):
+        super().__init__("ethereum", config, multichain_client, token_cache)
         
         # Ethereum-specific configurations
         self.supports_eip1559 = True
@@ -286,20 +515,20 @@ class EthereumProcessor(BaseChainProcessor):
         """Process Ethereum block with EIP-1559 support"""
         
         processed = {
-            "block_number": int(block_data.get("number", 0)),
-            "timestamp": datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            "gas_limit": int(block_data.get("gasLimit", 0)),
-            "gas_used": int(block_data.get("gasUsed", 0)),
+            "block_number": _to_int(block_data.get("number", 0)),
+            "timestamp": datetime.fromtimestamp(_to_int(block_data.get("timestamp", 0)), timezone.utc),
+            "gas_limit": _to_int(block_data.get("gasLimit", 0)),
+            "gas_used": _to_int(block_data.get("gasUsed", 0)),
             "transaction_count": len(block_data.get("transactions", [])),
-            "size": int(block_data.get("size", 0)),
+            "size": _to_int(block_data.get("size", 0)),
             "miner": block_data.get("miner", ""),
-            "difficulty": str(block_data.get("difficulty", 0)),
-            "total_difficulty": str(block_data.get("totalDifficulty", 0)),
+            "difficulty": str(_to_int(block_data.get("difficulty", 0))),
+            "total_difficulty": str(_to_int(block_data.get("totalDifficulty", 0))),
         }
         
         # EIP-1559 specific fields
         if "baseFeePerGas" in block_data:
-            processed["base_fee_per_gas"] = int(block_data["baseFeePerGas"])
+            processed["base_fee_per_gas"] = _to_int(block_data["baseFeePerGas"])
         
         # Calculate gas utilization
         gas_limit = processed["gas_limit"]
@@ -312,100 +541,13 @@ class EthereumProcessor(BaseChainProcessor):
         
         return processed
     
-    async def process_transaction(self, tx_data: Dict[str, Any], block_data: Dict[str, Any]) -> ProcessedTransaction:
-        """Process Ethereum transaction with EIP-1559 support"""
-        
-        # Determine transaction type
-        tx_type = "transfer"
-        to_address = tx_data.get("to")
-        input_data = tx_data.get("input", "0x")
-        
-        if not to_address:  # Contract creation
-            tx_type = "contract_creation"
-        elif input_data and input_data != "0x":
-            tx_type = "contract_call"
-        
-        # Calculate transaction fee
-        gas_used = int(tx_data.get("gasUsed", 0))
-        gas_price = int(tx_data.get("gasPrice", 0))
-        
-        # For EIP-1559 transactions
-        effective_gas_price = gas_price
-        if "effectiveGasPrice" in tx_data:
-            effective_gas_price = int(tx_data["effectiveGasPrice"])
-        
-        transaction_fee = str(gas_used * effective_gas_price)
-        
-        # Get transaction status from receipt
-        status = "success" if tx_data.get("status") == "0x1" else "failed"
-        
-        return ProcessedTransaction(
-            chain_id=self.chain_id,
-            block_number=int(block_data.get("number", 0)),
-            transaction_hash=tx_data.get("hash", ""),
-            from_address=tx_data.get("from", ""),
-            to_address=to_address,
-            value=str(int(tx_data.get("value", 0))),
-            gas_used=gas_used,
-            gas_price=gas_price,
-            transaction_fee=transaction_fee,
-            status=status,
-            transaction_type=tx_type,
-            input_data_size=len(input_data) // 2 - 1 if input_data.startswith("0x") else len(input_data) // 2,
-            timestamp=datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            extras={
-                "nonce": int(tx_data.get("nonce", 0)),
-                "transaction_index": int(tx_data.get("transactionIndex", 0)),
-                "effective_gas_price": effective_gas_price,
-                "max_fee_per_gas": int(tx_data.get("maxFeePerGas", 0)) if "maxFeePerGas" in tx_data else None,
-                "max_priority_fee_per_gas": int(tx_data.get("maxPriorityFeePerGas", 0)) if "maxPriorityFeePerGas" in tx_data else None,
-                "type": tx_data.get("type", "0x0")
-            }
-        )
-    
-    async def process_events(self, tx_receipt: Optional[Dict[str, Any]], 
-                           block_data: Dict[str, Any]) -> List[ProcessedEvent]:
-        """Process Ethereum transaction events/logs"""
-        events = []
-        
-        if not tx_receipt or "logs" not in tx_receipt:
-            return events
-        
-        block_timestamp = datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc)
-        
-        for log in tx_receipt["logs"]:
-            try:
-                topics = log.get("topics", [])
-                if not topics:
-                    continue
-                
-                event = ProcessedEvent(
-                    chain_id=self.chain_id,
-                    block_number=int(log.get("blockNumber", 0)),
-                    transaction_hash=log.get("transactionHash", ""),
-                    log_index=int(log.get("logIndex", 0)),
-                    contract_address=log.get("address", ""),
-                    event_signature=topics[0] if topics else "",
-                    topics=topics,
-                    data=log.get("data", ""),
-                    decoded_data=None,  # Would implement ABI decoding
-                    timestamp=block_timestamp
-                )
-                
-                events.append(event)
-                
-            except Exception as e:
-                logger.error(f"Error processing Ethereum event: {e}")
-                continue
-        
-        return events
-
 
 class PolygonProcessor(BaseChainProcessor):
     """Polygon (MATIC) specialized processor"""
     
-    def __init__(self, config: Config, multichain_client: MultiChainClient):
-        super().__init__("polygon", config, multichain_client)
+    def __init__(self, config: Config, multichain_client: MultiChainClient,
+                 token_cache: Optional[TokenInfoCache] = None):
+        super().__init__("polygon", config, multichain_client, token_cache)
         
         # Polygon-specific configurations
         self.supports_eip1559 = True
@@ -414,6 +556,7 @@ class PolygonProcessor(BaseChainProcessor):
             "erc20_predicate": "0x40ec5B33f54e0E8A33A975908C5BA1c14e5BbbDf",
             "erc721_predicate": "0xE6F45A4F72bF6b6b6a2Bb00c8a8b6cC9e23CE9B1"
         }
+        self._bridge_addrs = frozenset(address_bytes(addr) for addr in self.pos_bridge_contracts.values())
         self.known_dexes = {
             "quickswap": "0x5757371414417b8C6CAad45bAeF941aBc7d3Ab32",
             "sushiswap": "0xc35DADB65012eC5796536bD9864eD8773aBc74C4",
@@ -424,12 +567,12 @@ class PolygonProcessor(BaseChainProcessor):
         """Process Polygon block with PoS-specific metrics"""
         
         processed = {
-            "block_number": int(block_data.get("number", 0)),
-            "timestamp": datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            "gas_limit": int(block_data.get("gasLimit", 0)),
-            "gas_used": int(block_data.get("gasUsed", 0)),
+            "block_number": _to_int(block_data.get("number", 0)),
+            "timestamp": datetime.fromtimestamp(_to_int(block_data.get("timestamp", 0)), timezone.utc),
+            "gas_limit": _to_int(block_data.get("gasLimit", 0)),
+            "gas_used": _to_int(block_data.get("gasUsed", 0)),
             "transaction_count": len(block_data.get("transactions", [])),
-            "size": int(block_data.get("size", 0)),
+            "size": _to_int(block_data.get("size", 0)),
             "miner": block_data.get("miner", ""),  # Actually validator in PoS
         }
         
@@ -439,63 +582,20 @@ class PolygonProcessor(BaseChainProcessor):
         
         # EIP-1559 support
         if "baseFeePerGas" in block_data:
-            processed["base_fee_per_gas"] = int(block_data["baseFeePerGas"])
+            processed["base_fee_per_gas"] = _to_int(block_data["baseFeePerGas"])
         
         return processed
     
-    async def process_transaction(self, tx_data: Dict[str, Any], block_data: Dict[str, Any]) -> ProcessedTransaction:
-        """Process Polygon transaction (similar to Ethereum but with different gas economics)"""
-        
-        # Similar to Ethereum but with Polygon-specific considerations
-        tx_type = "transfer"
-        to_address = tx_data.get("to")
-        input_data = tx_data.get("input", "0x")
-        
-        if not to_address:
-            tx_type = "contract_creation"
-        elif to_address.lower() in [addr.lower() for addr in self.pos_bridge_contracts.values()]:
-            tx_type = "bridge_transaction"
-        elif input_data and input_data != "0x":
-            tx_type = "contract_call"
-        
-        gas_used = int(tx_data.get("gasUsed", 0))
-        gas_price = int(tx_data.get("gasPrice", 0))
-        effective_gas_price = int(tx_data.get("effectiveGasPrice", gas_price))
-        
-        return ProcessedTransaction(
-            chain_id=self.chain_id,
-            block_number=int(block_data.get("number", 0)),
-            transaction_hash=tx_data.get("hash", ""),
-            from_address=tx_data.get("from", ""),
-            to_address=to_address,
-            value=str(int(tx_data.get("value", 0))),
-            gas_used=gas_used,
-            gas_price=gas_price,
-            transaction_fee=str(gas_used * effective_gas_price),
-            status="success" if tx_data.get("status") == "0x1" else "failed",
-            transaction_type=tx_type,
-            input_data_size=len(input_data) // 2 - 1 if input_data.startswith("0x") else len(input_data) // 2,
-            timestamp=datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            extras={
-                "nonce": int(tx_data.get("nonce", 0)),
-                "transaction_index": int(tx_data.get("transactionIndex", 0)),
-                "effective_gas_price": effective_gas_price,
-                "is_bridge_tx": tx_type == "bridge_transaction"
-            }
-        )
-    
     async def process_events(self, tx_receipt: Optional[Dict[str, Any]], 
-                           block_data: Dict[str, Any]) -> List[ProcessedEvent]:
+                           block_timestamp: datetime, block_number: int) -> List[ProcessedEvent]:
         """Process Polygon events with bridge detection"""
-        events = await super().process_events(tx_receipt, block_data)
+        events = await super().process_events(tx_receipt, block_timestamp, block_number)
         
         # Add Polygon-specific event processing (bridge events, etc.)
-        for event in events:
-            if event.contract_address.lower() in [addr.lower() for addr in self.pos_bridge_contracts.values()]:
-                # This is a bridge-related event
-                if event.decoded_data is None:
-                    event.decoded_data = {}
-                event.decoded_data["is_bridge_event"] = True
+        for i, event in enumerate(events):
+            if event.contract_address in self._bridge_addrs:
+                # This is a bridge-related event (rows are frozen, so swap in a copy)
+                events[i] = replace(event, decoded_data={**(event.decoded_data or {}), "is_bridge_event": True})
         
         return events
 
@@ -503,8 +603,12 @@ class PolygonProcessor(BaseChainProcessor):
 class BaseProcessor(BaseChainProcessor):
     """Base (Coinbase L2) specialized processor"""
     
-    def __init__(self, config: Config, multichain_client: MultiChainClient):
-        super().__init__("base", config, multichain_client)
+    fee_uses_effective_gas_price = False
+    is_l2 = True
+    
+    def __init__(self, config: Config, multichain_client: MultiChainClient,
+                 token_cache: Optional[TokenInfoCache] = None):
+        super().__init__("base", config, multichain_client, token_cache)
         
         # Base-specific configurations
         self.supports_eip1559 = True
@@ -513,17 +617,18 @@ class BaseProcessor(BaseChainProcessor):
             "l1_standard_bridge": "0x3154Cf16ccdb4C6d922629664174b904d80F2C35",
             "l2_standard_bridge": "0x4200000000000000000000000000000000000010"
         }
+        self._bridge_addrs = frozenset(address_bytes(addr) for addr in self.l1_bridge_contracts.values())
     
     async def process_block(self, block_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process Base block with L2-specific metrics"""
         
         processed = {
-            "block_number": int(block_data.get("number", 0)),
-            "timestamp": datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            "gas_limit": int(block_data.get("gasLimit", 0)),
-            "gas_used": int(block_data.get("gasUsed", 0)),
+            "block_number": _to_int(block_data.get("number", 0)),
+            "timestamp": datetime.fromtimestamp(_to_int(block_data.get("timestamp", 0)), timezone.utc),
+            "gas_limit": _to_int(block_data.get("gasLimit", 0)),
+            "gas_used": _to_int(block_data.get("gasUsed", 0)),
             "transaction_count": len(block_data.get("transactions", [])),
-            "size": int(block_data.get("size", 0)),
+            "size": _to_int(block_data.get("size", 0)),
             "miner": block_data.get("miner", ""),  # Sequencer
         }
         
@@ -536,56 +641,20 @@ class BaseProcessor(BaseChainProcessor):
         
         return processed
     
-    async def process_transaction(self, tx_data: Dict[str, Any], block_data: Dict[str, Any]) -> ProcessedTransaction:
-        """Process Base transaction with L2-specific considerations"""
-        
-        tx_type = "transfer"
-        to_address = tx_data.get("to")
-        input_data = tx_data.get("input", "0x")
-        
-        if not to_address:
-            tx_type = "contract_creation"
-        elif to_address.lower() in [addr.lower() for addr in self.l1_bridge_contracts.values()]:
-            tx_type = "bridge_transaction"
-        elif input_data and input_data != "0x":
-            tx_type = "contract_call"
-        
-        gas_used = int(tx_data.get("gasUsed", 0))
-        gas_price = int(tx_data.get("gasPrice", 0))
-        
-        return ProcessedTransaction(
-            chain_id=self.chain_id,
-            block_number=int(block_data.get("number", 0)),
-            transaction_hash=tx_data.get("hash", ""),
-            from_address=tx_data.get("from", ""),
-            to_address=to_address,
-            value=str(int(tx_data.get("value", 0))),
-            gas_used=gas_used,
-            gas_price=gas_price,
-            transaction_fee=str(gas_used * gas_price),
-            status="success" if tx_data.get("status") == "0x1" else "failed",
-            transaction_type=tx_type,
-            input_data_size=len(input_data) // 2 - 1 if input_data.startswith("0x") else len(input_data) // 2,
-            timestamp=datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            extras={
-                "nonce": int(tx_data.get("nonce", 0)),
-                "transaction_index": int(tx_data.get("transactionIndex", 0)),
-                "is_l2": True,
-                "is_bridge_tx": tx_type == "bridge_transaction"
-            }
-        )
-    
     async def process_events(self, tx_receipt: Optional[Dict[str, Any]], 
-                           block_data: Dict[str, Any]) -> List[ProcessedEvent]:
+                           block_timestamp: datetime, block_number: int) -> List[ProcessedEvent]:
         """Process Base events with L2 bridge detection"""
-        return await super().process_events(tx_receipt, block_data)
+        return await super().process_events(tx_receipt, block_timestamp, block_number)
 
 
 class GLQProcessor(BaseChainProcessor):
     """GraphLinq Chain specialized processor"""
     
-    def __init__(self, config: Config, multichain_client: MultiChainClient):
-        super().__init__("glq", config, multichain_client)
+    fee_uses_effective_gas_price = False
+    
+    def __init__(self, config: Config, multichain_client: MultiChainClient,
+                 token_cache: Optional[TokenInfoCache] = None):
+        super().__init__("glq", config, multichain_client, token_cache)
         
         # GLQ-specific configurations
         self.supports_eip1559 = False  # Check actual GLQ implementation
@@ -597,12 +666,12 @@ class GLQProcessor(BaseChainProcessor):
         """Process GLQ block with chain-specific metrics"""
         
         processed = {
-            "block_number": int(block_data.get("number", 0)),
-            "timestamp": datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            "gas_limit": int(block_data.get("gasLimit", 0)),
-            "gas_used": int(block_data.get("gasUsed", 0)),
+            "block_number": _to_int(block_data.get("number", 0)),
+            "timestamp": datetime.fromtimestamp(_to_int(block_data.get("timestamp", 0)), timezone.utc),
+            "gas_limit": _to_int(block_data.get("gasLimit", 0)),
+            "gas_used": _to_int(block_data.get("gasUsed", 0)),
             "transaction_count": len(block_data.get("transactions", [])),
-            "size": int(block_data.get("size", 0)),
+            "size": _to_int(block_data.get("size", 0)),
             "miner": block_data.get("miner", ""),
         }
         
@@ -612,70 +681,57 @@ class GLQProcessor(BaseChainProcessor):
         
         return processed
     
-    async def process_transaction(self, tx_data: Dict[str, Any], block_data: Dict[str, Any]) -> ProcessedTransaction:
-        """Process GLQ transaction with chain-specific logic"""
-        
-        tx_type = "transfer"
-        to_address = tx_data.get("to")
-        input_data = tx_data.get("input", "0x")
-        
-        if not to_address:
-            tx_type = "contract_creation"
-        elif input_data and input_data != "0x":
-            tx_type = "contract_call"
-        
-        gas_used = int(tx_data.get("gasUsed", 0))
-        gas_price = int(tx_data.get("gasPrice", 0))
-        
-        return ProcessedTransaction(
-            chain_id=self.chain_id,
-            block_number=int(block_data.get("number", 0)),
-            transaction_hash=tx_data.get("hash", ""),
-            from_address=tx_data.get("from", ""),
-            to_address=to_address,
-            value=str(int(tx_data.get("value", 0))),
-            gas_used=gas_used,
-            gas_price=gas_price,
-            transaction_fee=str(gas_used * gas_price),
-            status="success" if tx_data.get("status") == "0x1" else "failed",
-            transaction_type=tx_type,
-            input_data_size=len(input_data) // 2 - 1 if input_data.startswith("0x") else len(input_data) // 2,
-            timestamp=datetime.fromtimestamp(int(block_data.get("timestamp", 0)), timezone.utc),
-            extras={
-                "nonce": int(tx_data.get("nonce", 0)),
-                "transaction_index": int(tx_data.get("transactionIndex", 0)),
-                "is_glq_native": True
-            }
-        )
-    
     async def process_events(self, tx_receipt: Optional[Dict[str, Any]], 
-                           block_data: Dict[str, Any]) -> List[ProcessedEvent]:
+                           block_timestamp: datetime, block_number: int) -> List[ProcessedEvent]:
         """Process GLQ events"""
-        return await super().process_events(tx_receipt, block_data)
+        return await super().process_events(tx_receipt, block_timestamp, block_number)
 
 
 class ChainProcessorFactory:
     """Factory for creating chain-specific processors"""
     
-    @staticmethod
-    def create_processor(chain_id: str, config: Config, multichain_client: MultiChainClient) -> BaseChainProcessor:
-        """Create appropriate processor for the given chain"""
-        
-        processor_map = {
-            "ethereum": EthereumProcessor,
-            "polygon": PolygonProcessor,
-            "base": BaseProcessor,
-            "avalanche": EthereumProcessor,  # Use Ethereum processor for Avalanche C-Chain (EVM compatible)
-            "bsc": EthereumProcessor,       # Use Ethereum processor for BSC (EVM compatible)
-            "glq": GLQProcessor
-        }
+    _REGISTRY: ClassVar[Dict[str, Type[BaseChainProcessor]]] = {
+        "ethereum": EthereumProcessor,
+        "polygon": PolygonProcessor,
+        "base": BaseProcessor,
+        "avalanche": EthereumProcessor,  # Use Ethereum processor for Avalanche C-Chain (EVM compatible)
+        "bsc": EthereumProcessor,       # Use Ethereum processor for BSC (EVM compatible)
+        "glq": GLQProcessor
+    }
+    
+    @classmethod
+    def register(cls, chain_id: str, processor_class: Type[BaseChainProcessor]):
+        """Register (or override) the processor class used for a chain"""
+        cls._REGISTRY[chain_id] = processor_class
+    
+    @classmethod
+    def create_processor(cls, chain_id: str, config: Config, multichain_client: MultiChainClient,
+                         token_cache: Optional[TokenInfoCache] = None) -> BaseChainProcessor:
+        """Create appropriate processor for the given chain (sharing token_cache if given)"""
         
-        processor_class = processor_map.get(chain_id, BaseChainProcessor)
+        processor_class = cls._REGISTRY.get(chain_id, BaseChainProcessor)
         
         if processor_class == BaseChainProcessor:
             logger.warning(f"No specific processor found for chain {chain_id}, using base processor")
         
-        return processor_class(config, multichain_client)
+        return processor_class(config, multichain_client, token_cache)
+
+
+# Per-process processors used by CPU pool workers (created on first use)
+_worker_processors: Dict[str, BaseChainProcessor] = {}
+
+
+def _decode_block_in_worker(chain_id: str, config: Config, transactions: List[Dict[str, Any]],
+                            receipts: List[Optional[Dict[str, Any]]], block_timestamp: datetime,
+                            block_number: int) -> Tuple[pa.RecordBatch, pa.RecordBatch, List[ProcessedEvent]]:
+    """Decode a block inside a CPU pool worker process (batches pickle as a few buffers)"""
+    processor = _worker_processors.get(chain_id)
+    if processor is None:
+        # Decoding never touches the network, so worker processors need no client
+        processor = ChainProcessorFactory.create_processor(chain_id, config, None)
+        _worker_processors[chain_id] = processor
+    
+    return asyncio.run(processor.decode_block_batches(transactions, receipts, block_timestamp, block_number))
 
 
 # Enhanced Multi-Chain Processor using specialized processors
@@ -687,8 +743,20 @@ class EnhancedMultiChainProcessor:
         self.multichain_client: Optional[MultiChainClient] = None
         self.db_client: Optional[MultiChainInfluxDB] = None
         
-        # Chain processors
+        # Chain processors, sharing one token metadata cache
         self.processors: Dict[str, BaseChainProcessor] = {}
+        self.token_cache: Optional[TokenInfoCache] = None
+        
+        # Optional process pool for block decoding (0 = decode on the event loop).
+        # Worth enabling for large blocks, where decode time outweighs pickling cost
+        self.decode_workers = config.get('processing.decode_workers', 0)
+        if self.decode_workers == "auto":
+            self.decode_workers = os.cpu_count() or 1
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Blocks in flight per chain, so a busy chain cannot flood its RPC provider
+        self.max_workers = max(1, config.get('processing.max_workers', 8))
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
         
     async def initialize(self):
         """Initialize the enhanced processor"""
@@ -701,72 +769,142 @@ class EnhancedMultiChainProcessor:
         await self.db_client.connect()
         
         # Create specialized processors for each connected chain
+        self.token_cache = TokenInfoCache(self.config)
         for chain_id in self.multichain_client.get_connected_chains():
             processor = ChainProcessorFactory.create_processor(
-                chain_id, self.config, self.multichain_client
+                chain_id, self.config, self.multichain_client, self.token_cache
             )
             self.processors[chain_id] = processor
+            self._semaphores[chain_id] = asyncio.Semaphore(self.max_workers)
+        
+        if self.decode_workers:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=self.decode_workers)
+        
+        # Every block allocates thousands of short-lived, acyclic rows, each of which
+        # counts towards the next cyclic GC pass. Move the long-lived startup objects
+        # out of the collector's reach and let more allocations pass between
+        # collections (performance.gc_threshold) instead of recycling row objects
+        gc.freeze()
+        _, *older_thresholds = gc.get_threshold()
+        gc.set_threshold(self.config.get('performance.gc_threshold', 700), *older_thresholds)
             
         logger.info(f"Initialized enhanced processor with {len(self.processors)} chain processors")
     
     async def process_block_enhanced(self, chain_id: str, block_number: int) -> bool:
-        """Process a single block using the chain-specific processor"""
+        """Process a single block using the chain-specific processor (at most max_workers per chain at once)"""
         
         if chain_id not in self.processors:
             logger.error(f"No processor available for chain {chain_id}")
             return False
         
-        try:
-            processor = self.processors[chain_id]
-            
-            # Get block data
-            block_data = await self.multichain_client.get_block(chain_id, block_number, True)
-            if not block_data:
-                logger.error(f"Failed to get block {block_number} from {chain_id}")
-                return False
-            
-            # Process block
-            processed_block = await processor.process_block(block_data)
-            
-            # Write block to database
-            await self.db_client.write_block(chain_id, processed_block)
-            
-            # Process transactions
-            for tx_data in block_data.get("transactions", []):
-                if isinstance(tx_data, dict):  # Full transaction data
-                    
-                    # Get transaction receipt for events
-                    tx_receipt = await self.multichain_client.get_transaction_receipt(
-                        chain_id, tx_data["hash"]
+        async with self._semaphores[chain_id]:
+            try:
+                processor = self.processors[chain_id]
+                
+                # Get block data and all of its receipts concurrently
+                block_data, block_receipts = await asyncio.gather(
+                    self.multichain_client.get_block(chain_id, block_number, True),
+                    self.multichain_client.get_block_receipts(chain_id, block_number)
+                )
+                if not block_data:
+                    logger.error(f"Failed to get block {block_number} from {chain_id}")
+                    return False
+                
+                # Process block (decodes the timestamp shared by all its transactions)
+                processed_block = await processor.process_block(block_data)
+                block_timestamp = processed_block["timestamp"]
+                
+                # Write block to database (the writer takes the raw RPC block)
+                self.db_client.write_block(chain_id, block_data)
+                
+                # Match receipts to transactions (batched per hash where the node lacks
+                # eth_getBlockReceipts)
+                transactions = full_transactions(block_data)
+                if block_receipts is None and transactions:
+                    block_receipts = await self.multichain_client.get_receipts_batch(
+                        chain_id, [tx_data["hash"] for tx_data in transactions]
                     )
-                    
-                    # Process transaction
-                    processed_tx = await processor.process_transaction(tx_data, block_data)
-                    await self.db_client.write_transaction(
-                        chain_id, processed_tx.__dict__, processed_tx.block_number, processed_tx.status
+                receipts_by_hash = {receipt["transactionHash"]: receipt for receipt in block_receipts or () if receipt}
+                receipts = [receipts_by_hash.get(tx_data["hash"]) for tx_data in transactions]
+                
+                # Transactions share no state once decoded, so the whole block's events
+                # go through transfer extraction together: one token metadata warm-up
+                # instead of one await per transaction, written in block order
+                if self._cpu_pool:
+                    # Decode off the event loop; the worker returns columnar batches plus
+                    # the transfer events as rows, since token transfers need the token
+                    # metadata cache and client and are extracted here
+                    tx_batch, event_batch, transfer_events = await asyncio.get_running_loop().run_in_executor(
+                        self._cpu_pool, _decode_block_in_worker,
+                        chain_id, self.config, transactions, receipts, block_timestamp, block_number
                     )
-                    
-                    # Process events
-                    events = await processor.process_events(tx_receipt, block_data)
-                    for event in events:
-                        await self.db_client.write_event(chain_id, event.__dict__)
-                    
-                    # Process token transfers
-                    transfers = await processor.process_token_transfers(events)
-                    for transfer in transfers:
-                        await self.db_client.write_token_transfer(chain_id, transfer.__dict__)
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error processing block {block_number} on {chain_id}: {e}")
-            return False
+                    transfer_batch = token_transfers_to_record_batch(
+                        chain_id, await processor.process_token_transfers(transfer_events)
+                    )
+                else:
+                    tx_batch, event_batch, transfer_batch = await processor.process_block_batches(
+                        transactions, receipts, block_timestamp, block_number
+                    )
+                
+                # One line-protocol batch per row type, formatted column by column
+                self.db_client.write_transaction_batch(chain_id, tx_batch)
+                self.db_client.write_event_batch(chain_id, event_batch)
+                self.db_client.write_token_transfer_batch(chain_id, transfer_batch)
+                
+                return True
+                
+            except Exception as e:
+                logger.error(f"Error processing block {block_number} on {chain_id}: {e}")
+                return False
+    
+    async def process_blocks_range(self, chain_id: str, start_block: int, end_block: int) -> Dict[int, bool]:
+        """Process a range of blocks on one chain with max_workers workers fed from a bounded queue"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_workers)
+        results: Dict[int, bool] = {}
+        
+        async def worker():
+            while True:
+                block_number = await queue.get()
+                if block_number is None:
+                    return
+                results[block_number] = await self.process_block_enhanced(chain_id, block_number)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_workers)]
+        try:
+            for block_number in range(start_block, end_block + 1):
+                await queue.put(block_number)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+        
+        return results
+    
+    async def process_blocks_all_chains(self, block_numbers: Dict[str, int]) -> Dict[str, bool]:
+        """Process one block per chain concurrently"""
+        chain_ids = list(block_numbers)
+        results = await asyncio.gather(*(
+            self.process_block_enhanced(chain_id, block_numbers[chain_id]) for chain_id in chain_ids
+        ))
+        return dict(zip(chain_ids, results))
     
     async def shutdown(self):
         """Shutdown the enhanced processor"""
         
-        if self.multichain_client:
-            await self.multichain_client.close()
-        
-        if self.db_client:
-            await self.db_client.close()
\ No newline at end of file
+        try:
+            if self.multichain_client:
+                await self.multichain_client.close()
+            
+            if self.db_client:
+                self.db_client.close()
+        finally:
+            # Worker processes outlive the run unless the pool is shut down
+            if self._cpu_pool:
+                self._cpu_pool.shutdown()
+                self._cpu_pool = None
+            
+            if self.token_cache:
+                self.token_cache.close()
+                self.token_cache = None
\ No newline at end of file
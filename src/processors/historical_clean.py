@@ -13,9 +13,11 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.blockchain_client import BlockchainClient
+from core.blockchain_client import BlockchainClient, full_transactions
 from core.influxdb_client import BlockchainInfluxDB
 from core.config import Config
+from core.checkpoint import BlockCheckpoint
+from core.event_loop import install_uvloop
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from rich.table import Table
@@ -23,6 +25,9 @@ from rich.table import Table
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress bar updates
+UI_UPDATE_INTERVAL = 0.5
+
 
 class HistoricalProcessor:
     """Processes historical blockchain data with parallel batching."""
@@ -41,6 +46,10 @@ class HistoricalProcessor:
         self.batch_size = config.processing_batch_size
         self.max_workers = config.processing_max_workers
         
+        # Append-only resume checkpoint, read at startup instead of querying InfluxDB
+        self.checkpoint = BlockCheckpoint.from_config(config)
+        self.checkpoint_interval = config.get('processing.checkpoint_interval', 1000)
+        
         # Statistics
         self.stats = {
             'blocks_processed': 0,
@@ -88,9 +97,13 @@ class HistoricalProcessor:
         else:
             end_block = min(int(self.config.processing_end_block), latest_blockchain_block)
             
-        # Check if we have any existing data in InfluxDB
+        # Resume after the checkpoint, or after the latest block in InfluxDB without one
         start_block = self.start_block
-        if self.db_client:
+        checkpoint_block = self.checkpoint.read()
+        if checkpoint_block is not None:
+            start_block = max(start_block, checkpoint_block + 1)
+            logger.info(f"Resuming from block {start_block} (checkpoint at {checkpoint_block})")
+        elif self.db_client:
             try:
                 latest_db_block = self.db_client.query_latest_block()
                 if latest_db_block is not None:
@@ -113,12 +126,8 @@ class HistoricalProcessor:
         }
         
         try:
-            # Get blocks in batch
-            blocks = await self.blockchain_client.get_blocks_batch(start_block, end_block)
-            
-            for i, block in enumerate(blocks):
-                block_number = start_block + i
-                
+            # Process each block as soon as it arrives rather than holding the whole batch
+            async for block_number, block in self.blockchain_client.iter_blocks_batch(start_block, end_block):
                 if isinstance(block, Exception):
                     logger.error(f"Error getting block {block_number}: {block}")
                     batch_stats['errors'] += 1
@@ -150,23 +159,25 @@ class HistoricalProcessor:
             if self.db_client:
                 self.db_client.write_block(block_data)
                 
-            # Process transactions
-            transactions = block_data.get('transactions', [])
+            # Process transactions with the block's receipts fetched in one call
+            transactions = full_transactions(block_data)
+            receipts = await self.blockchain_client.get_block_receipts_by_hash(block_number, transactions)
             for tx in transactions:
-                if isinstance(tx, dict):  # Full transaction object
-                    await self.process_transaction(tx, block_number)
-                    block_stats['transactions'] += 1
+                await self.process_transaction(tx, block_number, receipts.get(tx['hash']))
+            block_stats['transactions'] += len(transactions)
                     
         except Exception as e:
             logger.error(f"Error processing block {block_number}: {e}")
             
         return block_stats
         
-    async def process_transaction(self, tx_data: Dict[str, Any], block_number: int):
+    async def process_transaction(self, tx_data: Dict[str, Any], block_number: int,
+                                  receipt: Optional[Dict[str, Any]] = None):
         """Process a single transaction."""
         try:
-            # Get transaction receipt for gas usage and status
-            receipt = await self.blockchain_client.get_transaction_receipt(tx_data['hash'])
+            # Get transaction receipt for gas usage and status (unless prefetched)
+            if receipt is None:
+                receipt = await self.blockchain_client.get_transaction_receipt(tx_data['hash'])
             
             gas_used = None
             status = "pending"
@@ -214,7 +225,8 @@ class HistoricalProcessor:
                 BarColumn(),
                 "[progress.percentage]{task.percentage:>3.0f}%",
                 TimeRemainingColumn(),
-                console=console
+                console=console,
+                refresh_per_second=4
             ) as progress:
                 
                 task = progress.add_task(
@@ -222,8 +234,13 @@ class HistoricalProcessor:
                     total=total_blocks
                 )
                 
-                # Process in batches
+                # Process in batches; the bar and rate are refreshed at most every
+                # UI_UPDATE_INTERVAL seconds, with the blocks in between accumulated
                 current_block = start_block
+                last_ui_update = 0.0
+                pending_advance = 0
+                stats = self.stats
+                last_checkpoint = current_block - 1
                 
                 while current_block <= end_block:
                     batch_end = min(current_block + self.batch_size - 1, end_block)
@@ -231,23 +248,31 @@ class HistoricalProcessor:
                     # Process batch
                     batch_stats = await self.process_block_batch(current_block, batch_end)
                     
-                    # Update statistics
-                    self.stats['blocks_processed'] += batch_stats['blocks_processed']
-                    self.stats['transactions_processed'] += batch_stats['transactions_processed']
-                    self.stats['events_processed'] += batch_stats['events_processed']
-                    self.stats['errors'] += batch_stats['errors']
+                    # Update statistics (the rate is derived only when the display is refreshed)
+                    stats['blocks_processed'] += batch_stats['blocks_processed']
+                    stats['transactions_processed'] += batch_stats['transactions_processed']
+                    stats['events_processed'] += batch_stats['events_processed']
+                    stats['errors'] += batch_stats['errors']
                     
                     # Update progress
-                    blocks_in_batch = batch_end - current_block + 1
-                    progress.update(task, advance=blocks_in_batch)
-                    
-                    # Update rate calculation
-                    elapsed = time.time() - self.stats['start_time']
-                    if elapsed > 0:
-                        self.stats['blocks_per_second'] = self.stats['blocks_processed'] / elapsed
+                    pending_advance += batch_end - current_block + 1
+                    now = time.monotonic()
+                    if now - last_ui_update > UI_UPDATE_INTERVAL:
+                        self._update_progress(progress, task, pending_advance)
+                        last_ui_update = now
+                        pending_advance = 0
+                        
+                    # Batches run in order, so every block up to batch_end is done
+                    if batch_end - last_checkpoint >= self.checkpoint_interval:
+                        await self._write_checkpoint(batch_end)
+                        last_checkpoint = batch_end
                         
                     current_block = batch_end + 1
                     
+                self._update_progress(progress, task, pending_advance)
+                if last_checkpoint < end_block:
+                    await self._write_checkpoint(end_block)
+                    
             # Final statistics
             self.print_final_summary()
             
@@ -259,10 +284,30 @@ class HistoricalProcessor:
         finally:
             # Clean up connections
             if self.blockchain_client:
-                self.blockchain_client.close()
+                await self.blockchain_client.aclose()
             if self.db_client:
                 self.db_client.close()
                 
+    async def _write_checkpoint(self, block_number: int):
+        """Checkpoint block_number once every record buffered for it has been written."""
+        # A run without a database stores nothing, so it must not mark blocks as done
+        if not self.db_client:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.db_client.flush)
+        if self.db_client.lost_records:
+            logger.warning(f"Not checkpointing block {block_number}: "
+                           f"{self.db_client.lost_records} records were not written")
+            return
+        self.checkpoint.write(block_number)
+        
+    def _update_progress(self, progress: Progress, task, advance: int):
+        """Advance the progress bar and recompute the processing rate."""
+        progress.update(task, advance=advance)
+        
+        elapsed = time.time() - self.stats['start_time']
+        if elapsed > 0:
+            self.stats['blocks_per_second'] = self.stats['blocks_processed'] / elapsed
+            
     def print_final_summary(self):
         """Print a nice summary table."""
         table = Table(title="📊 Historical Processing Summary")
@@ -309,4 +354,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -5,33 +5,50 @@ Processes historical blockchain data in parallel batches with analytics support.
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import Pool, cpu_count
 import time
+from collections import defaultdict
 
-from core.blockchain_client import BlockchainClient
+from core.blockchain_client import BlockchainClient, full_transactions, inline_receipts
+from core.websocket_client import WebSocketBlockchainClient
 from core.influxdb_client import BlockchainInfluxDB
 from core.config import Config
+from core.checkpoint import BlockCheckpoint
+from core.event_loop import install_uvloop
 from analytics.advanced_analytics import AdvancedAnalytics
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-from rich.table import Table
-from rich.live import Live
 import structlog
 
 logger = structlog.get_logger(__name__)
 console = Console()
 
+# Minimum seconds between progress bar updates
+UI_UPDATE_INTERVAL = 0.5
+
+# Batch statistic -> the per-block statistic summed into it
+BLOCK_STAT_TOTALS = (
+    ('transactions_processed', 'transactions'),
+    ('events_processed', 'events'),
+    ('token_transfers', 'token_transfers'),
+    ('dex_swaps', 'dex_swaps'),
+    ('liquidity_events', 'liquidity_events'),
+    ('defi_events', 'defi_events'),
+)
+
 
 class HistoricalProcessor:
     """Processes historical blockchain data with parallel batching and analytics."""
     
     def __init__(self, config: Config):
         self.config = config
-        self.blockchain_client = BlockchainClient(config)
+        
+        # One multiplexed WebSocket instead of an HTTP request per call when available
+        if config.blockchain_ws_url:
+            self.blockchain_client = WebSocketBlockchainClient(config)
+        else:
+            self.blockchain_client = BlockchainClient(config)
         
         # InfluxDB client (will be initialized when token is available)
         self.db_client = None
@@ -51,6 +68,17 @@ class HistoricalProcessor:
         self.start_block = config.processing_start_block
         self.batch_size = config.processing_batch_size
         self.max_workers = config.processing_max_workers
+        self.extract_logs = config.get('processing.extract_logs', True)
+        
+        # AIMD batch sizing between min_batch_size and max_batch_size
+        self.adaptive_batch_size = config.get('processing.adaptive_batch_size', True)
+        self.min_batch_size = config.get('processing.min_batch_size', 10)
+        self.max_batch_size = config.get('processing.max_batch_size', 2000)
+        self._last_block_latency: Optional[float] = None
+        
+        # Append-only resume checkpoint, read at startup instead of querying InfluxDB
+        self.checkpoint = BlockCheckpoint.from_config(config)
+        self.checkpoint_interval = config.get('processing.checkpoint_interval', 1000)
         
         # Statistics
         self.stats = {
@@ -108,9 +136,13 @@ class HistoricalProcessor:
         else:
             end_block = min(int(self.config.processing_end_block), latest_blockchain_block)
             
-        # Check if we have any existing data in InfluxDB
+        # Resume after the checkpoint, or after the latest block in InfluxDB without one
         start_block = self.start_block
-        if self.db_client:
+        checkpoint_block = self.checkpoint.read()
+        if checkpoint_block is not None:
+            start_block = max(start_block, checkpoint_block + 1)
+            logger.info(f"Resuming from block {start_block} (checkpoint at {checkpoint_block})")
+        elif self.db_client:
             try:
                 latest_db_block = self.db_client.query_latest_block()
                 if latest_db_block is not None:
@@ -137,32 +169,62 @@ class HistoricalProcessor:
         }
         
         try:
-            # Process blocks individually to maintain analytics integration
-            for block_number in range(start_block, end_block + 1):
-                try:
-                    # Get block with transactions
-                    block_data = await self.blockchain_client.get_block(block_number, include_transactions=True)
-                    
-                    if block_data is None:
-                        logger.warning(f"Block {block_number} returned None")
-                        batch_stats['errors'] += 1
-                        continue
-                    
-                    # Process the block
-                    block_stats = await self.process_single_block(block_data, block_number)
-                    batch_stats['blocks_processed'] += 1
-                    batch_stats['transactions_processed'] += block_stats.get('transactions', 0)
-                    batch_stats['events_processed'] += block_stats.get('events', 0)
+            # Fetch the batch's blocks concurrently, then their receipts (one round
+            # trip per block rather than per transaction) alongside the whole
+            # batch's logs in one range query
+            block_numbers = range(start_block, end_block + 1)
+            blocks = await self.blockchain_client.get_blocks_batch(start_block, end_block)
+            
+            fetches = [self.get_batch_receipts(block_numbers, blocks)]
+            if self.extract_logs:
+                fetches.append(self.get_batch_events(start_block, end_block))
+            receipts, *batch_events = await asyncio.gather(*fetches)
+            
+            # If the range query failed, each block fetches its own logs in process_single_block
+            if batch_events and batch_events[0] is not None:
+                block_events = [batch_events[0].get(block_number, []) for block_number in block_numbers]
+            else:
+                block_events = [None] * len(block_numbers)
+            
+            # Process the blocks concurrently (each is independent once its data is
+            # in hand), passing each the previous block's timestamp for its block
+            # time so only the first block of the batch (or one after a failed
+            # fetch) fetches its parent
+            process_single_block = self.process_single_block
+            pending = []
+            prev_timestamp = None
+            for block_number, block_data, events in zip(block_numbers, blocks, block_events):
+                if isinstance(block_data, Exception):
+                    logger.error(f"Error processing block {block_number}: {block_data}")
+                    batch_stats['errors'] += 1
+                    prev_timestamp = None
+                    continue
                     
-                    # Add analytics stats
-                    batch_stats['token_transfers'] += block_stats.get('token_transfers', 0)
-                    batch_stats['dex_swaps'] += block_stats.get('dex_swaps', 0)
-                    batch_stats['liquidity_events'] += block_stats.get('liquidity_events', 0)
-                    batch_stats['defi_events'] += block_stats.get('defi_events', 0)
+                if block_data is None:
+                    logger.warning(f"Block {block_number} returned None")
+                    batch_stats['errors'] += 1
+                    prev_timestamp = None
+                    continue
                     
-                except Exception as e:
-                    logger.error(f"Error processing block {block_number}: {e}")
+                pending.append((block_number, process_single_block(block_data, block_number, receipts, events, prev_timestamp)))
+                timestamp = block_data.get('timestamp')
+                prev_timestamp = int(timestamp, 16) if timestamp else None
+                
+            results = await asyncio.gather(*(block_run for _, block_run in pending), return_exceptions=True)
+            
+            # Aggregate the per-block statistics once every block is done, one
+            # column-wise sum per statistic rather than updates per block
+            completed = []
+            for (block_number, _), block_stats in zip(pending, results):
+                if isinstance(block_stats, Exception):
+                    logger.error(f"Error processing block {block_number}: {block_stats}")
                     batch_stats['errors'] += 1
+                else:
+                    completed.append(block_stats)
+                    
+            batch_stats['blocks_processed'] += len(completed)
+            for batch_key, block_key in BLOCK_STAT_TOTALS:
+                batch_stats[batch_key] += sum([block_stats[block_key] for block_stats in completed])
                     
         except Exception as e:
             logger.error(f"Error processing batch {start_block}-{end_block}: {e}")
@@ -170,20 +232,37 @@ class HistoricalProcessor:
             
         return batch_stats
         
-    async def process_single_block(self, block_data: Dict[str, Any], block_number: int) -> Dict[str, Any]:
-        """Process a single block and its transactions with analytics."""
+    async def process_single_block(self, block_data: Dict[str, Any], block_number: int,
+                                   receipts: Optional[Dict[str, Dict[str, Any]]] = None,
+                                   events: Optional[List[Dict[str, Any]]] = None,
+                                   prev_timestamp: Optional[int] = None) -> Dict[str, Any]:
+        """Process a single block and its transactions with analytics.
+        
+        receipts maps transaction hash to receipt when they were prefetched for
+        the batch; transactions without one fetch their receipt individually.
+        events are the block's prefetched logs; without them they are fetched here.
+        prev_timestamp is the parent block's timestamp when the caller has it;
+        otherwise the parent block is fetched to compute the block time.
+        """
+        if receipts is None:
+            receipts = {}
+            
         block_stats = {'transactions': 0, 'events': 0, 'token_transfers': 0, 'dex_swaps': 0, 'liquidity_events': 0, 'defi_events': 0}
         
         try:
+            # The hex timestamp is parsed once, for both the block time and analytics
+            timestamp = int(block_data.get('timestamp', '0x0'), 16)
+            
             # Calculate block time if we have previous block
             block_time_diff = None
             if block_number > 0:
                 try:
-                    prev_block = await self.blockchain_client.get_block(block_number - 1, False)
-                    if prev_block:
-                        curr_timestamp = int(block_data['timestamp'], 16)
-                        prev_timestamp = int(prev_block['timestamp'], 16)
-                        block_time_diff = curr_timestamp - prev_timestamp
+                    if prev_timestamp is None:
+                        prev_block = await self.blockchain_client.get_block(block_number - 1, False)
+                        if prev_block:
+                            prev_timestamp = int(prev_block['timestamp'], 16)
+                    if prev_timestamp is not None:
+                        block_time_diff = timestamp - prev_timestamp
                 except Exception as e:
                     logger.debug(f"Could not calculate block time for {block_number}: {e}")
             
@@ -195,10 +274,10 @@ class HistoricalProcessor:
             if self.analytics:
                 try:
                     # Compute block timestamp
-                    ts = datetime.fromtimestamp(int(block_data.get('timestamp', '0x0'), 16), tz=timezone.utc)
+                    ts = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                     
                     # Analyze the block
-                    analytics_results = await self.analytics.analyze_block(block_data, ts)
+                    analytics_results = await self.analytics.analyze_block(block_data, ts, receipts)
                     
                     # Update analytics statistics
                     block_stats['token_transfers'] = analytics_results.get('token_transfers', 0)
@@ -210,46 +289,111 @@ class HistoricalProcessor:
                 except Exception as e:
                     logger.debug(f"Analytics failed for block {block_number}: {e}")
             
-            # Process transactions
-            transactions = block_data.get('transactions', [])
-            for tx in transactions:
-                if isinstance(tx, dict):  # Full transaction object
-                    await self.process_transaction(tx, block_number)
-                    block_stats['transactions'] += 1
+            # Process transactions. They are independent here, so any receipts that
+            # were not prefetched are fetched concurrently rather than one at a time,
+            # and the block's transactions are then written as one batch
+            transactions = full_transactions(block_data)
+            process_transaction = self.process_transaction
+            receipt_for = receipts.get
+            outcomes = await asyncio.gather(*(
+                process_transaction(tx, receipt_for(tx['hash'])) for tx in transactions
+            ))
+            if self.db_client and transactions:
+                statuses, gas_used = zip(*outcomes)
+                self.db_client.write_transactions(transactions, block_number, statuses, gas_used)
+            block_stats['transactions'] += len(transactions)
                     
-            # Get and process events/logs for this block
-            if self.config.get('processing.extract_logs', True):
-                events = await self.get_block_events(block_number)
+            # Get and store events/logs for this block as one batch
+            if self.extract_logs:
+                if events is None:
+                    events = await self.get_block_events(block_number)
                 if events:
-                    for event in events:
-                        await self.process_event(event, block_number)
-                        block_stats['events'] += 1
+                    if self.db_client:
+                        self.db_client.write_events(
+                            events, block_number, [event.get('transactionHash', '') for event in events]
+                        )
+                    block_stats['events'] += len(events)
                         
         except Exception as e:
             logger.error(f"Error processing block {block_number}: {e}")
             
         return block_stats
         
-    async def process_transaction(self, tx_data: Dict[str, Any], block_number: int):
-        """Process a single transaction."""
+    async def process_transaction(self, tx_data: Dict[str, Any],
+                                  receipt: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[int]]:
+        """Determine a transaction's (status, gas_used) for writing with its block."""
+        tx_hash = tx_data.get('hash', 'unknown')
+        gas_used = None
+        status = "pending"
         try:
-            # Get transaction receipt for gas usage and status
-            receipt = await self.blockchain_client.get_transaction_receipt(tx_data['hash'])
-            
-            gas_used = None
-            status = "pending"
+            # Get transaction receipt for gas usage and status (unless prefetched)
+            if receipt is None:
+                receipt = await self.blockchain_client.get_transaction_receipt(tx_hash)
             
             if receipt:
                 gas_used = int(receipt.get('gasUsed', '0x0'), 16)
                 status = "success" if receipt.get('status') == '0x1' else "failed"
                 
-            # Store transaction data
-            if self.db_client:
-                self.db_client.write_transaction(tx_data, block_number, status, gas_used)
+        except Exception as e:
+            logger.debug(f"Error processing transaction {tx_hash}: {e}")
+            
+        return status, gas_used
+            
+    async def get_batch_receipts(self, block_numbers: range,
+                                 blocks: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """Get the receipts of every transaction in a batch of blocks, keyed by hash.
+        
+        Transactions that carry their receipt fields inline serve as their own
+        receipts. Every other block's receipts come from one eth_getBlockReceipts
+        call; blocks the node cannot serve that way have their receipts fetched
+        together with batched eth_getTransactionReceipt calls.
+        """
+        receipts = {}
+        block_transactions = []
+        for block_number, block_data in zip(block_numbers, blocks):
+            transactions = full_transactions(block_data) if isinstance(block_data, dict) else []
+            if inline_receipts(transactions):
+                receipts.update((tx['hash'], tx) for tx in transactions)
+            elif transactions:
+                block_transactions.append((block_number, transactions))
                 
+        get_block_receipts = self.blockchain_client.get_block_receipts
+        block_receipts = await asyncio.gather(*(
+            get_block_receipts(block_number) for block_number, _ in block_transactions
+        ))
+        
+        missing = []
+        for (_, transactions), receipt_list in zip(block_transactions, block_receipts):
+            if receipt_list is None:
+                missing.extend(tx['hash'] for tx in transactions)
+            else:
+                receipts.update((receipt['transactionHash'], receipt) for receipt in receipt_list if receipt)
+                
+        if missing:
+            receipts.update(zip(missing, await self.blockchain_client.get_receipts_batch(missing)))
+            
+        return receipts
+        
+    async def get_batch_events(self, start_block: int, end_block: int) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """Get all events/logs for a range of blocks with one eth_getLogs call, keyed by block number.
+        
+        Returns None if the node rejected the range (e.g. too many results), so
+        each block's logs are fetched on their own instead.
+        """
+        try:
+            logs = await self.blockchain_client.get_logs(start_block, end_block)
         except Exception as e:
-            logger.debug(f"Error processing transaction {tx_data.get('hash', 'unknown')}: {e}")
+            logger.debug(f"Error getting events for blocks {start_block}-{end_block}: {e}")
+            return None
             
+        if logs is None:
+            return None
+            
+        events_by_block = defaultdict(list)
+        for log in logs:
+            events_by_block[int(log['blockNumber'], 16)].append(log)
+        return events_by_block
+        
     async def get_block_events(self, block_number: int) -> Optional[List[Dict[str, Any]]]:
         """Get all events/logs for a block."""
         try:
@@ -258,15 +402,6 @@ class HistoricalProcessor:
             logger.debug(f"Error getting events for block {block_number}: {e}")
             return None
             
-    async def process_event(self, event_data: Dict[str, Any], block_number: int):
-        """Process a single event/log."""
-        try:
-            if self.db_client:
-                tx_hash = event_data.get('transactionHash', '')
-                self.db_client.write_event(event_data, block_number, tx_hash)
-        except Exception as e:
-            logger.debug(f"Error processing event: {e}")
-            
     async def process_blocks(self) -> bool:
         """Run the complete historical processing."""
         logger.info("Starting historical blockchain data processing with analytics...")
@@ -296,7 +431,8 @@ class HistoricalProcessor:
                 BarColumn(),
                 "[progress.percentage]{task.percentage:>3.0f}%",
                 TimeRemainingColumn(),
-                console=console
+                console=console,
+                refresh_per_second=4
             ) as progress:
                 
                 task = progress.add_task(
@@ -304,39 +440,66 @@ class HistoricalProcessor:
                     total=total_blocks
                 )
                 
-                # Process in batches
-                current_block = start_block
+                # Process batches concurrently with max_workers workers fed from a
+                # bounded queue, so the RPC latency of one batch overlaps with the
+                # work of the others without a task per batch of the whole range
+                queue: asyncio.Queue = asyncio.Queue(maxsize=2 * max(1, self.max_workers))
                 
-                while current_block <= end_block:
-                    batch_end = min(current_block + self.batch_size - 1, end_block)
-                    
-                    # Process batch
-                    batch_stats = await self.process_block_batch(current_block, batch_end)
+                # The bar and rate are refreshed at most every UI_UPDATE_INTERVAL
+                # seconds, with the blocks finished in between accumulated
+                last_ui_update = 0.0
+                pending_advance = 0
+                
+                # Batches finish out of order, so the checkpoint follows the end of
+                # the contiguous run of finished batches (finished maps the start of
+                # each batch past that run to its end)
+                finished_through = start_block - 1
+                last_checkpoint = finished_through
+                finished: Dict[int, int] = {}
+                
+                async def run_batch(batch_start: int, batch_end: int):
+                    nonlocal last_ui_update, pending_advance, finished_through, last_checkpoint
+                    batch_started = time.monotonic()
+                    batch_stats = await self.process_block_batch(batch_start, batch_end)
+                    if self.adaptive_batch_size:
+                        self._adapt_batch_size(
+                            batch_end - batch_start + 1, time.monotonic() - batch_started, batch_stats['errors']
+                        )
                     
-                    # Update statistics
-                    self.stats['blocks_processed'] += batch_stats['blocks_processed']
-                    self.stats['transactions_processed'] += batch_stats['transactions_processed']
-                    self.stats['events_processed'] += batch_stats['events_processed']
-                    self.stats['errors'] += batch_stats['errors']
+                    # Nothing below awaits, so concurrent batches never interleave
+                    # their statistics updates and plain counters need no lock. The
+                    # rate is derived only when the progress display is refreshed
+                    stats = self.stats
+                    stats['blocks_processed'] += batch_stats['blocks_processed']
+                    stats['transactions_processed'] += batch_stats['transactions_processed']
+                    stats['events_processed'] += batch_stats['events_processed']
+                    stats['errors'] += batch_stats['errors']
                     
                     # Update analytics statistics
-                    self.stats['token_transfers_found'] += batch_stats['token_transfers']
-                    self.stats['dex_swaps_found'] += batch_stats['dex_swaps']
-                    self.stats['liquidity_events_found'] += batch_stats['liquidity_events']
-                    self.stats['defi_events_found'] += batch_stats['defi_events']
-                    self.stats['total_analytics_events'] += (
-                        batch_stats['token_transfers'] + batch_stats['dex_swaps'] + 
-                        batch_stats['liquidity_events'] + batch_stats['defi_events']
-                    )
+                    token_transfers = batch_stats['token_transfers']
+                    dex_swaps = batch_stats['dex_swaps']
+                    liquidity_events = batch_stats['liquidity_events']
+                    defi_events = batch_stats['defi_events']
+                    stats['token_transfers_found'] += token_transfers
+                    stats['dex_swaps_found'] += dex_swaps
+                    stats['liquidity_events_found'] += liquidity_events
+                    stats['defi_events_found'] += defi_events
+                    stats['total_analytics_events'] += token_transfers + dex_swaps + liquidity_events + defi_events
                     
                     # Update progress
-                    blocks_in_batch = batch_end - current_block + 1
-                    progress.update(task, advance=blocks_in_batch)
-                    
-                    # Update rate calculation
-                    elapsed = time.time() - self.stats['start_time']
-                    if elapsed > 0:
-                        self.stats['blocks_per_second'] = self.stats['blocks_processed'] / elapsed
+                    pending_advance += batch_end - batch_start + 1
+                    now = time.monotonic()
+                    if now - last_ui_update > UI_UPDATE_INTERVAL:
+                        self._update_progress(progress, task, pending_advance)
+                        last_ui_update = now
+                        pending_advance = 0
+                        
+                    finished[batch_start] = batch_end
+                    while finished_through + 1 in finished:
+                        finished_through = finished.pop(finished_through + 1)
+                    if finished_through - last_checkpoint >= self.checkpoint_interval:
+                        last_checkpoint = finished_through
+                        await self._write_checkpoint(last_checkpoint)
                         
                     # Log progress
                     if self.stats['blocks_processed'] % (self.batch_size * 10) == 0:
@@ -349,8 +512,31 @@ class HistoricalProcessor:
                             rate_blocks_per_sec=f"{self.stats['blocks_per_second']:.2f}",
                             current_block=batch_end
                         )
+                
+                async def worker():
+                    while True:
+                        batch_range = await queue.get()
+                        if batch_range is None:
+                            return
+                        await run_batch(*batch_range)
                         
-                    current_block = batch_end + 1
+                workers = [asyncio.create_task(worker()) for _ in range(max(1, self.max_workers))]
+                try:
+                    # The batch size is read per batch, as _adapt_batch_size may change it
+                    batch_start = start_block
+                    while batch_start <= end_block:
+                        batch_end = min(batch_start + self.batch_size - 1, end_block)
+                        await queue.put((batch_start, batch_end))
+                        batch_start = batch_end + 1
+                    for _ in workers:
+                        await queue.put(None)
+                    await asyncio.gather(*workers)
+                finally:
+                    for worker_task in workers:
+                        worker_task.cancel()
+                self._update_progress(progress, task, pending_advance)
+                if last_checkpoint < finished_through:
+                    await self._write_checkpoint(finished_through)
                     
             # Final statistics
             total_time = time.time() - self.stats['start_time']
@@ -376,12 +562,48 @@ class HistoricalProcessor:
         finally:
             # Clean up connections
             if self.blockchain_client:
-                self.blockchain_client.close()
+                await self.blockchain_client.aclose()
             if self.db_client:
                 self.db_client.close()
                 
+    async def _write_checkpoint(self, block_number: int):
+        """Checkpoint block_number once every record buffered for it has been written.
+        
+        Without a database nothing is stored, so nothing is checkpointed; once any
+        record has been lost the checkpoint stays put, so a restart falls back to
+        reprocessing from it rather than skipping the missing blocks.
+        """
+        if not self.db_client:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.db_client.flush)
+        if self.db_client.lost_records:
+            logger.warning(f"Not checkpointing block {block_number}: "
+                           f"{self.db_client.lost_records} records were not written")
+            return
+        self.checkpoint.write(block_number)
+        
+    def _adapt_batch_size(self, blocks: int, elapsed: float, errors: int):
+        """Adjust the batch size after a batch: grow while the time per block falls, halve on errors."""
+        block_latency = elapsed / blocks
+        if errors:
+            self.batch_size = max(self.batch_size // 2, self.min_batch_size)
+        elif self._last_block_latency is not None and block_latency < self._last_block_latency:
+            self.batch_size = min(int(self.batch_size * 1.25), self.max_batch_size)
+        self._last_block_latency = block_latency
+        
+    def _update_progress(self, progress: Progress, task, advance: int):
+        """Advance the progress bar and recompute the processing rate."""
+        progress.update(task, advance=advance)
+        
+        elapsed = time.time() - self.stats['start_time']
+        if elapsed > 0:
+            self.stats['blocks_per_second'] = self.stats['blocks_processed'] / elapsed
+            
     def print_final_summary(self):
         """Print a nice summary table."""
+        # Only needed once, at the end of a run
+        from rich.table import Table
+        
         table = Table(title="📊 Historical Processing Summary")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
@@ -433,4 +655,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -5,216 +5,105 @@ Provides a web API for monitoring and controlling the real-time blockchain monit
 
 import asyncio
 import logging
-import json
 import signal
-import sys
 from typing import Dict, Any, Optional
-from pathlib import Path
 from datetime import datetime
 from aiohttp import web, WSMsgType
 import aiohttp_cors
+import orjson
 
+# Entry points (scripts/start_monitor_service.py) put src on sys.path
+from .realtime_monitor import RealtimeMonitor
+from core.config import Config
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Optional Redis backplane for running several service instances
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    RedisError = OSError
+    REDIS_AVAILABLE = False
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+logger = logging.getLogger(__name__)
 
-from processors.realtime_monitor import RealtimeMonitor
-from core.config import Config
+# aiohttp 3.11+ can send an already encoded frame payload, so a broadcast is
+# UTF-8 encoded once rather than once per connected client
+WS_SEND_FRAME = hasattr(web.WebSocketResponse, 'send_frame')
 
-logger = logging.getLogger(__name__)
+# Messages queued for one WebSocket client before it is dropped as too slow
+WS_QUEUE_SIZE = 32
 
+# Largest message accepted from a WebSocket client (clients only send commands)
+WS_MAX_MESSAGE_SIZE = 64 * 1024
 
-class MonitoringService:
-    """Web service for monitoring blockchain analytics."""
-    
-    def __init__(self, config: Config, port: int = 8000):
-        self.config = config
-        self.port = port
-        self.app = web.Application()
-        self.monitor: Optional[RealtimeMonitor] = None
-        self.websocket_connections = set()
-        
-        # Setup routes
-        self._setup_routes()
-        
-        # Setup CORS
-        cors = aiohttp_cors.setup(self.app, defaults={
-            "*": aiohttp_cors.ResourceOptions(
-                allow_credentials=True,
-                expose_headers="*",
-                allow_headers="*",
-                allow_methods="*"
-            )
-        })
-        
-        # Add CORS to all routes
-        for route in list(self.app.router.routes()):
-            cors.add(route)
-            
-    def _setup_routes(self):
-        """Setup API routes."""
-        # API endpoints
-        self.app.router.add_get('/api/status', self.get_status)
-        self.app.router.add_get('/api/statistics', self.get_statistics)
-        self.app.router.add_post('/api/start', self.start_monitor)
-        self.app.router.add_post('/api/stop', self.stop_monitor)
-        self.app.router.add_post('/api/pause', self.pause_monitor)
-        self.app.router.add_post('/api/resume', self.resume_monitor)
-        
-        # WebSocket for live updates
-        self.app.router.add_get('/ws', self.websocket_handler)
-        
-        # Static files (dashboard)
-        self.app.router.add_get('/', self.dashboard)
-        self.app.router.add_get('/dashboard', self.dashboard)
-        
-        # Health check
-        self.app.router.add_get('/health', self.health_check)
-        
-    async def get_status(self, request: web.Request) -> web.Response:
-        """Get current monitoring status."""
-        try:
-            if self.monitor:
-                status = self.monitor.get_status()
-                status['service_status'] = 'running'
-            else:
-                status = {
-                    'service_status': 'not_initialized',
-                    'running': False,
-                    'paused': False,
-                    'last_processed_block': 0,
-                    'latest_network_block': 0,
-                    'processing_lag': 0,
-                    'statistics': {},
-                    'uptime': 0
-                }
-                
-            return web.json_response(status)
-        except Exception as e:
-            logger.error(f"Error getting status: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def get_statistics(self, request: web.Request) -> web.Response:
-        """Get detailed statistics."""
-        try:
-            if not self.monitor:
-                return web.json_response({'error': 'Monitor not initialized'}, status=400)
-                
-            stats = self.monitor.get_status()
-            
-            # Add additional computed metrics
-            if stats['statistics'].get('uptime', 0) > 0:
-                uptime_hours = stats['statistics']['uptime'] / 3600
-                stats['computed_metrics'] = {
-                    'uptime_hours': round(uptime_hours, 2),
-                    'blocks_per_hour': round(stats['statistics']['blocks_processed'] / max(uptime_hours, 0.01), 2),
-                    'transactions_per_hour': round(stats['statistics']['transactions_processed'] / max(uptime_hours, 0.01), 2),
-                    'error_rate': round(stats['statistics']['errors'] / max(stats['statistics']['blocks_processed'], 1) * 100, 4),
-                    'efficiency': round((stats['statistics']['blocks_processed'] / 
-                                       max(stats['statistics']['blocks_processed'] + stats['statistics']['errors'], 1)) * 100, 2)
-                }
-            else:
-                stats['computed_metrics'] = {}
-                
-            return web.json_response(stats)
-        except Exception as e:
-            logger.error(f"Error getting statistics: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def start_monitor(self, request: web.Request) -> web.Response:
-        """Start the blockchain monitor."""
-        try:
-            if self.monitor and self.monitor.running:
-                return web.json_response({'error': 'Monitor is already running'}, status=400)
-                
-            # Create new monitor if needed
-            if not self.monitor:
-                self.monitor = RealtimeMonitor(self.config)
-                
-            # Start monitoring in background task
-            asyncio.create_task(self._run_monitor())
-            
-            return web.json_response({'success': True, 'message': 'Monitor starting...'})
-        except Exception as e:
-            logger.error(f"Error starting monitor: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def stop_monitor(self, request: web.Request) -> web.Response:
-        """Stop the blockchain monitor."""
-        try:
-            if not self.monitor or not self.monitor.running:
-                return web.json_response({'error': 'Monitor is not running'}, status=400)
-                
-            await self.monitor.stop_monitoring()
-            return web.json_response({'success': True, 'message': 'Monitor stopped'})
-        except Exception as e:
-            logger.error(f"Error stopping monitor: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def pause_monitor(self, request: web.Request) -> web.Response:
-        """Pause the blockchain monitor."""
-        try:
-            if not self.monitor or not self.monitor.running:
-                return web.json_response({'error': 'Monitor is not running'}, status=400)
-                
-            self.monitor.pause_monitoring()
-            return web.json_response({'success': True, 'message': 'Monitor paused'})
-        except Exception as e:
-            logger.error(f"Error pausing monitor: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def resume_monitor(self, request: web.Request) -> web.Response:
-        """Resume the blockchain monitor."""
-        try:
-            if not self.monitor or not self.monitor.running:
-                return web.json_response({'error': 'Monitor is not running'}, status=400)
-                
-            self.monitor.resume_monitoring()
-            return web.json_response({'success': True, 'message': 'Monitor resumed'})
-        except Exception as e:
-            logger.error(f"Error resuming monitor: {e}")
-            return web.json_response({'error': str(e)}, status=500)
-            
-    async def websocket_handler(self, request: web.Request) -> web.WebSocketResponse:
-        """Handle WebSocket connections for live updates."""
-        ws = web.WebSocketResponse()
-        await ws.prepare(request)
-        
-        self.websocket_connections.add(ws)
-        logger.info(f"WebSocket connection established (total: {len(self.websocket_connections)})")
-        
-        try:
-            async for msg in ws:
-                if msg.type == WSMsgType.TEXT:
-                    try:
-                        data = json.loads(msg.data)
-                        # Handle WebSocket commands if needed
-                        if data.get('command') == 'get_status':
-                            status = await self._get_status_data()
-                            await ws.send_str(json.dumps({'type': 'status', 'data': status}, cls=DateTimeEncoder))
-                    except json.JSONDecodeError:
-                        await ws.send_str(json.dumps({'type': 'error', 'message': 'Invalid JSON'}))
-                elif msg.type == WSMsgType.ERROR:
-                    logger.error(f"WebSocket error: {ws.exception()}")
-                    
-        except Exception as e:
-            logger.error(f"WebSocket handler error: {e}")
-        finally:
-            self.websocket_connections.discard(ws)
-            logger.info(f"WebSocket connection closed (remaining: {len(self.websocket_connections)})")
-            
-        return ws
-        
-    async def dashboard(self, request: web.Request) -> web.Response:
-        """Serve the dashboard HTML."""
-        html = """
+# Redis channel carrying the status broadcasts of every service instance
+STATUS_CHANNEL = 'glq:status'
+
+# Broadcasts only carry the fields that changed, with the full status sent
+# every STATUS_RESYNC_INTERVAL broadcasts to resynchronize clients
+STATUS_RESYNC_INTERVAL = 30
+
+# Minimum seconds between status broadcasts; updates in between are coalesced
+BROADCAST_INTERVAL = 0.5
+
+# Status reported before a monitor has been created (shared; treat as read-only)
+NOT_INITIALIZED_STATUS = {
+    'service_status': 'not_initialized',
+    'running': False,
+    'paused': False,
+    'last_processed_block': 0,
+    'latest_network_block': 0,
+    'processing_lag': 0,
+    'statistics': {},
+    'uptime': 0
+}
+
+
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """JSON response encoded by orjson (datetimes as ISO 8601 strings)."""
+    return web.Response(body=orjson.dumps(data), status=status, content_type='application/json')
+
+
+@web.middleware
+async def error_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Turn exceptions raised by a handler into a JSON 500 response."""
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error handling {request.method} {request.path}: {e}")
+        return json_response({'error': str(e)}, status=500)
+
+
+def status_delta(previous: Dict[str, Any], status: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of status that differ from previous, comparing nested dicts per key."""
+    delta = {}
+    for key, value in status.items():
+        old = previous.get(key)
+        if old == value:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            delta[key] = {k: v for k, v in value.items() if old.get(k) != v}
+        else:
+            delta[key] = value
+    return delta
+
+
+async def send_json_payload(ws: web.WebSocketResponse, payload: bytes):
+    """Send an orjson-encoded message as a WebSocket text frame."""
+    if WS_SEND_FRAME:
+        await ws.send_frame(payload, WSMsgType.TEXT)
+    else:
+        await ws.send_str(payload.decode())
+
+# Dashboard page. The current status is inlined at INITIAL_STATUS_MARKER so the
+# page renders without waiting for the WebSocket; the parts around it are
+# encoded once at import
+INITIAL_STATUS_MARKER = '{{INITIAL_STATUS}}'
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -444,6 +333,7 @@ class MonitoringService:
         </div>
     </div>
     
+    <script>window.__INITIAL_STATUS__ = {{INITIAL_STATUS}};</script>
     <script>
         let ws = null;
         let statusData = {};
@@ -461,6 +351,8 @@ class MonitoringService:
                 const message = JSON.parse(event.data);
                 if (message.type === 'status') {
                     updateStatus(message.data);
+                } else if (message.type === 'status_delta') {
+                    updateStatus(mergeStatus(statusData, message.data));
                 }
             };
             
@@ -480,6 +372,14 @@ class MonitoringService:
             }
         }
         
+        function mergeStatus(base, delta) {
+            const merged = {...base, ...delta};
+            if (delta.statistics) {
+                merged.statistics = {...base.statistics, ...delta.statistics};
+            }
+            return merged;
+        }
+        
         function updateStatus(data) {
             statusData = data;
             
@@ -584,7 +484,6 @@ class MonitoringService:
                 } else {
                     log(`Error: ${result.error}`);
                 }
-                requestStatus();
             } catch (error) {
                 log(`API Error: ${error}`);
             }
@@ -596,33 +495,255 @@ class MonitoringService:
         function stopMonitor() { apiCall('stop'); }
         
         // Initialize
+        updateStatus(window.__INITIAL_STATUS__);
         connectWebSocket();
-        setInterval(requestStatus, 5000);  // Update every 5 seconds
     </script>
 </body>
 </html>
-        """
-        return web.Response(text=html, content_type='text/html')
+"""
+DASHBOARD_HEAD, DASHBOARD_TAIL = DASHBOARD_HTML.encode('utf-8').split(INITIAL_STATUS_MARKER.encode())
+DASHBOARD_HEADERS = {'Cache-Control': 'no-cache'}
+
+
+class MonitoringService:
+    """Web service for monitoring blockchain analytics."""
+    
+    def __init__(self, config: Config, port: int = 8000, max_connections: int = 1000):
+        self.config = config
+        self.port = port
+        self.app = web.Application(middlewares=[error_middleware])
+        self.monitor: Optional[RealtimeMonitor] = None
+        # Each WebSocket client's outgoing message queue, drained by its writer task
+        self.websocket_connections: Dict[web.WebSocketResponse, asyncio.Queue] = {}
+        
+        # WebSocket clients beyond max_connections are turned away
+        self.max_connections = max_connections
+        self.rejected_connections = 0
+        
+        # Set by the monitor when its status changes; the broadcast loop waits on it
+        self._status_dirty = asyncio.Event()
+        self._broadcast_task: Optional[asyncio.Task] = None
+        
+        # With a Redis URL, broadcasts are published to STATUS_CHANNEL and every
+        # instance (this one included) relays them to its own clients
+        self.redis_url = config.get('monitoring.redis_url')
+        self._redis = None
+        self._redis_task: Optional[asyncio.Task] = None
+        
+        # Last broadcast status, which the next broadcast is diffed against
+        self._last_status: Optional[Dict[str, Any]] = None
+        self._broadcasts_since_resync = 0
+        
+        # Created by start_service
+        self.runner: Optional[web.AppRunner] = None
+        
+        # Setup routes
+        self._setup_routes()
+        
+        # Setup CORS
+        cors = aiohttp_cors.setup(self.app, defaults={
+            "*": aiohttp_cors.ResourceOptions(
+                allow_credentials=True,
+                expose_headers="*",
+                allow_headers="*",
+                allow_methods="*"
+            )
+        })
+        
+        # Add CORS to all routes
+        for route in list(self.app.router.routes()):
+            cors.add(route)
+            
+    def _setup_routes(self):
+        """Setup API routes."""
+        # API endpoints
+        self.app.router.add_get('/api/status', self.get_status)
+        self.app.router.add_get('/api/statistics', self.get_statistics)
+        self.app.router.add_post('/api/start', self.start_monitor)
+        self.app.router.add_post('/api/stop', self.stop_monitor)
+        self.app.router.add_post('/api/pause', self.pause_monitor)
+        self.app.router.add_post('/api/resume', self.resume_monitor)
+        
+        # WebSocket for live updates
+        self.app.router.add_get('/ws', self.websocket_handler)
+        
+        # Static files (dashboard)
+        self.app.router.add_get('/', self.dashboard)
+        self.app.router.add_get('/dashboard', self.dashboard)
+        
+        # Health check
+        self.app.router.add_get('/health', self.health_check)
+        
+    async def get_status(self, request: web.Request) -> web.Response:
+        """Get current monitoring status."""
+        status = await self._get_status_data()
+        status = {**status, 'websocket': self._connection_stats()}
+        if self.monitor:
+            status['service_status'] = 'running'
+            
+        return json_response(status)
+            
+    async def get_statistics(self, request: web.Request) -> web.Response:
+        """Get detailed statistics."""
+        if not self.monitor:
+            return json_response({'error': 'Monitor not initialized'}, status=400)
+            
+        stats = dict(await self._get_status_data())
+        
+        # Add additional computed metrics
+        if stats['statistics'].get('uptime', 0) > 0:
+            uptime_hours = stats['statistics']['uptime'] / 3600
+            stats['computed_metrics'] = {
+                'uptime_hours': round(uptime_hours, 2),
+                'blocks_per_hour': round(stats['statistics']['blocks_processed'] / max(uptime_hours, 0.01), 2),
+                'transactions_per_hour': round(stats['statistics']['transactions_processed'] / max(uptime_hours, 0.01), 2),
+                'error_rate': round(stats['statistics']['errors'] / max(stats['statistics']['blocks_processed'], 1) * 100, 4),
+                'efficiency': round((stats['statistics']['blocks_processed'] / 
+                                   max(stats['statistics']['blocks_processed'] + stats['statistics']['errors'], 1)) * 100, 2)
+            }
+        else:
+            stats['computed_metrics'] = {}
+            
+        return json_response(stats)
+            
+    async def start_monitor(self, request: web.Request) -> web.Response:
+        """Start the blockchain monitor."""
+        if self.monitor and self.monitor.running:
+            return json_response({'error': 'Monitor is already running'}, status=400)
+            
+        # Create new monitor if needed
+        if not self.monitor:
+            self.monitor = RealtimeMonitor(self.config, on_update=self.notify_update)
+            
+        # Start monitoring in background task
+        asyncio.create_task(self._run_monitor())
+        
+        return json_response({'success': True, 'message': 'Monitor starting...'})
+            
+    async def stop_monitor(self, request: web.Request) -> web.Response:
+        """Stop the blockchain monitor."""
+        if not self.monitor or not self.monitor.running:
+            return json_response({'error': 'Monitor is not running'}, status=400)
+            
+        await self.monitor.stop_monitoring()
+        return json_response({'success': True, 'message': 'Monitor stopped'})
+            
+    async def pause_monitor(self, request: web.Request) -> web.Response:
+        """Pause the blockchain monitor."""
+        if not self.monitor or not self.monitor.running:
+            return json_response({'error': 'Monitor is not running'}, status=400)
+            
+        self.monitor.pause_monitoring()
+        return json_response({'success': True, 'message': 'Monitor paused'})
+            
+    async def resume_monitor(self, request: web.Request) -> web.Response:
+        """Resume the blockchain monitor."""
+        if not self.monitor or not self.monitor.running:
+            return json_response({'error': 'Monitor is not running'}, status=400)
+            
+        self.monitor.resume_monitoring()
+        return json_response({'success': True, 'message': 'Monitor resumed'})
+            
+    async def websocket_handler(self, request: web.Request) -> web.WebSocketResponse:
+        """Handle WebSocket connections for live updates."""
+        # permessage-deflate, when the client offers it: status messages repeat the
+        # same keys on every broadcast and compress well
+        ws = web.WebSocketResponse(compress=True, max_msg_size=WS_MAX_MESSAGE_SIZE)
+        await ws.prepare(request)
+        
+        if len(self.websocket_connections) >= self.max_connections:
+            # 1013: try again later
+            self.rejected_connections += 1
+            logger.warning(f"Rejected WebSocket connection, limit of {self.max_connections} reached")
+            await ws.close(code=1013, message=b'overloaded')
+            return ws
+            
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+        self.websocket_connections[ws] = queue
+        writer = asyncio.create_task(self._websocket_writer(ws, queue))
+        logger.info(f"WebSocket connection established (total: {len(self.websocket_connections)})")
+        
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    try:
+                        data = orjson.loads(msg.data)
+                        # Handle WebSocket commands if needed
+                        if data.get('command') == 'get_status':
+                            status = await self._get_status_data()
+                            self._enqueue(ws, orjson.dumps({'type': 'status', 'data': status}))
+                    except orjson.JSONDecodeError:
+                        self._enqueue(ws, orjson.dumps({'type': 'error', 'message': 'Invalid JSON'}))
+                elif msg.type == WSMsgType.ERROR:
+                    logger.error(f"WebSocket error: {ws.exception()}")
+                    
+        except Exception as e:
+            logger.error(f"WebSocket handler error: {e}")
+        finally:
+            writer.cancel()
+            self.websocket_connections.pop(ws, None)
+            logger.info(f"WebSocket connection closed (remaining: {len(self.websocket_connections)})")
+            
+        return ws
+        
+    async def _websocket_writer(self, ws: web.WebSocketResponse, queue: asyncio.Queue):
+        """Send a client's queued messages in order until its connection ends."""
+        try:
+            while True:
+                await send_json_payload(ws, await queue.get())
+        except Exception as e:
+            logger.debug(f"WebSocket send failed, closing connection: {e}")
+            await ws.close()
+            
+    def _enqueue(self, ws: web.WebSocketResponse, payload: bytes):
+        """Queue a message for a client, disconnecting the client if its queue is full."""
+        queue = self.websocket_connections.get(ws)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # 1008: policy violation (the client does not keep up)
+            logger.warning("Disconnecting WebSocket client that is not keeping up with updates")
+            del self.websocket_connections[ws]
+            asyncio.create_task(ws.close(code=1008, message=b'too slow'))
+            
+    async def dashboard(self, request: web.Request) -> web.Response:
+        """Serve the dashboard HTML."""
+        status = orjson.dumps(await self._get_status_data())
+        # Keep the status from closing the inline <script> early
+        status = status.replace(b'</', b'<\\/')
+        return web.Response(body=b''.join((DASHBOARD_HEAD, status, DASHBOARD_TAIL)),
+                            headers=DASHBOARD_HEADERS, content_type='text/html', charset='utf-8')
         
     async def health_check(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
-        return web.json_response({
+        return json_response({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'service': 'GLQ Chain Monitoring Service',
             'version': '1.0.0'
         })
         
-    async def _get_status_data(self) -> Dict[str, Any]:
-        """Get status data for internal use."""
-        if self.monitor:
-            return self.monitor.get_status()
+    def _connection_stats(self) -> Dict[str, Any]:
+        """WebSocket connection counts for the status endpoint."""
+        active = len(self.websocket_connections)
         return {
-            'service_status': 'not_initialized',
-            'running': False,
-            'paused': False
+            'active_connections': active,
+            'rejected_connections': self.rejected_connections,
+            'max_connections': self.max_connections,
+            'utilization_percent': round(active / max(self.max_connections, 1) * 100, 2)
         }
         
+    async def _get_status_data(self) -> Dict[str, Any]:
+        """Get the monitor's latest status snapshot.
+        
+        The snapshot is shared, so callers copy it before adding fields.
+        """
+        if self.monitor:
+            return self.monitor.get_snapshot()
+        return NOT_INITIALIZED_STATUS
+        
     async def _run_monitor(self):
         """Run monitor in background task."""
         try:
@@ -634,34 +755,94 @@ class MonitoringService:
         except Exception as e:
             logger.error(f"Monitor task failed: {e}")
             
+    def notify_update(self):
+        """Schedule a status broadcast to the WebSocket clients."""
+        self._status_dirty.set()
+        
     async def broadcast_status(self):
         """Broadcast status updates to all connected WebSocket clients."""
-        if not self.websocket_connections:
+        if not self.websocket_connections and self._redis is None:
             return
             
         try:
             status = await self._get_status_data()
-            message = json.dumps({'type': 'status', 'data': status}, cls=DateTimeEncoder)
+            delta = None if self._last_status is None else status_delta(self._last_status, status)
+            if delta == {}:
+                return
+                
+            # Over Redis the message also reaches other instances' clients, whose
+            # base state did not come from this monitor, so only full status is sent
+            if delta is None or self._redis is not None or self._broadcasts_since_resync >= STATUS_RESYNC_INTERVAL:
+                message = {'type': 'status', 'data': status}
+                self._broadcasts_since_resync = 0
+            else:
+                message = {'type': 'status_delta', 'data': delta}
+                self._broadcasts_since_resync += 1
+            self._last_status = status
+            payload = orjson.dumps(message)
             
-            # Send to all connected clients
-            disconnected = set()
-            for ws in self.websocket_connections:
+            if self._redis is not None:
                 try:
-                    await ws.send_str(message)
-                except Exception:
-                    disconnected.add(ws)
+                    await self._redis.publish(STATUS_CHANNEL, payload)
+                    return
+                except RedisError as e:
+                    logger.warning(f"Could not publish status to Redis, broadcasting locally: {e}")
                     
-            # Remove disconnected clients
-            for ws in disconnected:
-                self.websocket_connections.discard(ws)
+            self._broadcast_local(payload)
                 
         except Exception as e:
             logger.error(f"Error broadcasting status: {e}")
             
+    def _broadcast_local(self, payload: bytes):
+        """Queue an encoded message for every client connected to this instance."""
+        # Each client's writer task sends it, so a slow client only delays itself
+        # until its queue fills and it is disconnected. _enqueue may remove
+        # clients, so a snapshot is iterated
+        for ws in tuple(self.websocket_connections):
+            self._enqueue(ws, payload)
+            
+    async def _connect_redis(self):
+        """Subscribe to STATUS_CHANNEL and start relaying it to the local clients."""
+        if not REDIS_AVAILABLE:
+            logger.warning("monitoring.redis_url is set but redis is not installed, broadcasting locally only")
+            return
+            
+        try:
+            self._redis = aioredis.from_url(self.redis_url)
+            pubsub = self._redis.pubsub()
+            await pubsub.subscribe(STATUS_CHANNEL)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Could not subscribe to Redis at {self.redis_url}, broadcasting locally only: {e}")
+            if self._redis is not None:
+                await self._redis.aclose()
+                self._redis = None
+            return
+            
+        self._redis_task = asyncio.create_task(self._relay_redis(pubsub))
+        logger.info(f"Sharing status broadcasts through Redis channel {STATUS_CHANNEL}")
+        
+    async def _relay_redis(self, pubsub):
+        """Deliver the status messages published by any instance to the local clients."""
+        try:
+            async for message in pubsub.listen():
+                if message['type'] == 'message':
+                    self._broadcast_local(message['data'])
+        except (RedisError, OSError) as e:
+            # Without the relay, published broadcasts would no longer reach local clients
+            logger.error(f"Redis status subscription lost, broadcasting locally only: {e}")
+            redis_client, self._redis = self._redis, None
+            await redis_client.aclose()
+        finally:
+            await pubsub.reset()
+            
     async def start_service(self):
         """Start the monitoring service."""
         logger.info(f"Starting monitoring service on port {self.port}")
         
+        # Share broadcasts with other instances when configured
+        if self.redis_url:
+            await self._connect_redis()
+            
         # Start background task for WebSocket broadcasts
         self._broadcast_task = asyncio.create_task(self._websocket_broadcast_loop())
         
@@ -669,18 +850,22 @@ class MonitoringService:
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
         
-        site = web.TCPSite(self.runner, '0.0.0.0', self.port)
+        # Accept queue sized for a burst of dashboards (re)connecting at once,
+        # e.g. after a restart, rather than the default of 128
+        site = web.TCPSite(self.runner, '0.0.0.0', self.port, backlog=self.max_connections)
         await site.start()
         
         logger.info(f"Monitoring service running on http://localhost:{self.port}")
         logger.info(f"Dashboard available at: http://localhost:{self.port}/dashboard")
         
     async def _websocket_broadcast_loop(self):
-        """Background task to broadcast status updates."""
+        """Background task to broadcast status updates when the monitor reports a change."""
         while True:
             try:
+                await self._status_dirty.wait()
+                self._status_dirty.clear()
                 await self.broadcast_status()
-                await asyncio.sleep(2)  # Broadcast every 2 seconds
+                await asyncio.sleep(BROADCAST_INTERVAL)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -692,13 +877,23 @@ class MonitoringService:
         logger.info("Shutting down monitoring service...")
         
         # Cancel broadcast task
-        if hasattr(self, '_broadcast_task'):
+        if self._broadcast_task is not None:
             self._broadcast_task.cancel()
             try:
                 await self._broadcast_task
             except asyncio.CancelledError:
                 pass
         
+        # Stop relaying broadcasts from Redis
+        if self._redis_task is not None:
+            self._redis_task.cancel()
+            try:
+                await self._redis_task
+            except asyncio.CancelledError:
+                pass
+        if self._redis is not None:
+            await self._redis.aclose()
+            
         # Stop monitor
         if self.monitor:
             await self.monitor.stop_monitoring()
@@ -708,7 +903,7 @@ class MonitoringService:
             await ws.close()
             
         # Cleanup web server
-        if hasattr(self, 'runner'):
+        if self.runner is not None:
             await self.runner.cleanup()
             
         logger.info("Monitoring service shutdown complete")
@@ -745,12 +940,17 @@ async def main():
         await service.start_service()
         logger.info("Service started successfully. Press Ctrl+C to stop.")
         
-        # Keep service running until interrupted
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt")
+        # Keep service running until SIGINT/SIGTERM, without waking while idle
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Windows: Ctrl+C still arrives as KeyboardInterrupt
+                pass
+        await stop.wait()
+        logger.info("Received shutdown signal")
             
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
@@ -760,7 +960,3 @@ async def main():
         logger.info("Starting shutdown...")
         await service.shutdown()
         logger.info("Service stopped")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
@@ -8,7 +8,6 @@ cross-chain comparisons, and unified metrics visualization.
 import asyncio
 import logging
 import time
-import json
 from typing import Optional, Dict, Any, Set, List
 from datetime import datetime, timezone, timedelta
 from dataclasses import asdict
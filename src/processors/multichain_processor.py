@@ -12,7 +12,6 @@ from datetime import datetime, timezone
 import time
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
 
 from rich.console import Console
 from rich.table import Table
@@ -6,15 +6,13 @@ Monitors GLQ Chain for new blocks and processes them immediately.
 import asyncio
 import logging
 import time
-import sys
-from typing import Optional, Dict, Any, Set
-from pathlib import Path
+from typing import Optional, Dict, Any, Set, Callable
 from datetime import datetime, timezone
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Entry points (scripts/start_realtime_monitor.py) put src on sys.path
 
-from core.blockchain_client import BlockchainClient
+from core.blockchain_client import BlockchainClient, full_transactions
+from core.websocket_client import WebSocketBlockchainClient
 from core.influxdb_client import BlockchainInfluxDB
 from core.config import Config
 from analytics.advanced_analytics import AdvancedAnalytics
@@ -31,9 +29,17 @@ logger = logging.getLogger(__name__)
 class RealtimeMonitor:
     """Real-time blockchain monitor for GLQ Chain."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, on_update: Optional[Callable[[], None]] = None):
         self.config = config
-        self.blockchain_client = BlockchainClient(config)
+        
+        # Called whenever the status returned by get_status may have changed
+        self.on_update = on_update
+        
+        # Over a WebSocket the monitor is woken by newHeads instead of polling
+        if config.blockchain_ws_url:
+            self.blockchain_client = WebSocketBlockchainClient(config)
+        else:
+            self.blockchain_client = BlockchainClient(config)
         
         # InfluxDB client
         self.db_client = None
@@ -50,7 +56,7 @@ class RealtimeMonitor:
                     db_client=self.db_client,
                     config=config
                 )
-                # Store analytics performance settings
+                # Store analytics performance settings (read per block, so kept as attributes)
                 self.analytics_max_time = realtime_config.get('max_processing_time', 5.0)
                 self.analytics_skip_on_timeout = realtime_config.get('skip_on_timeout', True)
         
@@ -97,6 +103,9 @@ class RealtimeMonitor:
         self.running = False
         self.paused = False
         
+        # Status as of the last update, refreshed by the monitoring loop
+        self._status_snapshot = self.get_status()
+        
     async def initialize(self) -> bool:
         """Initialize connections and determine starting point."""
         logger.info("Initializing real-time monitor...")
@@ -161,6 +170,7 @@ class RealtimeMonitor:
         logger.info("Starting real-time blockchain monitoring...")
         self.running = True
         self.stats['start_time'] = time.time()
+        self._notify_update()
         
         # Start monitoring with live display
         with Live(self._create_status_table(), refresh_per_second=1, console=console) as live:
@@ -173,9 +183,10 @@ class RealtimeMonitor:
                     
                     # Update display
                     live.update(self._create_status_table())
+                    self._notify_update()
                     
-                    # Wait for next cycle
-                    await asyncio.sleep(self.poll_interval)
+                    # Wait for the next block (at most one poll interval)
+                    await self.blockchain_client.wait_for_new_head(self.poll_interval)
                     
             except KeyboardInterrupt:
                 logger.info("Received shutdown signal...")
@@ -272,6 +283,10 @@ class RealtimeMonitor:
             if self.db_client:
                 self.db_client.write_block(block_data)
             
+            # Fetch the block's receipts in one call, for both analytics and storage
+            transactions = full_transactions(block_data)
+            receipts = await self.blockchain_client.get_block_receipts_by_hash(block_number, transactions)
+            
             # Run advanced analytics on the block if enabled
             if self.analytics:
                 analytics_start = time.time()
@@ -280,15 +295,15 @@ class RealtimeMonitor:
                     ts = datetime.fromtimestamp(int(block_data.get('timestamp', '0x0'), 16), tz=timezone.utc)
                     
                     # Run analytics with timeout if configured
-                    if hasattr(self, 'analytics_max_time') and self.analytics_max_time > 0:
+                    if self.analytics_max_time > 0:
                         # Use asyncio.wait_for for timeout
                         block_results = await asyncio.wait_for(
-                            self.analytics.analyze_block(block_data, ts),
+                            self.analytics.analyze_block(block_data, ts, receipts),
                             timeout=self.analytics_max_time
                         )
                     else:
                         # No timeout
-                        block_results = await self.analytics.analyze_block(block_data, ts)
+                        block_results = await self.analytics.analyze_block(block_data, ts, receipts)
                     
                     # Track analytics processing time
                     analytics_time = time.time() - analytics_start
@@ -311,7 +326,7 @@ class RealtimeMonitor:
                     self.stats['analytics_timeouts'] += 1
                     analytics_time = time.time() - analytics_start
                     logger.warning(f"Analytics timeout for block {block_number} after {analytics_time:.2f}s")
-                    if not getattr(self, 'analytics_skip_on_timeout', True):
+                    if not self.analytics_skip_on_timeout:
                         raise  # Re-raise if we shouldn't skip
                 except Exception as ae:
                     analytics_time = time.time() - analytics_start
@@ -321,21 +336,21 @@ class RealtimeMonitor:
                     logger.debug(f"Advanced analytics failed for block {block_number}: {ae}")
             
             # Process transactions (DB storage and events)
-            transactions = block_data.get('transactions', [])
             for tx in transactions:
-                if isinstance(tx, dict):  # Full transaction object
-                    await self._process_transaction(tx, block_number)
-                    self.stats['transactions_processed'] += 1
+                await self._process_transaction(tx, block_number, receipts.get(tx['hash']))
+                self.stats['transactions_processed'] += 1
             
         except Exception as e:
             logger.error(f"Error processing block {block_number}: {e}")
             raise
             
-    async def _process_transaction(self, tx_data: Dict[str, Any], block_number: int):
+    async def _process_transaction(self, tx_data: Dict[str, Any], block_number: int,
+                                   receipt: Optional[Dict[str, Any]] = None):
         """Process a single transaction."""
         try:
-            # Get transaction receipt for complete data
-            receipt = await self.blockchain_client.get_transaction_receipt(tx_data['hash'])
+            # Get transaction receipt for complete data (unless prefetched)
+            if receipt is None:
+                receipt = await self.blockchain_client.get_transaction_receipt(tx_data['hash'])
             
             gas_used = None
             status = "pending"
@@ -475,21 +490,30 @@ class RealtimeMonitor:
         
         # Close connections
         if self.blockchain_client:
-            self.blockchain_client.close()
+            await self.blockchain_client.aclose()
         if self.db_client:
             self.db_client.close()
             
         logger.info("Real-time monitor stopped")
+        self._notify_update()
         
     def pause_monitoring(self):
         """Pause the monitoring (keep connections alive)."""
         self.paused = True
         logger.info("Monitoring paused")
+        self._notify_update()
         
     def resume_monitoring(self):
         """Resume paused monitoring."""
         self.paused = False
         logger.info("Monitoring resumed")
+        self._notify_update()
+        
+    def _notify_update(self):
+        """Refresh the status snapshot and tell the on_update listener, if any."""
+        self._status_snapshot = self.get_status()
+        if self.on_update:
+            self.on_update()
         
     def get_status(self) -> Dict[str, Any]:
         """Get current monitoring status."""
@@ -502,6 +526,10 @@ class RealtimeMonitor:
             'statistics': self.stats.copy(),
             'uptime': self.stats['uptime']
         }
+        
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get the status as of the last update without rebuilding it (shared; do not modify)."""
+        return self._status_snapshot
 
 
 async def main():
@@ -548,10 +576,3 @@ async def main():
         
     console.print("[bold green]✅ Monitor shutdown complete![/bold green]")
     return True
-
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Goodbye! 👋[/yellow]")
\ No newline at end of file
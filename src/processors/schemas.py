@@ -0,0 +1,162 @@
+"""
+Columnar Schemas for Processed Chain Data
+
+This module defines Arrow schemas for the records produced by the chain
+processors and converts a block's worth of processed rows into a single
+RecordBatch, so bulk consumers can work column-by-column instead of walking
+one dataclass instance per transaction, event or transfer. Batches pickle as
+a few contiguous buffers, which is how decode workers hand blocks back.
+"""
+
+import json
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from .chain_processors import ProcessedTransaction, ProcessedEvent, ProcessedTokenTransfer
+
+
+# uint256 quantities do not fit any Arrow integer type: values and token amounts
+# keep the rows' raw 32-byte big-endian form, fees stay decimal strings. Addresses
+# are already raw 20-byte values on the rows
+TRANSACTION_SCHEMA = pa.schema([
+    pa.field("block_number", pa.uint64(), nullable=False),
+    pa.field("tx_hash", pa.binary(32), nullable=False),
+    pa.field("from_addr", pa.binary(20)),
+    pa.field("to_addr", pa.binary(20)),
+    pa.field("value", pa.binary(32)),
+    pa.field("gas_used", pa.uint64()),
+    pa.field("gas_price", pa.uint64()),
+    pa.field("transaction_fee", pa.string()),
+    pa.field("status", pa.dictionary(pa.int8(), pa.string())),
+    pa.field("transaction_type", pa.dictionary(pa.int8(), pa.string())),
+    pa.field("input_data_size", pa.uint32()),
+    pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+    pa.field("nonce", pa.uint64()),
+    pa.field("transaction_index", pa.uint32()),
+    pa.field("effective_gas_price", pa.uint64()),
+    pa.field("max_fee_per_gas", pa.uint64()),
+    pa.field("max_priority_fee_per_gas", pa.uint64()),
+    pa.field("tx_type_raw", pa.dictionary(pa.int8(), pa.string())),
+    pa.field("is_bridge_tx", pa.bool_()),
+    pa.field("is_l2", pa.bool_()),
+])
+
+EVENT_SCHEMA = pa.schema([
+    pa.field("block_number", pa.uint64(), nullable=False),
+    pa.field("tx_hash", pa.binary(32), nullable=False),
+    pa.field("log_index", pa.uint32(), nullable=False),
+    pa.field("contract_addr", pa.binary(20)),
+    pa.field("event_signature", pa.binary(32)),
+    pa.field("topics", pa.list_(pa.binary(32))),
+    pa.field("data", pa.binary()),
+    pa.field("decoded_data", pa.string()),  # JSON-encoded
+    pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+])
+
+TOKEN_TRANSFER_SCHEMA = pa.schema([
+    pa.field("block_number", pa.uint64(), nullable=False),
+    pa.field("tx_hash", pa.binary(32), nullable=False),
+    pa.field("log_index", pa.uint32(), nullable=False),
+    pa.field("token_addr", pa.binary(20)),
+    pa.field("token_standard", pa.dictionary(pa.int8(), pa.string())),
+    pa.field("from_addr", pa.binary(20)),
+    pa.field("to_addr", pa.binary(20)),
+    pa.field("amount", pa.binary(32)),
+    pa.field("token_id", pa.string()),
+    pa.field("token_symbol", pa.string()),
+    pa.field("token_name", pa.string()),
+    pa.field("token_decimals", pa.uint8()),
+    pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+])
+
+
+def _hex_bytes(value: Optional[str]) -> Optional[bytes]:
+    """Convert a 0x-prefixed hex string to raw bytes (None stays None)"""
+    if not value:
+        return None
+    return bytes.fromhex(value[2:] if value.startswith(("0x", "0X")) else value)
+
+
+def _record_batch(schema: pa.Schema, columns: Sequence[list], chain_id: str) -> pa.RecordBatch:
+    """Build a RecordBatch from per-column Python lists, tagging it with the chain"""
+    arrays = [pa.array(column, type=field.type) for column, field in zip(columns, schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema.with_metadata({"chain_id": chain_id}))
+
+
+def transactions_to_record_batch(chain_id: str, transactions: List["ProcessedTransaction"]) -> pa.RecordBatch:
+    """Convert processed transactions for one chain into a columnar batch"""
+    columns = [[] for _ in TRANSACTION_SCHEMA]
+    (block_number, tx_hash, from_addr, to_addr, value, gas_used, gas_price,
+     transaction_fee, status, transaction_type, input_data_size, timestamp, nonce,
+     transaction_index, effective_gas_price, max_fee_per_gas, max_priority_fee_per_gas,
+     tx_type_raw, is_bridge_tx, is_l2) = columns
+
+    for tx in transactions:
+        block_number.append(tx.block_number)
+        tx_hash.append(_hex_bytes(tx.transaction_hash))
+        from_addr.append(tx.from_address)
+        to_addr.append(tx.to_address)
+        value.append(tx.value)
+        gas_used.append(tx.gas_used)
+        gas_price.append(tx.gas_price)
+        transaction_fee.append(tx.transaction_fee)
+        status.append(tx.status)
+        transaction_type.append(tx.transaction_type)
+        input_data_size.append(tx.input_data_size)
+        timestamp.append(tx.timestamp)
+        nonce.append(tx.nonce)
+        transaction_index.append(tx.transaction_index)
+        effective_gas_price.append(tx.effective_gas_price)
+        max_fee_per_gas.append(tx.max_fee_per_gas)
+        max_priority_fee_per_gas.append(tx.max_priority_fee_per_gas)
+        tx_type_raw.append(tx.tx_type_raw)
+        is_bridge_tx.append(tx.is_bridge_tx)
+        is_l2.append(tx.is_l2)
+
+    return _record_batch(TRANSACTION_SCHEMA, columns, chain_id)
+
+
+def events_to_record_batch(chain_id: str, events: List["ProcessedEvent"]) -> pa.RecordBatch:
+    """Convert processed events for one chain into a columnar batch"""
+    columns = [[] for _ in EVENT_SCHEMA]
+    (block_number, tx_hash, log_index, contract_addr, event_signature,
+     topics, data, decoded_data, timestamp) = columns
+
+    for event in events:
+        block_number.append(event.block_number)
+        tx_hash.append(_hex_bytes(event.transaction_hash))
+        log_index.append(event.log_index)
+        contract_addr.append(event.contract_address or None)
+        event_signature.append(_hex_bytes(event.event_signature))
+        topics.append([_hex_bytes(topic) for topic in event.topics])
+        data.append(_hex_bytes(event.data) or b"")
+        decoded_data.append(json.dumps(event.decoded_data) if event.decoded_data else None)
+        timestamp.append(event.timestamp)
+
+    return _record_batch(EVENT_SCHEMA, columns, chain_id)
+
+
+def token_transfers_to_record_batch(chain_id: str, transfers: List["ProcessedTokenTransfer"]) -> pa.RecordBatch:
+    """Convert processed token transfers for one chain into a columnar batch"""
+    columns = [[] for _ in TOKEN_TRANSFER_SCHEMA]
+    (block_number, tx_hash, log_index, token_addr, token_standard, from_addr, to_addr,
+     amount, token_id, token_symbol, token_name, token_decimals, timestamp) = columns
+
+    for transfer in transfers:
+        block_number.append(transfer.block_number)
+        tx_hash.append(_hex_bytes(transfer.transaction_hash))
+        log_index.append(transfer.log_index)
+        token_addr.append(transfer.token_address)
+        token_standard.append(transfer.token_standard)
+        from_addr.append(transfer.from_address)
+        to_addr.append(transfer.to_address)
+        amount.append(transfer.amount)
+        token_id.append(transfer.token_id)
+        token_symbol.append(transfer.token_symbol)
+        token_name.append(transfer.token_name)
+        token_decimals.append(transfer.token_decimals)
+        timestamp.append(transfer.timestamp)
+
+    return _record_batch(TOKEN_TRANSFER_SCHEMA, columns, chain_id)
@@ -0,0 +1,27 @@
+"""
+Event Signature Registry
+
+Central table of the event signatures (topic0 hashes) the chain processors
+decode, mapped to the processor method that handles them. Processors resolve
+the table once at construction, so identifying an event is a single dict
+lookup however many signatures are registered.
+"""
+
+from typing import Dict, Tuple
+
+# Transfer(address indexed from, address indexed to, uint256 value / uint256 indexed tokenId)
+TRANSFER_SIGNATURE = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+# TransferSingle(address indexed operator, address indexed from, address indexed to, uint256 id, uint256 value)
+TRANSFER_SINGLE_SIGNATURE = "0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62"
+# TransferBatch(address indexed operator, address indexed from, address indexed to, uint256[] ids, uint256[] values)
+TRANSFER_BATCH_SIGNATURE = "0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb"
+
+# Token transfer decoders keyed by (topic0, topic count) -> processor method name.
+# ERC-20 and ERC-721 share the Transfer signature and differ only in whether the
+# third argument is indexed, which the topic count captures
+TRANSFER_DECODERS: Dict[Tuple[str, int], str] = {
+    (TRANSFER_SIGNATURE, 3): "_process_erc20_transfer",
+    (TRANSFER_SIGNATURE, 4): "_process_erc721_transfer",
+    (TRANSFER_SINGLE_SIGNATURE, 4): "_process_erc1155_single_transfer",
+    (TRANSFER_BATCH_SIGNATURE, 4): "_process_erc1155_batch_transfer",
+}
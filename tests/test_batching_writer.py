@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test Batching InfluxDB Writer
+
+Test that the background writer groups queued records into one write per
+measurement, drains its queue on flush and close, and counts the records it
+drops on a full queue or loses in a failed write.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path (core modules use package-relative imports)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.batching_writer import BatchingInfluxWriter, _measurement
+
+
+class RecordingWriteApi:
+    """Write API that records every write as (bucket, records)"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, bucket, org, record, write_precision):
+        self.writes.append((bucket, list(record)))
+
+
+class BlockingWriteApi(RecordingWriteApi):
+    """Write API whose writes wait until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, bucket, org, record, write_precision):
+        self.writing.set()
+        self.release.wait()
+        super().write(bucket, org, record, write_precision)
+
+
+class FailingWriteApi:
+    """Write API whose writes always fail with the given exception"""
+
+    def __init__(self, error=OSError("connection refused")):
+        self.error = error
+
+    def write(self, bucket, org, record, write_precision):
+        raise self.error
+
+
+def test_measurement_is_the_name_before_tags_or_fields():
+    assert _measurement("blocks,chain_id=614 gas_used=1i 1") == "blocks"
+    assert _measurement("events data=\"x\" 1") == "events"
+
+
+def test_close_writes_queued_records_once_per_measurement():
+    write_api = RecordingWriteApi()
+    writer = BatchingInfluxWriter(write_api, "bucket", "org", flush_interval=10.0)
+
+    writer.write_lines(["blocks,chain_id=614 n=1i 1", "events,chain_id=614 n=2i 2"], "test data")
+    writer.write_lines(["blocks,chain_id=614 n=3i 3"], "test data")
+    writer.close()
+
+    assert write_api.writes == [
+        ("bucket", ["blocks,chain_id=614 n=1i 1", "blocks,chain_id=614 n=3i 3"]),
+        ("bucket", ["events,chain_id=614 n=2i 2"]),
+    ]
+    assert writer.lost_records == 0
+
+
+def test_flush_waits_until_queued_records_are_written():
+    write_api = RecordingWriteApi()
+    writer = BatchingInfluxWriter(write_api, "bucket", "org", flush_interval=0.01)
+
+    writer.write_lines([f"blocks n={i}i {i}" for i in range(10)], "test data")
+    writer.flush()
+
+    assert sum(len(records) for _, records in write_api.writes) == 10
+    writer.close()
+
+
+def test_full_queue_drops_and_counts_remaining_records():
+    write_api = BlockingWriteApi()
+    writer = BatchingInfluxWriter(write_api, "bucket", "org", max_batch_size=1,
+                                  queue_size=2, queue_timeout=0.01)
+
+    # The worker holds the first record in a write, so the queue fills after two more
+    writer.write_lines(["blocks n=0i 0"], "test data")
+    assert write_api.writing.wait(5)
+    writer.write_lines([f"blocks n={i}i {i}" for i in range(1, 5)], "test data")
+
+    assert writer.dropped_records == 2
+    write_api.release.set()
+    writer.close()
+    assert [records for _, records in write_api.writes] == [
+        ["blocks n=0i 0"], ["blocks n=1i 1"], ["blocks n=2i 2"]
+    ]
+
+
+def test_failed_write_counts_lost_records():
+    writer = BatchingInfluxWriter(FailingWriteApi(), "bucket", "org", flush_interval=0.01)
+
+    writer.write_lines(["blocks n=1i 1", "events n=2i 2"], "test data")
+    writer.flush()
+
+    assert writer.failed_records == 2
+    assert writer.lost_records == 2
+    writer.close()
+
+
+def test_unexpected_write_error_does_not_stop_the_writer():
+    writer = BatchingInfluxWriter(FailingWriteApi(ValueError("malformed record")), "bucket", "org",
+                                  flush_interval=0.01)
+
+    writer.write_lines(["blocks n=1i 1"], "test data")
+    writer.flush()
+    writer.write_lines(["blocks n=2i 2"], "test data")
+    writer.flush()
+
+    assert writer.failed_records == 2
+    writer.close()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test Chain Processor Decoding
+
+Test that the chain processors decode raw JSON-RPC (hex-encoded) blocks,
+transactions and logs correctly.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from datetime import datetime, timezone
+
+# Add project root to path (processors use package-relative imports)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors.chain_processors import ChainProcessorFactory, _to_int
+from src.processors.signature_registry import TRANSFER_SIGNATURE
+
+TX_HASH = "0x" + "22" * 32
+SENDER = "0x" + "11" * 20
+
+BLOCK = {
+    "number": "0x10",
+    "timestamp": "0x5f5e1000",
+    "gasLimit": "0x1c9c380",
+    "gasUsed": "0x5208",
+    "size": "0x220",
+    "miner": "0x" + "00" * 20,
+    "difficulty": "0x0",
+    "totalDifficulty": "0x10",
+    "baseFeePerGas": "0x7",
+    "transactions": []
+}
+
+TRANSACTION = {
+    "hash": TX_HASH,
+    "from": SENDER,
+    "to": "0x" + "33" * 20,
+    "value": "0xde0b6b3a7640000",  # 1 ether
+    "gasUsed": "0x5208",
+    "gasPrice": "0x3b9aca00",
+    "input": "0xa9059cbb",
+    "nonce": "0x2a",
+    "transactionIndex": "0x3",
+    "status": "0x1"
+}
+
+
+class StubConfig:
+    """Minimal config: no chain overrides, token cache under the test's tmp dir"""
+
+    def __init__(self, token_cache_path: str):
+        self.chains = {}
+        self._token_cache_path = token_cache_path
+
+    def get(self, key, default=None):
+        return self._token_cache_path if key == "performance.token_cache_path" else default
+
+
+class StubClient:
+    """Client whose Multicall3 aggregate always fails (token metadata stays unknown)"""
+
+    async def multicall3(self, chain_id, calls):
+        return None
+
+
+def make_processor(chain_id: str, tmp_path):
+    return ChainProcessorFactory.create_processor(chain_id, StubConfig(str(tmp_path / "tokens.db")), None)
+
+
+def test_to_int_accepts_hex_and_int():
+    assert _to_int("0x10") == 16
+    assert _to_int("0x0") == 0
+    assert _to_int(42) == 42
+    assert _to_int("42") == 42
+
+
+def test_process_block_decodes_hex_quantities(tmp_path):
+    for chain_id in ("ethereum", "polygon", "base", "glq"):
+        processed = asyncio.run(make_processor(chain_id, tmp_path).process_block(BLOCK))
+
+        assert processed["block_number"] == 16
+        assert processed["timestamp"] == datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+        assert processed["gas_limit"] == 30_000_000
+        assert processed["gas_used"] == 21_000
+
+
+def test_process_transaction_decodes_hex_quantities(tmp_path):
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+
+    for chain_id in ("ethereum", "polygon", "base", "glq"):
+        tx = asyncio.run(make_processor(chain_id, tmp_path).process_transaction(TRANSACTION, block_timestamp, 16))
+
+        assert tx.block_number == 16
+        assert tx.timestamp is block_timestamp
+        assert int.from_bytes(tx.value, "big") == 10 ** 18
+        assert tx.gas_used == 21_000
+        assert tx.gas_price == 1_000_000_000
+        assert tx.transaction_type == "contract_call"
+        assert tx.input_data_size == 4
+        assert tx.status == "success"
+        assert tx.nonce == 42
+        assert tx.transaction_index == 3
+        assert tx.max_fee_per_gas is None
+        assert tx.is_l2 == (chain_id == "base")
+
+
+def test_process_events_decodes_log_index(tmp_path):
+    receipt = {"logs": [{
+        "address": SENDER,
+        "topics": ["0x" + "ab" * 32],
+        "data": "0x",
+        "logIndex": "0x1f",
+        "transactionHash": TX_HASH
+    }]}
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+
+    for chain_id in ("ethereum", "polygon", "base", "glq"):
+        events = asyncio.run(make_processor(chain_id, tmp_path).process_events(receipt, block_timestamp, 16))
+
+        assert len(events) == 1
+        assert events[0].log_index == 31
+        assert events[0].block_number == 16
+
+
+def test_process_token_transfers_skips_malformed_events(tmp_path):
+    def transfer_log(log_index, data):
+        return {
+            "address": "0x" + "44" * 20,
+            "topics": [TRANSFER_SIGNATURE, "0x" + "00" * 12 + "11" * 20, "0x" + "00" * 12 + "55" * 20],
+            "data": data,
+            "logIndex": hex(log_index),
+            "transactionHash": TX_HASH
+        }
+
+    receipt = {"logs": [transfer_log(0, "0x" + "00" * 31 + "05"), transfer_log(1, "0xzz"), transfer_log(2, "0x07")]}
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+    processor = make_processor("ethereum", tmp_path)
+    processor.client = StubClient()
+
+    events = asyncio.run(processor.process_events(receipt, block_timestamp, 16))
+    transfers = asyncio.run(processor.process_token_transfers(events))
+
+    assert [transfer.log_index for transfer in transfers] == [0, 2]
+    assert [int.from_bytes(transfer.amount, "big") for transfer in transfers] == [5, 7]
+    assert transfers[0].from_address == bytes.fromhex("11" * 20)
+
+
+def test_process_block_full_matches_separate_passes(tmp_path):
+    receipt = {"logs": [{
+        "address": "0x" + "44" * 20,
+        "topics": [TRANSFER_SIGNATURE, "0x" + "00" * 12 + "11" * 20, "0x" + "00" * 12 + "55" * 20],
+        "data": "0x" + "00" * 31 + "09",
+        "logIndex": "0x4",
+        "transactionHash": TX_HASH
+    }]}
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+    processor = make_processor("ethereum", tmp_path)
+    processor.client = StubClient()
+
+    transactions, events, transfers = asyncio.run(
+        processor.process_block_full([TRANSACTION], [receipt], block_timestamp, 16)
+    )
+
+    assert [tx.transaction_hash for tx in transactions] == [TX_HASH]
+    assert events == asyncio.run(processor.process_events(receipt, block_timestamp, 16))
+    assert transfers == asyncio.run(processor.process_token_transfers(events))
+    assert int.from_bytes(transfers[0].amount, "big") == 9
+
+
+def test_process_block_batches_are_columnar(tmp_path):
+    receipt = {"logs": [{
+        "address": "0x" + "44" * 20,
+        "topics": [TRANSFER_SIGNATURE, "0x" + "00" * 12 + "11" * 20, "0x" + "00" * 12 + "55" * 20],
+        "data": "0x" + "00" * 31 + "09",
+        "logIndex": "0x4",
+        "transactionHash": TX_HASH
+    }, {
+        "address": SENDER,
+        "topics": ["0x" + "ab" * 32],
+        "data": "0x",
+        "logIndex": "0x5",
+        "transactionHash": TX_HASH
+    }]}
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+    processor = make_processor("ethereum", tmp_path)
+    processor.client = StubClient()
+
+    tx_batch, event_batch, transfer_batch = asyncio.run(
+        processor.process_block_batches([TRANSACTION], [receipt], block_timestamp, 16)
+    )
+
+    assert tx_batch.schema.metadata[b"chain_id"] == b"ethereum"
+    assert tx_batch.column("tx_hash").to_pylist() == [bytes.fromhex("22" * 32)]
+    assert tx_batch.column("nonce").to_pylist() == [42]
+    assert event_batch.column("log_index").to_pylist() == [4, 5]
+    assert [int.from_bytes(amount, "big") for amount in transfer_batch.column("amount").to_pylist()] == [9]
+
+    # Pool workers return the same batches, with only the transfer events as rows
+    decoded_tx_batch, decoded_event_batch, transfer_events = asyncio.run(
+        processor.decode_block_batches([TRANSACTION], [receipt], block_timestamp, 16)
+    )
+    assert decoded_tx_batch.equals(tx_batch)
+    assert decoded_event_batch.equals(event_batch)
+    assert [event.log_index for event in transfer_events] == [4]
+
+
+def test_process_block_batches_of_empty_block(tmp_path):
+    block_timestamp = datetime.fromtimestamp(0x5f5e1000, timezone.utc)
+
+    batches = asyncio.run(make_processor("glq", tmp_path).process_block_batches([], [], block_timestamp, 16))
+
+    assert [batch.num_rows for batch in batches] == [0, 0, 0]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test Block Checkpoint
+
+Test that the resume checkpoint reads back the last complete block number
+from the file's tail and ignores a last line torn by an interrupted append.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path (core modules use package-relative imports)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.checkpoint import BlockCheckpoint
+
+
+def test_missing_checkpoint_reads_none(tmp_path):
+    assert BlockCheckpoint(tmp_path / "checkpoint.log").read() is None
+
+
+def test_read_returns_last_written_block(tmp_path):
+    checkpoint = BlockCheckpoint(tmp_path / "logs" / "checkpoint.log")
+
+    for block_number in range(1000, 1100):
+        checkpoint.write(block_number)
+
+    assert checkpoint.read() == 1099
+
+
+def test_read_ignores_torn_last_line(tmp_path):
+    checkpoint = BlockCheckpoint(tmp_path / "checkpoint.log")
+    checkpoint.write(10)
+    checkpoint.write(11)
+
+    with open(checkpoint.path, "a") as f:
+        f.write("12")
+
+    assert checkpoint.read() == 11
+
+
+def test_read_ignores_lone_torn_line(tmp_path):
+    path = tmp_path / "checkpoint.log"
+    path.write_text("7")
+
+    assert BlockCheckpoint(path).read() is None
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test Monitoring Service Status Deltas
+
+Test that status broadcasts only carry the fields that changed, comparing
+nested dicts key by key.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to Python path (the service imports core as a top-level package)
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.monitoring_service import status_delta
+
+STATUS = {
+    "running": True,
+    "last_processed_block": 100,
+    "statistics": {"blocks_processed": 10, "errors": 0, "rate": {"blocks_per_second": 2.0}},
+}
+
+
+def test_unchanged_status_has_empty_delta():
+    assert status_delta(STATUS, dict(STATUS)) == {}
+
+
+def test_changed_top_level_fields_are_included():
+    status = dict(STATUS, last_processed_block=101, paused=False)
+
+    assert status_delta(STATUS, status) == {"last_processed_block": 101, "paused": False}
+
+
+def test_nested_dict_carries_only_changed_keys():
+    status = dict(STATUS, statistics=dict(STATUS["statistics"], blocks_processed=11))
+
+    assert status_delta(STATUS, status) == {"statistics": {"blocks_processed": 11}}
+
+
+def test_deeper_nesting_is_sent_whole():
+    status = dict(STATUS, statistics=dict(STATUS["statistics"], rate={"blocks_per_second": 3.0}))
+
+    assert status_delta(STATUS, status) == {"statistics": {"rate": {"blocks_per_second": 3.0}}}
+
+
+def test_value_replacing_a_dict_is_sent_whole():
+    assert status_delta(STATUS, dict(STATUS, statistics=None)) == {"statistics": None}
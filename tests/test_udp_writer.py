@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test UDP Line-Protocol Writer
+
+Test that records are sent with nanosecond timestamps and packed into
+datagrams no larger than the configured size.
+"""
+
+import socket
+import sys
+from pathlib import Path
+
+from influxdb_client import WritePrecision
+
+# Add project root to path (core modules use package-relative imports)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.udp_writer import UdpLineProtocolWriteApi
+
+
+def receive_datagrams(receiver: socket.socket) -> list:
+    datagrams = []
+    try:
+        while True:
+            datagrams.append(receiver.recv(65535))
+    except socket.timeout:
+        return datagrams
+
+
+def make_pair(max_datagram_size: int):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(0.2)
+    write_api = UdpLineProtocolWriteApi("127.0.0.1", receiver.getsockname()[1], max_datagram_size)
+    return receiver, write_api
+
+
+def test_timestamps_are_scaled_to_nanoseconds():
+    receiver, write_api = make_pair(1400)
+    try:
+        write_api.write("bucket", "org", ["blocks n=1i 1700000000"], WritePrecision.S)
+        write_api.write("bucket", "org", ["blocks n=2i 1700000000000"], WritePrecision.MS)
+        write_api.write("bucket", "org", ["blocks n=3i 1700000000000000000"])
+
+        assert receive_datagrams(receiver) == [
+            b"blocks n=1i 1700000000000000000",
+            b"blocks n=2i 1700000000000000000",
+            b"blocks n=3i 1700000000000000000",
+        ]
+    finally:
+        write_api.close()
+        receiver.close()
+
+
+def test_records_are_packed_into_bounded_datagrams():
+    records = [f"events,topic0=0x{i:02x} n={i}i {i}" for i in range(20)]
+    receiver, write_api = make_pair(100)
+    try:
+        write_api.write("bucket", "org", records)
+        datagrams = receive_datagrams(receiver)
+    finally:
+        write_api.close()
+        receiver.close()
+
+    assert len(datagrams) > 1
+    assert all(len(datagram) <= 100 for datagram in datagrams)
+    assert b"\n".join(datagrams).decode().split("\n") == records